@@ -9,20 +9,11 @@ from app.models.schemas import (
     SearchRequest,
     SearchResponse,
 )
-from app.services.core.search_service import SearchService
+from app.services.core.search_service import get_search_service
 from app.services.data.car_data_service import car_data_service
 from app.utils.core.logger import logger
 
 router = APIRouter()
-search_service = None
-
-
-def get_search_service():
-    """懒加载搜索服务，避免reload时重复初始化"""
-    global search_service
-    if search_service is None:
-        search_service = SearchService()
-    return search_service
 
 
 def get_client_ip(request: Request) -> str:
@@ -3,6 +3,7 @@
 车源 DAO - 处理车源相关的数据库操作
 """
 
+import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -20,6 +21,9 @@ from app.utils.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 从价格/里程文本中提取数字
+_NUMBER_RE = re.compile(r"[\d,]+")
+
 
 class CarDAO(BaseDAO[CarListingDB]):
     """
@@ -355,13 +359,11 @@ class CarDAO(BaseDAO[CarListingDB]):
 
     def _parse_car_listing(self, car_listing: CarListing) -> Dict[str, Any]:
         """解析车源信息，提取结构化数据"""
-        import re
-
         # 解析价格
         price = 0.0
         if car_listing.price:
-            price_match = re.search(
-                r"[\d,]+", car_listing.price.replace(",", "")
+            price_match = _NUMBER_RE.search(
+                car_listing.price.replace(",", "")
             )
             if price_match:
                 price = float(price_match.group().replace(",", ""))
@@ -369,8 +371,8 @@ class CarDAO(BaseDAO[CarListingDB]):
         # 解析里程
         mileage = 0
         if car_listing.mileage:
-            mileage_match = re.search(
-                r"[\d,]+", car_listing.mileage.replace(",", "")
+            mileage_match = _NUMBER_RE.search(
+                car_listing.mileage.replace(",", "")
             )
             if mileage_match:
                 mileage = int(mileage_match.group().replace(",", ""))
@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List
@@ -17,6 +18,9 @@ from app.utils.business.car_selection_utils import CarSelectionUtils
 from app.utils.business.profile_utils import generate_daily_profile_name
 from app.utils.core.logger import logger
 
+# 标题去重时移除的特殊字符
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
 
 class PlatformType(Enum):
     """支持的平台类型"""
@@ -289,10 +293,8 @@ class MultiPlatformCarAggregator:
 
     def _normalize_title(self, title: str) -> str:
         """标准化标题用于去重比较"""
-        import re
-
         # 移除特殊字符，转换为小写
-        normalized = re.sub(r"[^\w\s]", "", title.lower())
+        normalized = _NON_WORD_RE.sub("", title.lower())
 
         # 移除多余空格
         normalized = " ".join(normalized.split())
@@ -363,3 +365,10 @@ class MultiPlatformCarAggregator:
     def disable_platform(self, platform_type: PlatformType) -> bool:
         """禁用平台"""
         return self.update_platform_config(platform_type, enabled=False)
+
+    async def aclose(self) -> None:
+        """关闭已创建的平台适配器，释放其浏览器和HTTP资源"""
+        adapter = self.platform_adapters.get(PlatformType.CARGURUS)
+        if adapter is not None:
+            self.platform_adapters[PlatformType.CARGURUS] = None
+            await adapter.aclose()
@@ -9,7 +9,7 @@ from app.models.schemas import (
     ConversationResponse,
     ParsedQuery,
 )
-from app.services.external.ai.gemini_service import GeminiService
+from app.services.external.ai.gemini_service import get_gemini_service
 from app.utils.core.logger import logger
 
 
@@ -18,7 +18,7 @@ class ConversationService:
         # 关键部位日志：服务初始化
         logger.log_result("对话服务初始化", "开始初始化AI对话服务")
 
-        self.gemini_service = GeminiService()
+        self.gemini_service = get_gemini_service()
         # 存储会话状态（生产环境应使用Redis等持久化存储）
         self.sessions: Dict[str, List[ConversationMessage]] = {}
 
@@ -1,10 +1,14 @@
 import asyncio
 import uuid
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from app.models.schemas import CarListing, ParsedQuery, SearchRequest
-from app.services.core.search_service import SearchService
+from app.services.core.search_service import (
+    SearchService,
+    get_search_service,
+)
 from app.utils.core.logger import logger
 from app.utils.websocket import connection_manager, realtime_broadcaster
 
@@ -13,9 +17,13 @@ class RealtimeService:
     """实时数据推送服务"""
 
     def __init__(self):
-        self.search_service = SearchService()
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
 
+    @cached_property
+    def search_service(self) -> SearchService:
+        """与HTTP接口共享同一个搜索服务，首次使用时创建"""
+        return get_search_service()
+
     async def start_realtime_search(
         self, request: SearchRequest, client_ip: str, task_id: str = None
     ) -> str:
@@ -146,9 +154,6 @@ class RealtimeService:
     ) -> ParsedQuery:
         """解析查询并更新进度"""
         try:
-            # 模拟解析过程
-            await asyncio.sleep(0.5)  # 模拟处理时间
-
             # 广播进度更新
             await realtime_broadcaster.broadcast_progress_update(
                 task_id, 20.0, "查询解析完成", current_step="parsing_completed"
@@ -172,9 +177,6 @@ class RealtimeService:
     ) -> List[CarListing]:
         """搜索车源并更新进度"""
         try:
-            # 模拟搜索过程
-            await asyncio.sleep(1.0)  # 模拟处理时间
-
             # 广播进度更新
             await realtime_broadcaster.broadcast_progress_update(
                 task_id,
@@ -183,8 +185,6 @@ class RealtimeService:
                 current_step="searching_cargurus",
             )
 
-            await asyncio.sleep(0.5)
-
             await realtime_broadcaster.broadcast_progress_update(
                 task_id,
                 60.0,
@@ -192,8 +192,6 @@ class RealtimeService:
                 current_step="searching_kijiji",
             )
 
-            await asyncio.sleep(0.5)
-
             await realtime_broadcaster.broadcast_progress_update(
                 task_id,
                 70.0,
@@ -233,9 +231,6 @@ class RealtimeService:
     ) -> List[CarListing]:
         """分析结果并更新进度"""
         try:
-            # 模拟分析过程
-            await asyncio.sleep(0.5)  # 模拟处理时间
-
             # 广播进度更新
             await realtime_broadcaster.broadcast_progress_update(
                 task_id,
@@ -244,8 +239,6 @@ class RealtimeService:
                 current_step="calculating_scores",
             )
 
-            await asyncio.sleep(0.3)
-
             await realtime_broadcaster.broadcast_progress_update(
                 task_id,
                 90.0,
@@ -1,4 +1,9 @@
+import time
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
 from app.models.schemas import (
+    CarListing,
     ConversationRequest,
     ConversationResponse,
     ParsedQuery,
@@ -8,12 +13,14 @@ from app.models.schemas import (
 from app.services.aggregation.multi_platform_car_aggregator import (
     MultiPlatformCarAggregator,
 )
-from app.services.core.conversation_service import ConversationService
 from app.services.data.car_storage_service import CarStorageService
 from app.services.data.database_car_recommendation_service import (
     DatabaseCarRecommendationService,
 )
-from app.services.external.ai.gemini_service import GeminiService
+from app.services.external.ai.gemini_service import (
+    GeminiService,
+    get_gemini_service,
+)
 from app.services.external.crawler.cargurus_crawler_coordinator import (
     CargurusCrawlerCoordinator,
 )
@@ -21,40 +28,182 @@ from app.services.external.location.ip_to_zip_service import ip_to_zip_service
 from app.utils.business.profile_utils import generate_daily_profile_name
 
 # from app.services.mcp_supabase_service import DatabaseManager  # 已移除
-from app.utils.core.logger import logger
-
+from app.utils.core.logger import annotate, logger, traced
+
+# AI解析结果和爬虫结果的缓存时间（秒）及容量
+_QUERY_CACHE_TTL = 300
+_QUERY_CACHE_MAXSIZE = 1024
+# 对话中同一会话重复搜索相同条件时复用上次结果的有效时间（秒）
+_SESSION_SEARCH_TTL = 180
+
+# 预先构建并校验过的响应模板，返回时只用 model_copy 替换变化的字段
+_EMPTY_SEARCH_RESPONSE = SearchResponse(
+    success=True,
+    cars=[],
+    total_count=0,
+    message="未找到匹配的车源，请尝试其他搜索条件",
+)
+_FAILED_SEARCH_RESPONSE = SearchResponse(
+    success=False, cars=[], total_count=0, message="搜索失败"
+)
 
-class SearchService:
-    def __init__(self):
-        # 关键部位日志：服务初始化
-        logger.log_result("搜索服务初始化", "开始初始化AI解析、对话和爬虫服务")
 
-        logger.log_result("初始化步骤1", "初始化GeminiService")
-        self.gemini_service = GeminiService()
+def _search_response(
+    cars: Optional[List[CarListing]] = None,
+    message: Optional[str] = None,
+    error: Optional[str] = None,
+) -> SearchResponse:
+    """
+    基于响应模板构建搜索响应，只替换变化的字段，不重新校验
+
+    Args:
+        cars: 车源列表，为空时返回“未找到”响应
+        message: 自定义提示信息（可选）
+        error: 错误信息，提供时返回失败响应
+    """
+    if error is not None:
+        update = {"error": error}
+        if message:
+            update["message"] = message
+        return _FAILED_SEARCH_RESPONSE.model_copy(update=update)
+    if not cars:
+        # model_copy 是浅拷贝，换成新列表，避免各响应共享模板的 cars
+        return _EMPTY_SEARCH_RESPONSE.model_copy(update={"cars": []})
+    return _EMPTY_SEARCH_RESPONSE.model_copy(
+        update={
+            "cars": cars,
+            "message": message or f"找到 {len(cars)} 辆车源",
+            "total_count": len(cars),
+        }
+    )
+
+
+# 各依赖服务的进程级单例，首次使用时才创建；
+# 只走单一接口的请求不必为其他服务付出初始化开销
+@lru_cache(maxsize=1)
+def _multi_platform_aggregator() -> MultiPlatformCarAggregator:
+    logger.log_result("延迟初始化", "初始化MultiPlatformCarAggregator")
+    return MultiPlatformCarAggregator()
+
+
+@lru_cache(maxsize=1)
+def _car_storage_service() -> CarStorageService:
+    logger.log_result("延迟初始化", "初始化CarStorageService")
+    return CarStorageService()
+
+
+@lru_cache(maxsize=1)
+def _db_recommendation_service() -> DatabaseCarRecommendationService:
+    logger.log_result("延迟初始化", "初始化DatabaseCarRecommendationService")
+    return DatabaseCarRecommendationService()
 
-        logger.log_result("初始化步骤2", "初始化ConversationService")
-        self.conversation_service = ConversationService()
 
-        # 初始化多平台聚合器
-        logger.log_result("初始化步骤3", "初始化MultiPlatformCarAggregator")
-        self.multi_platform_aggregator = MultiPlatformCarAggregator()
+class SearchService:
+    def __init__(self):
+        # 关键部位日志：服务初始化，依赖服务在首次使用时创建
+        logger.log_result("搜索服务初始化", "依赖服务将在首次使用时创建")
 
         # 延迟初始化 CarGurusCrawler，因为需要动态参数
-        logger.log_result("初始化步骤4", "设置延迟初始化标志")
         self._cargurus_crawler = None
 
-        # 初始化数据库相关服务
-        logger.log_result("初始化步骤5", "初始化数据库服务")
-
-        logger.log_result("初始化步骤6", "初始化CarStorageService")
-        self.car_storage_service = CarStorageService()
-
-        logger.log_result(
-            "初始化步骤7", "初始化DatabaseCarRecommendationService"
+        # 查询文本 -> AI解析结果、解析结果 -> 爬虫车源 的内存缓存，
+        # 值为 (过期时间, 结果)，重复查询在有效期内不再调用Gemini和爬虫
+        self._parse_cache: Dict[str, Tuple[float, ParsedQuery]] = {}
+        self._search_cache: Dict[str, Tuple[float, List[CarListing]]] = {}
+        # 会话ID -> (过期时间, (搜索条件JSON, 车源))，对话中条件未变时不重复爬取
+        self._session_search_cache: Dict[
+            str, Tuple[float, Tuple[str, List[CarListing]]]
+        ] = {}
+
+    @property
+    def gemini_service(self) -> GeminiService:
+        """AI解析服务 - 与对话服务共享同一实例"""
+        return get_gemini_service()
+
+    @property
+    def multi_platform_aggregator(self) -> MultiPlatformCarAggregator:
+        """多平台聚合器 - 只有多平台搜索会用到"""
+        return _multi_platform_aggregator()
+
+    @property
+    def car_storage_service(self) -> CarStorageService:
+        """车源存储服务 - 只有数据库搜索会用到"""
+        return _car_storage_service()
+
+    @property
+    def db_recommendation_service(self) -> DatabaseCarRecommendationService:
+        """数据库推荐服务 - 只有数据库搜索会用到"""
+        return _db_recommendation_service()
+
+    @cached_property
+    def conversation_service(self):
+        """对话服务 - 只有对话接口会用到，首次使用时再创建"""
+        from app.services.core.conversation_service import (
+            ConversationService,
         )
-        self.db_recommendation_service = DatabaseCarRecommendationService()
 
-        logger.log_result("搜索服务初始化完成", "所有组件已就绪")
+        logger.log_result("延迟初始化", "初始化ConversationService")
+        return ConversationService()
+
+    def _cache_get(self, cache: Dict[str, Tuple[float, Any]], key: str):
+        """读取未过期的缓存值，不存在或已过期返回None"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            cache.pop(key, None)
+            return None
+        return value
+
+    def _cache_set(
+        self,
+        cache: Dict[str, Tuple[float, Any]],
+        key: str,
+        value: Any,
+        ttl: float = _QUERY_CACHE_TTL,
+    ) -> None:
+        """写入缓存，超出容量时淘汰最早写入的条目"""
+        cache.pop(key, None)
+        cache[key] = (time.monotonic() + ttl, value)
+        while len(cache) > _QUERY_CACHE_MAXSIZE:
+            cache.pop(next(iter(cache)))
+
+    async def _parse_query(self, query: str) -> ParsedQuery:
+        """AI解析用户查询，相同查询文本在缓存有效期内直接复用解析结果"""
+        key = query.strip().lower()
+        cached = self._cache_get(self._parse_cache, key)
+        if cached is not None:
+            # 调用方可能修改解析结果（如补充位置），返回副本
+            return cached.model_copy(deep=True)
+
+        parsed_query = await self.gemini_service.parse_user_query(query)
+        # 解析失败时返回的默认结果没有品牌，不缓存
+        if parsed_query.make:
+            self._cache_set(
+                self._parse_cache, key, parsed_query.model_copy(deep=True)
+            )
+        return parsed_query
+
+    async def _crawl_cars(
+        self, crawler: CargurusCrawlerCoordinator, parsed_query: ParsedQuery
+    ) -> List[CarListing]:
+        """使用爬虫搜索车源，相同查询条件在缓存有效期内直接复用结果"""
+        key = parsed_query.model_dump_json()
+        cached = self._cache_get(self._search_cache, key)
+        if cached is not None:
+            logger.log_result("命中搜索缓存", "找到%s辆车源", len(cached))
+            # 调用方会修改车源对象（如补充平台信息），返回副本
+            return [car.model_copy() for car in cached]
+
+        cars = await crawler.search_cars(parsed_query)
+        # 空结果可能是页面被拦截等临时问题，不缓存；
+        # 缓存副本，调用方对返回车源的修改不影响缓存
+        if cars:
+            self._cache_set(
+                self._search_cache, key, [car.model_copy() for car in cars]
+            )
+        return cars
 
     async def _get_zip_from_ip(self, ip_address: str) -> str:
         """
@@ -70,14 +219,17 @@ class SearchService:
             zip_code = await ip_to_zip_service.get_zip_from_ip(ip_address)
             if zip_code:
                 logger.log_result(
-                    "IP转ZIP成功", f"IP {ip_address} -> ZIP {zip_code}"
+                    "IP转ZIP成功",
+                    "IP %s -> ZIP %s",
+                    ip_address,
+                    zip_code,
                 )
                 return zip_code
             else:
                 logger.log_result("IP转ZIP失败", "使用默认ZIP码: M5V")
                 return "M5V"  # 默认多伦多ZIP码
         except Exception as e:
-            logger.log_result("IP转ZIP异常", f"错误: {e}, 使用默认ZIP码: M5V")
+            logger.log_result("IP转ZIP异常", "错误: %s, 使用默认ZIP码: M5V", e)
             return "M5V"
 
     def _get_cargurus_crawler(
@@ -98,6 +250,15 @@ class SearchService:
             )
         return self._cargurus_crawler
 
+    async def aclose(self) -> None:
+        """关闭复用的爬虫协调器，释放常驻Chrome驱动和HTTP客户端"""
+        if self._cargurus_crawler is not None:
+            crawler, self._cargurus_crawler = self._cargurus_crawler, None
+            await crawler.aclose()
+        # 聚合器尚未创建时无需关闭，避免为关闭而创建
+        if _multi_platform_aggregator.cache_info().currsize:
+            await _multi_platform_aggregator().aclose()
+
     def _validate_search_parameters(self, parsed_query: ParsedQuery) -> dict:
         """
         验证搜索参数是否足够进行搜索
@@ -134,75 +295,47 @@ class SearchService:
 
         return {"valid": True, "message": "参数验证通过"}
 
+    @traced("车源搜索")
     async def search_cars(
         self, request: SearchRequest, user_ip: str = None
     ) -> SearchResponse:
         """
         执行车源搜索的主要服务方法
         """
-        # 关键部位日志：主要业务函数入口
-        logger.log_result("开始车源搜索流程", f"用户查询: {request.query}")
+        # 各阶段结果通过 annotate 记录，由 traced 在结束时合并为一条日志
+        annotate(query=request.query)
 
         try:
             # 关键部位日志：外部调用 - AI解析
-            parsed_query = await self.gemini_service.parse_user_query(
-                request.query
-            )
-            logger.log_result(
-                "AI解析成功",
-                f"品牌={parsed_query.make}, " f"车型={parsed_query.model}",
-            )
+            parsed_query = await self._parse_query(request.query)
+            annotate(make=parsed_query.make, model=parsed_query.model)
 
             # 参数验证：检查是否有足够的搜索条件
             validation_result = self._validate_search_parameters(parsed_query)
             if not validation_result["valid"]:
-                logger.log_result("参数验证失败", validation_result["message"])
-                return SearchResponse(
-                    success=False, error=validation_result["message"]
-                )
+                annotate(outcome="invalid", error=validation_result["message"])
+                return _search_response(error=validation_result["message"])
 
             # 确定搜索位置：优先使用用户输入的位置，其次使用IP获取的ZIP码
             search_location = parsed_query.location
             if not search_location and user_ip:
                 search_location = await self._get_zip_from_ip(user_ip)
-                logger.log_result(
-                    "使用IP获取的位置", f"ZIP码: {search_location}"
-                )
             elif not search_location:
                 search_location = "M5V"  # 默认多伦多
-                logger.log_result("使用默认位置", f"ZIP码: {search_location}")
+            annotate(location=search_location)
 
             # 关键部位日志：外部调用 - 爬虫搜索
             crawler = self._get_cargurus_crawler(
                 make_name=parsed_query.make, zip_code=search_location
             )
-            cars = await crawler.search_cars(parsed_query)
-            logger.log_result("爬虫搜索完成", f"找到{len(cars)}辆车源")
+            cars = await self._crawl_cars(crawler, parsed_query)
+            annotate(outcome="ok", results=len(cars))
 
-            # 关键部位日志：状态变化 - 返回结果
-            if cars:
-                logger.log_result("搜索流程完成", f"成功返回{len(cars)}条结果")
-                return SearchResponse(
-                    success=True,
-                    data=cars,
-                    message=f"找到 {len(cars)} 辆车源",
-                    total_count=len(cars),
-                )
-            else:
-                logger.log_result("搜索流程完成", "未找到匹配的车源")
-                return SearchResponse(
-                    success=True,
-                    data=[],
-                    message="未找到匹配的车源，请尝试其他搜索条件",
-                    total_count=0,
-                )
+            return _search_response(cars)
 
         except Exception as e:
-            # 关键部位日志：错误处理
-            logger.log_result("搜索流程失败", f"错误: {str(e)}")
-            return SearchResponse(
-                success=False, error=f"搜索过程中发生错误: {str(e)}"
-            )
+            annotate(outcome="error", error=str(e))
+            return _search_response(error=f"搜索过程中发生错误: {str(e)}")
 
     async def search_cars_multi_platform(
         self, request: SearchRequest, user_ip: str = None
@@ -210,16 +343,16 @@ class SearchService:
         """
         多平台车源搜索 - 从多个平台聚合最优车源
         """
-        logger.log_result("开始多平台车源搜索", f"用户查询: {request.query}")
+        logger.log_result("开始多平台车源搜索", "用户查询: %s", request.query)
 
         try:
             # AI解析用户查询
-            parsed_query = await self.gemini_service.parse_user_query(
-                request.query
-            )
+            parsed_query = await self._parse_query(request.query)
             logger.log_result(
                 "AI解析成功",
-                f"品牌={parsed_query.make}, " f"车型={parsed_query.model}",
+                "品牌=%s, 车型=%s",
+                parsed_query.make,
+                parsed_query.model,
             )
 
             # 确定搜索位置：优先使用用户输入的位置，其次使用IP获取的ZIP码
@@ -227,43 +360,30 @@ class SearchService:
                 parsed_query.location = await self._get_zip_from_ip(user_ip)
                 logger.log_result(
                     "多平台搜索使用IP获取的位置",
-                    f"ZIP码: {parsed_query.location}",
+                    "ZIP码: %s",
+                    parsed_query.location,
                 )
 
             # 多平台并行搜索
             cars = await self.multi_platform_aggregator.search_cars_multi_platform(
                 parsed_query, max_total_results=20
             )
-            logger.log_result("多平台搜索完成", f"聚合了{len(cars)}辆最优车源")
+            logger.log_result("多平台搜索完成", "聚合了%s辆最优车源", len(cars))
 
             # 返回结果
             if cars:
-                logger.log_result(
-                    "多平台搜索流程完成", f"成功返回{len(cars)}条结果"
-                )
-                return SearchResponse(
-                    success=True,
-                    data=cars,
-                    message=f"从多个平台找到 {len(cars)} 辆最优车源",
-                    total_count=len(cars),
+                logger.log_result("多平台搜索流程完成", "成功返回%s条结果", len(cars))
+                return _search_response(
+                    cars, f"从多个平台找到 {len(cars)} 辆最优车源"
                 )
             else:
                 logger.log_result("多平台搜索流程完成", "未找到匹配的车源")
-                return SearchResponse(
-                    success=True,
-                    data=[],
-                    message="未找到匹配的车源，请尝试其他搜索条件",
-                    total_count=0,
-                )
+                return _search_response()
 
         except Exception as e:
-            logger.log_result("多平台搜索失败", f"多平台搜索时出错: {e}")
-            return SearchResponse(
-                success=False,
-                data=[],
-                message=f"多平台搜索失败: {str(e)}",
-                total_count=0,
-            )
+            logger.log_result("多平台搜索失败", "多平台搜索时出错: %s", e)
+            message = f"多平台搜索失败: {str(e)}"
+            return _search_response(message=message, error=message)
 
     async def search_cars_with_database_storage(
         self, request: SearchRequest, user_ip: str = None
@@ -271,16 +391,16 @@ class SearchService:
         """
         带数据库存储的车源搜索 - 先爬取数据存储到数据库，再从数据库推荐
         """
-        logger.log_result("开始数据库存储搜索", f"用户查询: {request.query}")
+        logger.log_result("开始数据库存储搜索", "用户查询: %s", request.query)
 
         try:
             # 1. AI解析用户查询
-            parsed_query = await self.gemini_service.parse_user_query(
-                request.query
-            )
+            parsed_query = await self._parse_query(request.query)
             logger.log_result(
                 "AI解析成功",
-                f"品牌={parsed_query.make}, " f"车型={parsed_query.model}",
+                "品牌=%s, 车型=%s",
+                parsed_query.make,
+                parsed_query.model,
             )
 
             # 确定搜索位置：优先使用用户输入的位置，其次使用IP获取的ZIP码
@@ -288,7 +408,8 @@ class SearchService:
                 parsed_query.location = await self._get_zip_from_ip(user_ip)
                 logger.log_result(
                     "数据库搜索使用IP获取的位置",
-                    f"ZIP码: {parsed_query.location}",
+                    "ZIP码: %s",
+                    parsed_query.location,
                 )
 
             # 2. 从数据库获取推荐车源
@@ -299,13 +420,12 @@ class SearchService:
             if recommended_cars:
                 logger.log_result(
                     "数据库推荐完成",
-                    f"从数据库推荐了{len(recommended_cars)}辆车源",
+                    "从数据库推荐了%s辆车源",
+                    len(recommended_cars),
                 )
-                return SearchResponse(
-                    success=True,
-                    data=recommended_cars,
-                    message=f"从数据库找到 {len(recommended_cars)} 辆优质车源",
-                    total_count=len(recommended_cars),
+                return _search_response(
+                    recommended_cars,
+                    f"从数据库找到 {len(recommended_cars)} 辆优质车源",
                 )
 
             # 3. 如果数据库中没有足够车源，则爬取新数据
@@ -316,8 +436,8 @@ class SearchService:
                 make_name=parsed_query.make, zip_code="M5V"  # 默认多伦多
             )
 
-            cars = await crawler.search_cars(parsed_query)
-            logger.log_result("爬取完成", f"爬取了{len(cars)}辆车源")
+            cars = await self._crawl_cars(crawler, parsed_query)
+            logger.log_result("爬取完成", "爬取了%s辆车源", len(cars))
 
             if cars:
                 # 4. 将爬取的数据存储到数据库
@@ -326,7 +446,7 @@ class SearchService:
                         cars, platform="cargurus"
                     )
                 )
-                logger.log_result("数据存储完成", f"存储统计: {storage_stats}")
+                logger.log_result("数据存储完成", "存储统计: %s", storage_stats)
 
                 # 5. 从数据库重新推荐
                 recommended_cars = await self.db_recommendation_service.recommend_cars_from_database(
@@ -336,32 +456,22 @@ class SearchService:
                 if recommended_cars:
                     logger.log_result(
                         "数据库推荐完成",
-                        f"推荐了{len(recommended_cars)}辆车源",
+                        "推荐了%s辆车源",
+                        len(recommended_cars),
                     )
-                    return SearchResponse(
-                        success=True,
-                        data=recommended_cars,
-                        message=f"找到 {len(recommended_cars)} 辆优质车源",
-                        total_count=len(recommended_cars),
+                    return _search_response(
+                        recommended_cars,
+                        f"找到 {len(recommended_cars)} 辆优质车源",
                     )
 
             # 6. 如果仍然没有结果
             logger.log_result("搜索完成", "未找到匹配的车源")
-            return SearchResponse(
-                success=True,
-                data=[],
-                message="未找到匹配的车源，请尝试其他搜索条件",
-                total_count=0,
-            )
+            return _search_response()
 
         except Exception as e:
-            logger.log_result("数据库存储搜索失败", f"搜索时出错: {e}")
-            return SearchResponse(
-                success=False,
-                data=[],
-                message=f"搜索失败: {str(e)}",
-                total_count=0,
-            )
+            logger.log_result("数据库存储搜索失败", "搜索时出错: %s", e)
+            message = f"搜索失败: {str(e)}"
+            return _search_response(message=message, error=message)
 
     async def update_database_from_platforms(
         self, make_name: str = "Toyota"
@@ -369,7 +479,7 @@ class SearchService:
         """
         从各平台更新数据库车源数据
         """
-        logger.log_result("开始更新数据库", f"更新品牌: {make_name}")
+        logger.log_result("开始更新数据库", "更新品牌: %s", make_name)
 
         try:
             # 使用CarGurus爬取数据
@@ -384,7 +494,7 @@ class SearchService:
 
             # 爬取车源数据
             cars = await crawler.search_cars(parsed_query)
-            logger.log_result("爬取完成", f"爬取了{len(cars)}辆车源")
+            logger.log_result("爬取完成", "爬取了%s辆车源", len(cars))
 
             if cars:
                 # 存储到数据库
@@ -393,7 +503,7 @@ class SearchService:
                         cars, platform="cargurus"
                     )
                 )
-                logger.log_result("数据更新完成", f"更新统计: {storage_stats}")
+                logger.log_result("数据更新完成", "更新统计: %s", storage_stats)
                 return storage_stats
             else:
                 logger.log_result("数据更新完成", "没有爬取到新数据")
@@ -406,7 +516,7 @@ class SearchService:
                 }
 
         except Exception as e:
-            logger.log_result("数据库更新失败", f"更新时出错: {e}")
+            logger.log_result("数据库更新失败", "更新时出错: %s", e)
             return {"error": str(e)}
 
     async def get_database_statistics(self) -> dict:
@@ -421,19 +531,18 @@ class SearchService:
 
             return {"statistics": stats, "analytics": analytics}
         except Exception as e:
-            logger.log_result("获取统计信息失败", f"错误: {e}")
+            logger.log_result("获取统计信息失败", "错误: %s", e)
             return {"error": str(e)}
 
+    @traced("对话式搜索")
     async def start_conversation(
         self, request: ConversationRequest, user_ip: str = None
     ) -> ConversationResponse:
         """
         开始对话式搜索流程
         """
-        # 关键部位日志：主要业务函数入口
-        logger.log_result(
-            "开始对话式搜索", f"用户消息: {request.message[:50]}..."
-        )
+        # 各阶段结果通过 annotate 记录，由 traced 在结束时合并为一条日志
+        annotate(message=request.message[:50])
 
         try:
             # 使用对话服务处理消息
@@ -446,42 +555,53 @@ class SearchService:
                 conversation_response.should_search
                 and conversation_response.search_params
             ):
-                logger.log_result("AI建议搜索车源", "开始执行车源搜索")
-
                 # 确定搜索位置：优先使用AI解析的位置，其次使用IP获取的ZIP码
                 search_location = conversation_response.search_params.location
                 if not search_location and user_ip:
                     search_location = await self._get_zip_from_ip(user_ip)
-                    logger.log_result(
-                        "对话搜索使用IP获取的位置", f"ZIP码: {search_location}"
-                    )
                 elif not search_location:
                     search_location = "M5V"  # 默认多伦多
+                annotate(location=search_location)
 
-                # 执行车源搜索
-                crawler = self._get_cargurus_crawler(
-                    make_name=conversation_response.search_params.make,
-                    zip_code=search_location,
+                # 同一会话的搜索条件与上次相同时直接复用上次结果，
+                # 包括空结果，避免闲聊轮次重复爬取
+                session_id = conversation_response.session_id
+                params_key = (
+                    conversation_response.search_params.model_dump_json()
                 )
-                search_result = await crawler.search_cars(
-                    conversation_response.search_params
+                previous = self._cache_get(
+                    self._session_search_cache, session_id
                 )
+                if previous is not None and previous[0] == params_key:
+                    search_result = previous[1]
+                    annotate(session_cache_hit=True)
+                else:
+                    # 执行车源搜索
+                    crawler = self._get_cargurus_crawler(
+                        make_name=conversation_response.search_params.make,
+                        zip_code=search_location,
+                    )
+                    search_result = await self._crawl_cars(
+                        crawler, conversation_response.search_params
+                    )
+                    self._cache_set(
+                        self._session_search_cache,
+                        session_id,
+                        (params_key, search_result),
+                        _SESSION_SEARCH_TTL,
+                    )
 
                 # 更新对话响应，添加搜索结果
+                annotate(results=len(search_result))
                 if search_result:
                     conversation_response.message += f"\n\n我为您找到了 {len(search_result)} 辆车源，请查看搜索结果。"
-                    logger.log_result(
-                        "车源搜索完成", f"找到{len(search_result)}辆车源"
-                    )
                 else:
                     conversation_response.message += "\n\n很抱歉，没有找到符合您条件的车源，请尝试调整搜索条件。"
-                    logger.log_result("车源搜索完成", "未找到匹配的车源")
 
             return conversation_response
 
         except Exception as e:
-            # 关键部位日志：错误处理
-            logger.log_result("对话式搜索失败", f"错误: {str(e)}")
+            annotate(error=str(e))
             return ConversationResponse(
                 success=False,
                 message="抱歉，我遇到了一些技术问题，请稍后再试。",
@@ -489,3 +609,9 @@ class SearchService:
                 conversation_history=[],
                 error=str(e),
             )
+
+
+@lru_cache(maxsize=1)
+def get_search_service() -> SearchService:
+    """获取进程内共享的搜索服务实例，避免各模块重复初始化"""
+    return SearchService()
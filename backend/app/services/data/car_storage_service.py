@@ -5,6 +5,7 @@
 
 import logging
 import json
+import re
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -17,6 +18,9 @@ from app.utils.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 从价格/里程文本中提取数字
+_NUMBER_RE = re.compile(r'[\d,]+')
+
 
 class CarStorageService:
     """
@@ -271,19 +275,17 @@ class CarStorageService:
         """
         解析车源信息，提取结构化数据
         """
-        import re
-        
         # 解析价格
         price = 0.0
         if car_listing.price:
-            price_match = re.search(r'[\d,]+', car_listing.price.replace(',', ''))
+            price_match = _NUMBER_RE.search(car_listing.price.replace(',', ''))
             if price_match:
                 price = float(price_match.group().replace(',', ''))
         
         # 解析里程
         mileage = 0
         if car_listing.mileage:
-            mileage_match = re.search(r'[\d,]+', car_listing.mileage.replace(',', ''))
+            mileage_match = _NUMBER_RE.search(car_listing.mileage.replace(',', ''))
             if mileage_match:
                 mileage = int(mileage_match.group().replace(',', ''))
         
@@ -1,5 +1,6 @@
 import json
 import warnings
+from functools import lru_cache
 
 # 导入 Google AI 库
 import google.generativeai as genai
@@ -135,3 +136,9 @@ class GeminiService:
         keywords.extend(parsed_query.keywords)
 
         return " ".join(keywords)
+
+
+@lru_cache(maxsize=1)
+def get_gemini_service() -> GeminiService:
+    """获取进程内共享的Gemini服务实例，首次调用时创建"""
+    return GeminiService()
@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List
 
 from app.models.schemas import CarListing, ParsedQuery
 
@@ -31,29 +31,3 @@ class BaseCrawlerCoordinator(ABC):
             车源列表
         """
         pass
-
-    @abstractmethod
-    async def get_car_details(self, car_url: str) -> Optional[CarListing]:
-        """
-        获取车源详细信息
-
-        Args:
-            car_url: 车源URL
-
-        Returns:
-            车源详细信息，如果获取失败返回None
-        """
-        pass
-
-    @abstractmethod
-    async def update_car_listings(self, make_name: str) -> int:
-        """
-        更新车源列表
-
-        Args:
-            make_name: 汽车品牌名称
-
-        Returns:
-            更新的车源数量
-        """
-        pass
@@ -6,36 +6,320 @@ CarGurus 车源搜索器
 
 import asyncio
 import random
-from typing import List
-
+import time
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 from app.dao.config_dao import ConfigDAO
 from app.models.schemas import CarListing, ParsedQuery
 from app.services.data.config_service import ConfigServiceRefactored
+from app.utils.business.car_selection_utils import CarSelectionUtils
 from app.utils.business.selector_utils import CarGurusSelectors
 from app.utils.core.logger import logger
 from app.utils.data.data_extractor_utils import (
-    extract_listing_data,
+    extract_listing_data_from_node,
     extract_year_from_title,
 )
 from app.utils.validation.page_detection_utils import (
     is_blocked_page,
+    is_no_results_page,
     is_valid_vehicle_page,
 )
 from app.utils.web.behavior_simulator_utils import simulate_human_behavior
-from app.utils.web.browser_utils import browser_utils
-from app.utils.web.dead_link_utils import is_dead_link
-from app.utils.web.url_builder_utils import build_cargurus_search_url
+from app.utils.web.browser_utils import browser_utils, get_random_user_agent
+from app.utils.web.dead_link_utils import find_dead_links
+from app.utils.web.url_builder_utils import (
+    build_cargurus_search_url,
+    generate_listing_id,
+)
+
+# 中文品牌名称到英文品牌名称的映射
+_BRAND_MAPPING = {
+    "本田": "Honda",
+    "丰田": "Toyota",
+    "日产": "Nissan",
+    "马自达": "Mazda",
+    "斯巴鲁": "Subaru",
+    "三菱": "Mitsubishi",
+    "铃木": "Suzuki",
+    "雷克萨斯": "Lexus",
+    "英菲尼迪": "Infiniti",
+    "讴歌": "Acura",
+    "宝马": "BMW",
+    "奔驰": "Mercedes-Benz",
+    "奥迪": "Audi",
+    "大众": "Volkswagen",
+    "保时捷": "Porsche",
+    "捷豹": "Jaguar",
+    "路虎": "Land Rover",
+    "沃尔沃": "Volvo",
+    "萨博": "Saab",
+    "现代": "Hyundai",
+    "起亚": "Kia",
+    "福特": "Ford",
+    "雪佛兰": "Chevrolet",
+    "别克": "Buick",
+    "凯迪拉克": "Cadillac",
+    "林肯": "Lincoln",
+    "道奇": "Dodge",
+    "克莱斯勒": "Chrysler",
+    "吉普": "Jeep",
+    "菲亚特": "Fiat",
+    "阿尔法罗密欧": "Alfa Romeo",
+    "玛莎拉蒂": "Maserati",
+    "法拉利": "Ferrari",
+    "兰博基尼": "Lamborghini",
+    "宾利": "Bentley",
+    "劳斯莱斯": "Rolls-Royce",
+    "阿斯顿马丁": "Aston Martin",
+    "迈凯伦": "McLaren",
+}
+
+# 中文车型名称到英文车型名称的映射
+_MODEL_MAPPING = {
+    "雅阁": "Accord",
+    "思域": "Civic",
+    "CR-V": "CR-V",
+    "飞度": "Fit",
+    "奥德赛": "Odyssey",
+    "Pilot": "Pilot",
+    "Passport": "Passport",
+    "Ridgeline": "Ridgeline",
+    "Insight": "Insight",
+    "Clarity": "Clarity",
+    "凯美瑞": "Camry",
+    "卡罗拉": "Corolla",
+    "RAV4": "RAV4",
+    "汉兰达": "Highlander",
+    "普锐斯": "Prius",
+    "普拉多": "Land Cruiser",
+    "坦途": "Tundra",
+    "塔科马": "Tacoma",
+    "塞纳": "Sienna",
+    "4Runner": "4Runner",
+    "天籁": "Altima",
+    "轩逸": "Sentra",
+    "奇骏": "Rogue",
+    "逍客": "Qashqai",
+    "楼兰": "Murano",
+    "途乐": "Pathfinder",
+    "GT-R": "GT-R",
+    "370Z": "370Z",
+    "Leaf": "Leaf",
+    "Versa": "Versa",
+    "马自达3": "Mazda3",
+    "马自达6": "Mazda6",
+    "CX-5": "CX-5",
+    "CX-9": "CX-9",
+    "MX-5": "MX-5",
+    "CX-3": "CX-3",
+    "CX-30": "CX-30",
+    "森林人": "Forester",
+    "傲虎": "Outback",
+    "力狮": "Legacy",
+    "翼豹": "Impreza",
+    "WRX": "WRX",
+    "BRZ": "BRZ",
+    "阿特兹": "Atenza",
+    "昂克赛拉": "Axela",
+    "欧蓝德": "Outlander",
+    "蓝瑟": "Lancer",
+    "帕杰罗": "Pajero",
+    "Eclipse": "Eclipse",
+    "雨燕": "Swift",
+    "维特拉": "Vitara",
+    "吉姆尼": "Jimny",
+    "SX4": "SX4",
+    "ES": "ES",
+    "IS": "IS",
+    "GS": "GS",
+    "LS": "LS",
+    "RX": "RX",
+    "GX": "GX",
+    "LX": "LX",
+    "CT": "CT",
+    "RC": "RC",
+    "LC": "LC",
+    "UX": "UX",
+    "NX": "NX",
+    "Q50": "Q50",
+    "Q60": "Q60",
+    "Q70": "Q70",
+    "QX50": "QX50",
+    "QX60": "QX60",
+    "QX70": "QX70",
+    "QX80": "QX80",
+    "MDX": "MDX",
+    "RDX": "RDX",
+    "TLX": "TLX",
+    "ILX": "ILX",
+    "NSX": "NSX",
+}
+
+# 车源列表选择器及其 XPath 在模块加载时构建并编译一次
+_CAR_LISTING_SELECTORS: Tuple[str, ...] = tuple(
+    CarGurusSelectors.get_car_listing_selectors()
+)
+_LISTING_XPATHS = {
+    selector: etree.XPath(selector) for selector in _CAR_LISTING_SELECTORS
+}
+
+# 参与智能选择的候选车源数量为 max_results 的倍数
+_CANDIDATE_MULTIPLIER = 3
+
+# 任一车源选择器命中即认为列表已渲染
+_LISTING_READY_XPATH = CarGurusSelectors.get_union_xpath(
+    _CAR_LISTING_SELECTORS
+)
+_LISTING_READY_TIMEOUT = 8
+
+# 静态请求解析到的车源少于该数量时，认为页面依赖JS渲染，改用浏览器
+_STATIC_MIN_LISTINGS = 1
+# 这些状态码通常意味着触发了反爬，直接改用浏览器
+_STATIC_BLOCKED_STATUS = (403, 429)
+# 静态请求只是浏览器之前的快速尝试，超时要短，失败时不能明显拖慢搜索
+_STATIC_FETCH_TIMEOUT = httpx.Timeout(2.5, connect=1.5)
+# 网络错误或被拦截后暂停静态请求的时间（秒），之后再重新尝试
+_STATIC_FETCH_COOLDOWN = 600
+
+# 一次脚本调用取回页面标题、当前URL和页面源码；源码序列化方式与
+# chromedriver 实现 page_source 时相同
+_PAGE_SNAPSHOT_JS = """
+return [
+    document.title,
+    location.href,
+    new XMLSerializer().serializeToString(document),
+];
+"""
+
+
+def _load_search_page(driver, search_url: str) -> Tuple[str, str, str]:
+    """
+    打开搜索页面，等待车源列表出现后取回页面快照
+
+    导航、等待和取回整页源码都会同步等待浏览器，由调用方放到线程中执行。
+    等待超时后仍然取回页面，交由后续页面检测处理。
+
+    Returns:
+        (页面标题, 当前URL, 页面源码)
+    """
+    driver.get(search_url)
+    try:
+        WebDriverWait(driver, _LISTING_READY_TIMEOUT).until(
+            EC.presence_of_element_located((By.XPATH, _LISTING_READY_XPATH))
+        )
+    except TimeoutException:
+        logger.log_result(
+            "页面等待", f"{_LISTING_READY_TIMEOUT}秒内未检测到车源列表"
+        )
+    # 保留少量随机抖动，避免请求节奏过于规律
+    time.sleep(random.uniform(0.3, 0.8))
+
+    # 标题、URL和页面源码在一次 WebDriver 往返中取回；页面源码只获取
+    # 一次，后续检测和解析都复用，避免重复传输整页HTML，
+    # 各检测函数共用同一份小写副本（见 page_detection_utils）
+    return driver.execute_script(_PAGE_SNAPSHOT_JS)
+
+
+def _find_listings(page_source: str, base_url: str) -> list:
+    """在本地解析页面，按历史成功率依次尝试车源选择器"""
+    tree = lxml_html.fromstring(page_source, base_url=base_url)
+    tree.make_links_absolute()
+
+    # 按历史成功率排序选择器，页面结构变化后优先尝试最近有效的选择器
+    for selector in CarGurusSelectors.sort_by_success_rate(
+        _CAR_LISTING_SELECTORS
+    ):
+        try:
+            listings = _LISTING_XPATHS[selector](tree)
+            CarGurusSelectors.update_selector_success(
+                selector, bool(listings)
+            )
+            if listings:
+                logger.log_result_kv(
+                    "车源选择器", selector=selector, count=len(listings)
+                )
+                return listings
+        except Exception as e:
+            CarGurusSelectors.update_selector_success(selector, False)
+            logger.log_result(
+                "车源选择器失败", f"选择器 {selector} 失败: {str(e)}"
+            )
+    return []
+
+
+def _build_car_listing(data: dict) -> CarListing:
+    """根据提取的车源数据构建 CarListing"""
+    url = data["url"]
+    # 字段均由本地解析得到且类型已确定，跳过 Pydantic 校验
+    return CarListing.model_construct(
+        id=generate_listing_id(url, "cg"),
+        title=data.get("title", ""),
+        price=data.get("price", ""),
+        year=extract_year_from_title(data.get("title", "")),
+        mileage=data.get("mileage", ""),
+        location=data.get("location", ""),
+        link=url,
+    )
+
+
+def _build_car_listings(listings, limit: int) -> List[CarListing]:
+    """批量构建 CarListing，只处理前 limit 个车源，跳过无链接和死链车源"""
+    # 使用 utils 提取数据
+    listing_data = [
+        data
+        for data in map(
+            extract_listing_data_from_node, islice(listings, limit)
+        )
+        if data.get("url")
+    ]
+
+    # 批量校验所有车源链接，已判定过的URL直接命中缓存
+    dead_links = find_dead_links(data["url"] for data in listing_data)
+
+    cars: List[CarListing] = []
+    cars_append = cars.append
+    for data in listing_data:
+        if data["url"] in dead_links:
+            logger.log_result("死链检测", f"跳过死链: {data['url']}")
+            continue
+        cars_append(_build_car_listing(data))
+    return cars
 
 
 class CargurusCarSearcher:
     """CarGurus 车源搜索器"""
 
-    def __init__(self, profile_name: str):
+    def __init__(self, profile_name: str, use_zh_mapping: bool = True):
+        """
+        初始化车源搜索器
+
+        Args:
+            profile_name: Chrome配置文件名称
+            use_zh_mapping: 是否将中文品牌/车型名称转换为英文后再查询代码
+        """
         self.profile_name = profile_name
+        self.use_zh_mapping = use_zh_mapping
         self.config_service = ConfigServiceRefactored()
         self.config_dao = ConfigDAO()
+        self._driver = None
+        # 同一个驱动不能被并发使用，浏览器操作需串行
+        self._driver_lock = asyncio.Lock()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # 页面需要JS渲染时置为False，之后的搜索直接使用浏览器
+        self._static_fetch_enabled = True
+        # 临时失败后暂停静态请求，到该时间（monotonic）后再尝试
+        self._static_fetch_retry_at = 0.0
+        # (搜索URL, 结果数) -> 正在进行的搜索任务，用于合并并发的相同搜索
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
 
     # ============================================================================
     # 公共接口方法
@@ -46,20 +330,20 @@ class CargurusCarSearcher:
     ) -> List[CarListing]:
         """搜索车源 - 增强版本"""
         try:
-            logger.log_result(
-                "搜索车源",
-                f"开始搜索: {parsed_query.make} {parsed_query.model}",
+            logger.log_result_kv(
+                "搜索车源", make=parsed_query.make, model=parsed_query.model
             )
 
-            # 获取品牌和车型的代码 - 直接使用MCP工具查询数据库
-            make_code = await self._get_make_code_from_db(parsed_query.make)
-            model_code = await self._get_model_code_from_db(
-                parsed_query.make, parsed_query.model
+            # 并发获取品牌和车型的代码，两次数据库查询互不依赖
+            make_code, model_code = await asyncio.gather(
+                self._get_make_code_from_db(parsed_query.make),
+                self._get_model_code_from_db(
+                    parsed_query.make, parsed_query.model
+                ),
             )
 
-            logger.log_result(
-                "配置代码",
-                f"品牌: {parsed_query.make} -> {make_code}, 车型: {parsed_query.model} -> {model_code}",
+            logger.log_result_kv(
+                "配置代码", make_code=make_code, model_code=model_code
             )
 
             # 使用 utils 构建搜索URL，支持更多过滤选项，使用代码而不是名称
@@ -76,99 +360,201 @@ class CargurusCarSearcher:
                 make_code=make_code,
                 model_code=model_code,
             )
-            logger.log_result("搜索URL", f"构建URL: {search_url}")
-
-            # 使用browser_utils进行搜索，只尝试一次
-            async with browser_utils.get_driver(self.profile_name) as driver:
-                # 访问搜索页面
-                driver.get(search_url)
-                await asyncio.sleep(random.uniform(2, 4))
-
-                # 调试：记录页面标题和URL
-                logger.log_result("页面调试", f"当前页面标题: {driver.title}")
-                logger.log_result(
-                    "页面调试", f"当前页面URL: {driver.current_url}"
-                )
-
-                # 使用 utils 进行页面检测
-                if is_blocked_page(driver.page_source):
-                    logger.log_result("页面检测", "页面被封禁")
-                    return []
-
-                # 使用 utils 模拟人类行为
-                simulate_human_behavior(driver)
-
-                # 检查页面是否有效
-                if not is_valid_vehicle_page(driver.page_source):
-                    logger.log_result("页面检测", "页面无效")
-                    return []
+            logger.log_result_kv("搜索URL", url=search_url)
+
+            # 相同搜索正在进行时直接等待其结果，不重复请求页面
+            key = (search_url, max_results)
+            task = self._inflight.get(key)
+            if task is not None:
+                logger.log_result_kv("合并重复搜索", url=search_url)
+                cars = await asyncio.shield(task)
+                # 调用方会修改车源对象（如补充平台信息），返回副本
+                return [car.model_copy() for car in cars]
+
+            task = asyncio.ensure_future(
+                self._search_url(search_url, max_results)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            return await asyncio.shield(task)
+
+        except WebDriverException as e:
+            # 驱动会话已失效，关闭后下次搜索重新创建
+            logger.log_result("搜索失败", f"Chrome驱动异常: {e}")
+            await self.aclose()
+            return []
+        except Exception as e:
+            logger.log_result("搜索失败", f"搜索车源时出错: {e}")
+            return []
 
-                # 使用 selector_utils 获取车源列表选择器
-                car_listing_selectors = (
-                    CarGurusSelectors.get_car_listing_selectors()
-                )
-                listings = []
-                for selector in car_listing_selectors:
-                    try:
-                        listings = driver.find_elements(By.XPATH, selector)
-                        if listings:
-                            logger.log_result(
-                                "车源选择器",
-                                f"使用选择器 {selector} 找到 {len(listings)} 个车源",
-                            )
-                            break
-                    except Exception as e:
-                        logger.log_result(
-                            "车源选择器失败",
-                            f"选择器 {selector} 失败: {str(e)}",
-                        )
-                        continue
-                cars = []
-
-                for listing in listings:
-                    # 使用 utils 提取数据
-                    data = extract_listing_data(listing)
-                    if data.get("url"):
-                        # 检查是否为死链
-                        if is_dead_link(data.get("url")):
-                            logger.log_result(
-                                "死链检测",
-                                f"跳过死链: {data.get('url')}",
-                            )
-                            continue
-
-                        car = CarListing(
-                            id=f"cg_{hash(data.get('url', ''))}",
-                            title=data.get("title", ""),
-                            price=data.get("price", ""),
-                            year=extract_year_from_title(
-                                data.get("title", "")
-                            ),
-                            mileage=data.get("mileage", ""),
-                            location=data.get("location", ""),
-                            link=data.get("url", ""),
-                        )
-                        cars.append(car)
-
-                # 使用智能选择算法选择最优车源
-                from app.utils.business.car_selection_utils import (
-                    CarSelectionUtils,
-                )
+    async def _search_url(
+        self, search_url: str, max_results: int
+    ) -> List[CarListing]:
+        """获取搜索页面、解析车源并选出最优结果"""
+        # 优先用HTTP直接获取页面，被拦截或页面需要JS渲染时再启动浏览器
+        listings = None
+        if (
+            self._static_fetch_enabled
+            and time.monotonic() >= self._static_fetch_retry_at
+        ):
+            listings = await self._try_static_fetch(search_url)
+        if listings is None:
+            listings = await self._fetch_listings_with_driver(search_url)
+        if not listings:
+            return []
 
-                selected_cars = CarSelectionUtils.select_best_cars(
-                    cars, max_results
-                )
+        # 在线程中批量处理车源，避免阻塞事件循环
+        # 只处理 max_results 的若干倍，给智能选择留出余量
+        cars = await asyncio.to_thread(
+            _build_car_listings,
+            listings,
+            max_results * _CANDIDATE_MULTIPLIER,
+        )
+
+        # 使用智能选择算法选择最优车源
+        selected_cars = CarSelectionUtils.select_best_cars(cars, max_results)
+
+        logger.log_result_kv(
+            "搜索完成", candidates=len(cars), selected=len(selected_cars)
+        )
+        return selected_cars
+
+    async def _try_static_fetch(self, search_url: str) -> Optional[list]:
+        """
+        不启动浏览器，直接请求搜索页面并解析车源
+
+        网络错误、被拦截等临时问题只暂停静态请求一段时间；页面需要
+        JS渲染（没有车辆数据或解析不到车源）时本搜索器不再尝试。
+
+        Returns:
+            车源节点列表，页面确认无结果时为空列表；获取失败时返回None，
+            由调用方改用浏览器获取
+        """
+        try:
+            client = await self._get_http_client()
+            response = await client.get(
+                search_url, headers={"User-Agent": get_random_user_agent()}
+            )
+        except httpx.HTTPError as e:
+            logger.log_result_kv("静态请求失败", error=str(e))
+            self._pause_static_fetch()
+            return None
+
+        page_source = response.text
+        blocked = response.status_code in _STATIC_BLOCKED_STATUS
+        if blocked or is_blocked_page(page_source):
+            logger.log_result_kv(
+                "静态请求被拦截", status=response.status_code
+            )
+            self._pause_static_fetch()
+            return None
 
-                logger.log_result(
-                    "搜索完成",
-                    f"从 {len(cars)} 辆车中智能选择了 {len(selected_cars)} 辆最优车源",
-                )
-                return selected_cars
+        if response.status_code != 200:
+            logger.log_result_kv(
+                "静态请求失败", status=response.status_code
+            )
+            self._pause_static_fetch()
+            return None
 
-        except Exception as e:
-            logger.log_result("搜索失败", f"搜索车源时出错: {e}")
+        # 无结果页面是有效的搜索结果，不必再启动浏览器
+        if is_no_results_page(page_source):
+            logger.log_result("页面检测", "没有符合条件的车源")
             return []
 
+        if not is_valid_vehicle_page(page_source):
+            logger.log_result_kv("静态页面无效", status=response.status_code)
+            self._disable_static_fetch()
+            return None
+
+        listings = _find_listings(page_source, str(response.url))
+        if len(listings) < _STATIC_MIN_LISTINGS:
+            logger.log_result_kv("静态页面车源不足", count=len(listings))
+            self._disable_static_fetch()
+            return None
+        return listings
+
+    def _pause_static_fetch(self) -> None:
+        """临时失败后暂停静态请求，冷却期内的搜索直接使用浏览器"""
+        self._static_fetch_retry_at = (
+            time.monotonic() + _STATIC_FETCH_COOLDOWN
+        )
+
+    def _disable_static_fetch(self) -> None:
+        """页面需要JS渲染，静态请求无法取到车源，之后不再尝试"""
+        self._static_fetch_enabled = False
+        logger.log_result("静态请求停用", "后续搜索直接使用浏览器")
+
+    async def _fetch_listings_with_driver(
+        self, search_url: str
+    ) -> Optional[list]:
+        """
+        使用浏览器获取搜索页面并解析车源
+
+        Returns:
+            车源节点列表；页面被封禁或无效时返回None
+        """
+        async with self._driver_lock:
+            return await self._fetch_listings_locked(search_url)
+
+    async def _fetch_listings_locked(self, search_url: str) -> Optional[list]:
+        """持有驱动锁时执行的浏览器搜索流程"""
+        # 使用常驻的Chrome驱动进行搜索，避免每次搜索都重新启动浏览器
+        driver = await self._get_driver()
+
+        # 访问搜索页面并取回快照；页面加载期间不阻塞事件循环
+        title, current_url, page_source = await asyncio.to_thread(
+            _load_search_page, driver, search_url
+        )
+
+        # 调试：记录页面标题和URL
+        logger.log_result_kv("页面调试", title=title, url=current_url)
+
+        # 使用 utils 进行页面检测
+        if is_blocked_page(page_source):
+            logger.log_result("页面检测", "页面被封禁")
+            return None
+
+        # 使用 utils 模拟人类行为（只滚动和移动鼠标，不会导航）；
+        # 其中的停顿由浏览器端执行，放到线程中等待，不阻塞事件循环
+        await asyncio.to_thread(simulate_human_behavior, driver)
+
+        # 检查页面是否有效
+        if not is_valid_vehicle_page(page_source):
+            logger.log_result("页面检测", "页面无效")
+            return None
+
+        # 在本地解析所有车源，避免逐元素的 WebDriver 调用
+        return _find_listings(page_source, current_url)
+
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """获取复用的HTTP客户端，首次调用时创建"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                timeout=_STATIC_FETCH_TIMEOUT,
+            )
+        return self._http_client
+
+    async def _get_driver(self):
+        """获取常驻Chrome驱动，首次调用时创建"""
+        if self._driver is None:
+            # 启动Chrome耗时数秒，放到线程中避免阻塞事件循环
+            self._driver = await asyncio.to_thread(
+                browser_utils.create_driver, self.profile_name
+            )
+        return self._driver
+
+    async def aclose(self) -> None:
+        """关闭常驻Chrome驱动和HTTP客户端"""
+        if self._driver is not None:
+            driver, self._driver = self._driver, None
+            # quit() 会同步等待chromedriver退出，放到线程中避免阻塞事件循环
+            await asyncio.to_thread(browser_utils.close_driver, driver)
+        if self._http_client is not None:
+            client, self._http_client = self._http_client, None
+            await client.aclose()
+
     async def _get_make_code_from_db(self, make_name: str) -> str:
         """从数据库获取品牌代码"""
         try:
@@ -179,16 +565,14 @@ class CargurusCarSearcher:
             english_make_name = self._convert_chinese_brand_to_english(
                 make_name
             )
-            logger.log_result(
-                "品牌名称转换",
-                f"中文: {make_name} -> 英文: {english_make_name}",
+            logger.log_result_kv(
+                "品牌名称转换", source=make_name, english=english_make_name
             )
 
             # 使用 ConfigDAO 获取品牌代码
             make_code = await self.config_dao.get_make_code(english_make_name)
-            logger.log_result(
-                "获取品牌代码",
-                f"品牌: {english_make_name} -> 代码: {make_code}",
+            logger.log_result_kv(
+                "获取品牌代码", make=english_make_name, make_code=make_code
             )
             return make_code
 
@@ -198,141 +582,24 @@ class CargurusCarSearcher:
 
     def _convert_chinese_brand_to_english(self, chinese_name: str) -> str:
         """将中文品牌名称转换为英文品牌名称"""
-        # 中文品牌名称到英文品牌名称的映射
-        brand_mapping = {
-            "本田": "Honda",
-            "丰田": "Toyota",
-            "日产": "Nissan",
-            "马自达": "Mazda",
-            "斯巴鲁": "Subaru",
-            "三菱": "Mitsubishi",
-            "铃木": "Suzuki",
-            "雷克萨斯": "Lexus",
-            "英菲尼迪": "Infiniti",
-            "讴歌": "Acura",
-            "宝马": "BMW",
-            "奔驰": "Mercedes-Benz",
-            "奥迪": "Audi",
-            "大众": "Volkswagen",
-            "保时捷": "Porsche",
-            "捷豹": "Jaguar",
-            "路虎": "Land Rover",
-            "沃尔沃": "Volvo",
-            "萨博": "Saab",
-            "现代": "Hyundai",
-            "起亚": "Kia",
-            "福特": "Ford",
-            "雪佛兰": "Chevrolet",
-            "别克": "Buick",
-            "凯迪拉克": "Cadillac",
-            "林肯": "Lincoln",
-            "道奇": "Dodge",
-            "克莱斯勒": "Chrysler",
-            "吉普": "Jeep",
-            "菲亚特": "Fiat",
-            "阿尔法罗密欧": "Alfa Romeo",
-            "玛莎拉蒂": "Maserati",
-            "法拉利": "Ferrari",
-            "兰博基尼": "Lamborghini",
-            "宾利": "Bentley",
-            "劳斯莱斯": "Rolls-Royce",
-            "阿斯顿马丁": "Aston Martin",
-            "迈凯伦": "McLaren",
-        }
+        if not self.use_zh_mapping:
+            return chinese_name
 
         # 如果输入的是中文，尝试转换
-        if chinese_name in brand_mapping:
-            return brand_mapping[chinese_name]
+        if chinese_name in _BRAND_MAPPING:
+            return _BRAND_MAPPING[chinese_name]
 
         # 如果输入的不是中文或没有映射，直接返回原名称
         return chinese_name
 
     def _convert_chinese_model_to_english(self, chinese_name: str) -> str:
         """将中文车型名称转换为英文车型名称"""
-        # 中文车型名称到英文车型名称的映射
-        model_mapping = {
-            "雅阁": "Accord",
-            "思域": "Civic",
-            "CR-V": "CR-V",
-            "飞度": "Fit",
-            "奥德赛": "Odyssey",
-            "Pilot": "Pilot",
-            "Passport": "Passport",
-            "Ridgeline": "Ridgeline",
-            "Insight": "Insight",
-            "Clarity": "Clarity",
-            "凯美瑞": "Camry",
-            "卡罗拉": "Corolla",
-            "RAV4": "RAV4",
-            "汉兰达": "Highlander",
-            "普锐斯": "Prius",
-            "普拉多": "Land Cruiser",
-            "坦途": "Tundra",
-            "塔科马": "Tacoma",
-            "塞纳": "Sienna",
-            "4Runner": "4Runner",
-            "天籁": "Altima",
-            "轩逸": "Sentra",
-            "奇骏": "Rogue",
-            "逍客": "Qashqai",
-            "楼兰": "Murano",
-            "途乐": "Pathfinder",
-            "GT-R": "GT-R",
-            "370Z": "370Z",
-            "Leaf": "Leaf",
-            "Versa": "Versa",
-            "马自达3": "Mazda3",
-            "马自达6": "Mazda6",
-            "CX-5": "CX-5",
-            "CX-9": "CX-9",
-            "MX-5": "MX-5",
-            "CX-3": "CX-3",
-            "CX-30": "CX-30",
-            "森林人": "Forester",
-            "傲虎": "Outback",
-            "力狮": "Legacy",
-            "翼豹": "Impreza",
-            "WRX": "WRX",
-            "BRZ": "BRZ",
-            "阿特兹": "Atenza",
-            "昂克赛拉": "Axela",
-            "欧蓝德": "Outlander",
-            "蓝瑟": "Lancer",
-            "帕杰罗": "Pajero",
-            "Eclipse": "Eclipse",
-            "雨燕": "Swift",
-            "维特拉": "Vitara",
-            "吉姆尼": "Jimny",
-            "SX4": "SX4",
-            "ES": "ES",
-            "IS": "IS",
-            "GS": "GS",
-            "LS": "LS",
-            "RX": "RX",
-            "GX": "GX",
-            "LX": "LX",
-            "CT": "CT",
-            "RC": "RC",
-            "LC": "LC",
-            "UX": "UX",
-            "NX": "NX",
-            "Q50": "Q50",
-            "Q60": "Q60",
-            "Q70": "Q70",
-            "QX50": "QX50",
-            "QX60": "QX60",
-            "QX70": "QX70",
-            "QX80": "QX80",
-            "MDX": "MDX",
-            "RDX": "RDX",
-            "TLX": "TLX",
-            "ILX": "ILX",
-            "NSX": "NSX",
-        }
+        if not self.use_zh_mapping:
+            return chinese_name
 
         # 如果输入的是中文，尝试转换
-        if chinese_name in model_mapping:
-            return model_mapping[chinese_name]
+        if chinese_name in _MODEL_MAPPING:
+            return _MODEL_MAPPING[chinese_name]
 
         # 如果输入的不是中文或没有映射，直接返回原名称
         return chinese_name
@@ -353,18 +620,23 @@ class CargurusCarSearcher:
                 model_name
             )
 
-            logger.log_result(
+            logger.log_result_kv(
                 "车型名称转换",
-                f"品牌: {make_name} -> {english_make_name}, 车型: {model_name} -> {english_model_name}",
+                source_make=make_name,
+                source_model=model_name,
+                make=english_make_name,
+                model=english_model_name,
             )
 
             # 使用 ConfigDAO 获取车型代码
             model_code = await self.config_dao.get_model_code(
                 english_make_name, english_model_name
             )
-            logger.log_result(
+            logger.log_result_kv(
                 "获取车型代码",
-                f"品牌: {english_make_name}, 车型: {english_model_name} -> 代码: {model_code}",
+                make=english_make_name,
+                model=english_model_name,
+                model_code=model_code,
             )
             return model_code
 
@@ -5,7 +5,9 @@ CarGurus 主爬虫协调器
 """
 
 import asyncio
+import time
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 
 from app.dao.config_dao import ConfigDAO
@@ -36,21 +38,17 @@ class CargurusCrawlerCoordinator(BaseCrawlerCoordinator):
         self.max_pages = 50
         self.per_page = 24
 
-        # 初始化配置 DAO
-        self.config_dao = ConfigDAO()
-
-        # 存储品牌名称，在需要时异步获取代码
+        # 存储品牌名称
         self.make_name = make_name
-        self.make_code = None
-
-        # 初始化各个组件
-        self.car_searcher = CargurusCarSearcher(self.profile_name)
 
         # 统计信息
         self.total_crawled = 0
         
         # 进度回调函数 - 用于实时进度更新
         self.progress_callback = None
+        # 进度事件队列，由后台任务异步调用回调，避免慢回调阻塞搜索
+        self._event_q: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._event_consumer_task: Optional[asyncio.Task] = None
 
         logger.log_result(
             "爬虫初始化", f"CarGurus爬虫已就绪，Profile: {self.profile_name}"
@@ -60,6 +58,16 @@ class CargurusCrawlerCoordinator(BaseCrawlerCoordinator):
             f"品牌: {make_name}, ZIP: {zip_code}",
         )
 
+    @cached_property
+    def config_dao(self) -> ConfigDAO:
+        """配置 DAO - 首次使用时创建"""
+        return ConfigDAO()
+
+    @cached_property
+    def car_searcher(self) -> CargurusCarSearcher:
+        """车源搜索器 - 首次使用时创建"""
+        return CargurusCarSearcher(self.profile_name)
+
     @property
     def source_name(self) -> str:
         """返回爬虫源名称"""
@@ -74,17 +82,6 @@ class CargurusCrawlerCoordinator(BaseCrawlerCoordinator):
     # 公共接口方法
     # ============================================================================
 
-    async def _ensure_make_code(self):
-        """确保品牌代码已获取"""
-        if self.make_code is None and self.make_name:
-            self.make_code = await self.config_dao.get_make_code(
-                self.make_name
-            )
-            logger.log_result(
-                "获取品牌代码",
-                f"品牌: {self.make_name} -> 代码: {self.make_code}",
-            )
-
     def get_city_zip_codes(self, city_name: str) -> List[str]:
         """根据城市名称获取ZIP代码列表"""
         return self.config_dao.get_city_zip_codes(city_name)
@@ -147,6 +144,20 @@ class CargurusCrawlerCoordinator(BaseCrawlerCoordinator):
                 )
             raise
 
+    async def aclose(self) -> None:
+        """处理剩余进度事件，并释放搜索器持有的浏览器资源"""
+        await self._flush_events()
+        # 搜索器尚未创建时无需关闭，避免为关闭而创建
+        car_searcher = self.__dict__.get("car_searcher")
+        if car_searcher is not None:
+            await car_searcher.aclose()
+
+    async def __aenter__(self) -> "CargurusCrawlerCoordinator":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
     async def _emit_progress_event(
         self,
         task_id: str,
@@ -155,48 +166,68 @@ class CargurusCrawlerCoordinator(BaseCrawlerCoordinator):
         progress_percentage: float,
         data: Optional[dict] = None,
     ):
-        """发送进度事件"""
-        if self.progress_callback:
-            event = ProgressEvent(
-                task_id=task_id,
-                event_type=event_type,
-                timestamp=datetime.now(),
-                message=message,
-                progress_percentage=progress_percentage,
-                data=data,
-            )
-
-            if asyncio.iscoroutinefunction(self.progress_callback):
-                await self.progress_callback(event)
-            else:
-                self.progress_callback(event)
-
-    # 移除车型收集相关方法，因为车型数据已存储在数据库中
-
-    async def get_car_details(self, car_url: str) -> Optional[CarListing]:
-        """
-        获取车源详细信息
-
-        Args:
-            car_url: 车源URL
-
-        Returns:
-            车源详细信息，如果获取失败返回None
-        """
-        # TODO: 实现车源详细信息获取
-        logger.log_result("获取车源详情", f"URL: {car_url}")
-        return None
+        """发送进度事件 - 放入队列后立即返回，由后台任务调用回调"""
+        if not self.progress_callback:
+            return
+
+        # 只记录原始时间戳，ProgressEvent 的构建和校验交给后台任务
+        event = (
+            time.time(),
+            task_id,
+            event_type,
+            message,
+            progress_percentage,
+            data,
+        )
 
-    async def update_car_listings(self, make_name: str) -> int:
-        """
-        更新车源列表
+        if self._event_q.full():
+            # 队列已满时丢弃最旧的事件，保留最新进度
+            self._event_q.get_nowait()
+            self._event_q.task_done()
+        self._event_q.put_nowait(event)
 
-        Args:
-            make_name: 汽车品牌名称
+        task = self._event_consumer_task
+        if task is None or task.done():
+            self._event_consumer_task = asyncio.create_task(
+                self._drain_events()
+            )
 
-        Returns:
-            更新的车源数量
-        """
-        # TODO: 实现车源列表更新
-        logger.log_result("更新车源列表", f"品牌: {make_name}")
-        return 0
+    async def _drain_events(self):
+        """后台任务：按顺序把队列中的进度事件交给回调处理"""
+        while True:
+            timestamp, task_id, event_type, message, progress, data = (
+                await self._event_q.get()
+            )
+            try:
+                callback = self.progress_callback
+                if callback is None:
+                    continue
+                event = ProgressEvent(
+                    task_id=task_id,
+                    event_type=event_type,
+                    timestamp=datetime.fromtimestamp(timestamp),
+                    message=message,
+                    progress_percentage=progress,
+                    data=data,
+                )
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(event)
+                else:
+                    callback(event)
+            except Exception as e:
+                logger.log_result("进度回调失败", str(e))
+            finally:
+                self._event_q.task_done()
+
+    async def _flush_events(self, timeout: float = 5.0) -> None:
+        """等待已排队的进度事件处理完毕，然后停止后台任务"""
+        task, self._event_consumer_task = self._event_consumer_task, None
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(self._event_q.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.log_result(
+                "进度事件未处理完", f"剩余 {self._event_q.qsize()} 个"
+            )
+        task.cancel()
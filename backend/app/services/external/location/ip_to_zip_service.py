@@ -4,14 +4,24 @@ IP地址到ZIP码转换服务
 通过IP地址获取用户的地理位置信息，包括ZIP码
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+import random
+import time
+from functools import lru_cache
+from ipaddress import ip_address as ip_address_of
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import httpx
+import orjson
 
 from app.utils.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# IP定位API的正常响应只有几百字节，超过该大小的响应直接丢弃
+_MAX_RESPONSE_BYTES = 64_000
+
 
 class IPToZipService:
     """IP地址到ZIP码转换服务"""
@@ -24,19 +34,190 @@ class IPToZipService:
             "https://ipapi.co/{ip}/json/",
             "https://api.ipgeolocation.io/ipgeo?apiKey=free&ip={ip}",
         ]
-        self.current_api_index = 0
+        # 预先拆分URL模板为 (前缀, 后缀, 主机名)，请求时直接拼接IP
+        self._api_templates: List[Tuple[str, str, str]] = []
+        for api_url in self.api_urls:
+            prefix, suffix = api_url.split("{ip}", 1)
+            self._api_templates.append(
+                (prefix, suffix, urlsplit(api_url).hostname)
+            )
+        # 主机名 -> 是否可用，由实际请求的结果更新，不可用的API排到最后请求
+        self.host_health: Dict[str, bool] = {
+            host: True for _, _, host in self._api_templates
+        }
+        # 每个API的延迟与失败率统计（指数加权平均），用于决定请求顺序
+        self.api_stats: Dict[str, Dict[str, float]] = {
+            api_url: {"ewma_ms": 0.0, "fail_rate": 0.0, "n": 0}
+            for api_url in self.api_urls
+        }
+        self.stats_alpha = 0.2
+        # 以一定概率把非最优API提到最前，持续探测其当前表现
+        self.explore_rate = 0.1
+        # 同时并发请求的API数量，其余API仅在这些全部失败后才请求
+        self.parallel_apis = 2
+        # 单次ZIP查询的总超时（秒），所有API并发请求
+        self.lookup_timeout = 5.0
+        # IP -> (过期时间, 结果) 的内存缓存，IP对应的位置很少变化
+        self.cache_ttl = 86400
+        self.cache_maxsize = 50_000
+        self._zip_cache: Dict[str, Tuple[float, str]] = {}
+        self._location_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._warmup_task: Optional[asyncio.Task] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """获取HTTP客户端"""
+        """获取HTTP客户端 - 复用连接池，避免每次查询重新建立TCP/TLS连接"""
         if self.client is None or self.client.is_closed:
-            timeout = httpx.Timeout(10.0)
-            self.client = httpx.AsyncClient(timeout=timeout)
+            self.client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60,
+                ),
+                timeout=httpx.Timeout(10.0, connect=3.0),
+            )
         return self.client
 
+    def _build_url(self, index: int, ip_address: str) -> str:
+        """根据预拆分的模板拼接API请求URL"""
+        prefix, suffix, _ = self._api_templates[index]
+        return prefix + ip_address + suffix
+
+    def _record_api_result(
+        self, index: int, elapsed_ms: float, success: bool
+    ) -> None:
+        """更新API的延迟与失败率统计"""
+        stats = self.api_stats[self.api_urls[index]]
+        alpha = self.stats_alpha if stats["n"] else 1.0
+        stats["ewma_ms"] += alpha * (elapsed_ms - stats["ewma_ms"])
+        stats["fail_rate"] += alpha * ((not success) - stats["fail_rate"])
+        stats["n"] += 1
+
+    def _rank_apis(self) -> List[int]:
+        """
+        按失败率和平均延迟对API排序
+
+        不可用的主机排在最后而不是被跳过，并以 explore_rate 的概率
+        把一个非最优API（包括不可用的主机）提到最前进行探测，
+        偶发失败的主机恢复后可以重新被标记为可用。
+        """
+        indexes = list(range(len(self.api_urls)))
+        indexes.sort(
+            key=lambda index: (
+                not self.host_health[self._api_templates[index][2]],
+                self.api_stats[self.api_urls[index]]["fail_rate"],
+                self.api_stats[self.api_urls[index]]["ewma_ms"],
+            )
+        )
+        if len(indexes) > 1 and random.random() < self.explore_rate:
+            probe = random.randrange(1, len(indexes))
+            indexes.insert(0, indexes.pop(probe))
+        return indexes
+
+    def _start_api_task(
+        self, client: httpx.AsyncClient, index: int, ip_address: str
+    ) -> asyncio.Task:
+        """创建单个API的ZIP码查询任务"""
+        if "ip-api.com" in self.api_urls[index]:
+            # ip-api.com 返回完整地理位置信息，顺便写入位置缓存
+            coro = self._try_location_api(ip_address)
+        else:
+            coro = self._try_api(client, index, ip_address)
+        return asyncio.create_task(coro)
+
+    async def warmup(self) -> None:
+        """
+        预热API连接
+
+        对每个API主机发送一次HEAD请求，提前完成DNS解析和TCP/TLS握手，
+        使连接留在客户端连接池中，避免首个用户请求承担建连耗时。
+        预热失败只记录日志，不影响主机的可用状态，由实际请求决定。
+        """
+        client = await self._get_client()
+
+        async def warm(index: int) -> bool:
+            host = self._api_templates[index][2]
+            try:
+                await client.head(self._build_url(index, "8.8.8.8"))
+                return True
+            except httpx.HTTPError as e:
+                logger.log_result("API预热失败", f"{host}: {e}")
+                return False
+
+        results = await asyncio.gather(
+            *(warm(index) for index in range(len(self._api_templates)))
+        )
+        logger.log_result(
+            "API预热完成", f"{sum(results)}/{len(results)} 个主机已连接"
+        )
+
+    def schedule_warmup(self) -> asyncio.Task:
+        """
+        在后台预热API连接，不阻塞调用方（如应用启动）
+
+        已有预热任务在运行时直接返回该任务。
+
+        Returns:
+            后台预热任务
+        """
+        task = self._warmup_task
+        if task is None or task.done():
+            task = asyncio.create_task(self.warmup())
+            self._warmup_task = task
+        return task
+
     async def close(self):
         """关闭HTTP客户端"""
+        task, self._warmup_task = self._warmup_task, None
+        if task is not None:
+            task.cancel()
         if self.client and not self.client.is_closed:
             await self.client.aclose()
+        self.client = None
+
+    async def _get_json(
+        self, client: httpx.AsyncClient, url: str
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        请求API并用orjson解析JSON响应
+
+        以流式方式请求，先检查Content-Length，过大的响应不读取响应体。
+
+        Returns:
+            (状态码, 解析后的数据)，非200或响应过大时数据为None
+        """
+        async with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                return response.status_code, None
+            content_length = int(response.headers.get("content-length", 0))
+            if content_length > _MAX_RESPONSE_BYTES:
+                logger.log_result("API响应过大", f"{content_length} 字节")
+                return response.status_code, None
+            body = await response.aread()
+        if len(body) > _MAX_RESPONSE_BYTES:
+            logger.log_result("API响应过大", f"{len(body)} 字节")
+            return response.status_code, None
+        return response.status_code, orjson.loads(body)
+
+    def _cache_get(self, cache: Dict[str, Tuple[float, Any]], key: str):
+        """读取未过期的缓存值，不存在或已过期返回None"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            cache.pop(key, None)
+            return None
+        return value
+
+    def _cache_set(
+        self, cache: Dict[str, Tuple[float, Any]], key: str, value: Any
+    ) -> None:
+        """写入缓存，超出容量时淘汰最早写入的条目"""
+        cache.pop(key, None)
+        cache[key] = (time.monotonic() + self.cache_ttl, value)
+        while len(cache) > self.cache_maxsize:
+            cache.pop(next(iter(cache)))
 
     async def get_zip_from_ip(self, ip_address: str) -> Optional[str]:
         """
@@ -48,65 +229,100 @@ class IPToZipService:
         Returns:
             ZIP码，如果获取失败返回None
         """
-        if not ip_address or ip_address == "unknown":
-            logger.log_result("IP地址无效", "IP地址为空或unknown")
-            return None
-
-        # 跳过私有IP地址
-        if self._is_private_ip(ip_address):
-            logger.log_result("跳过私有IP地址", f"IP: {ip_address}")
+        # 空值、unknown、私有及保留地址一次判断，在任何await之前返回
+        if not self._is_public_ip(ip_address):
             # 开发环境：如果是本地回环地址，返回默认的ZIP码
             if ip_address == "127.0.0.1":
                 logger.log_result(
                     "开发环境检测", "使用默认ZIP码: M5V (多伦多)"
                 )
                 return "M5V"
+            logger.log_result("跳过非公网IP地址", f"IP: {ip_address}")
             return None
 
+        cached_zip = self._cache_get(self._zip_cache, ip_address)
+        if cached_zip is not None:
+            return cached_zip
+
+        # 已查询过完整地理位置信息时直接复用其中的ZIP码
+        cached_location = self._cache_get(self._location_cache, ip_address)
+        if cached_location and cached_location.get("zip"):
+            return str(cached_location["zip"])
+
         client = await self._get_client()
 
-        # 尝试多个API服务
-        for i in range(len(self.api_urls)):
-            api_url = self.api_urls[self.current_api_index]
-            try:
-                zip_code = await self._try_api(client, api_url, ip_address)
-                if zip_code:
-                    logger.log_result(
-                        "成功获取ZIP码", f"IP: {ip_address}, ZIP: {zip_code}"
-                    )
-                    return zip_code
-            except Exception as e:
-                logger.log_result(
-                    "API请求失败", f"API {self.current_api_index}: {e}"
+        # 表现最好的几个API并发请求，采用最先返回的有效结果；
+        # 它们全部失败后再请求剩余的API
+        ranked = self._rank_apis()
+        backups = ranked[self.parallel_apis :]
+        tasks = {
+            self._start_api_task(client, index, ip_address): index
+            for index in ranked[: self.parallel_apis]
+        }
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lookup_timeout
+        pending = set(tasks)
+        try:
+            while pending or backups:
+                if not pending:
+                    for index in backups:
+                        task = self._start_api_task(client, index, ip_address)
+                        tasks[task] = index
+                        pending.add(task)
+                    backups = []
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-
-            # 切换到下一个API
-            self.current_api_index = (self.current_api_index + 1) % len(
-                self.api_urls
-            )
+                for task in done:
+                    zip_code = task.result()
+                    if zip_code:
+                        self._cache_set(self._zip_cache, ip_address, zip_code)
+                        logger.log_result(
+                            "成功获取ZIP码",
+                            f"IP: {ip_address}, ZIP: {zip_code}",
+                        )
+                        return zip_code
+        finally:
+            for task in pending:
+                task.cancel()
 
         logger.log_result("所有API都失败", f"无法获取IP {ip_address} 的ZIP码")
         return None
 
     async def _try_api(
-        self, client: httpx.AsyncClient, api_url: str, ip_address: str
+        self, client: httpx.AsyncClient, index: int, ip_address: str
     ) -> Optional[str]:
         """尝试使用特定的API获取ZIP码"""
-        url = api_url.format(ip=ip_address)
+        api_url = self.api_urls[index]
+        host = self._api_templates[index][2]
+        zip_code = None
+        start = time.perf_counter()
 
         try:
-            response = await client.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                return self._extract_zip_from_response(data, api_url)
-            else:
-                logger.log_result(
-                    "API请求失败", f"状态码: {response.status_code}"
-                )
-                return None
+            status_code, data = await self._get_json(
+                client, self._build_url(index, ip_address)
+            )
+            self.host_health[host] = True
+            if data is not None:
+                zip_code = self._extract_zip_from_response(data, api_url)
+            elif status_code != 200:
+                logger.log_result("API请求失败", f"状态码: {status_code}")
+        except httpx.TransportError as e:
+            self.host_health[host] = False
+            logger.log_result("API连接异常", f"{host}: {e}")
         except Exception as e:
             logger.log_result("API请求异常", str(e))
-            return None
+
+        self._record_api_result(
+            index, (time.perf_counter() - start) * 1000, bool(zip_code)
+        )
+        return zip_code
 
     def _extract_zip_from_response(
         self, data: Dict[str, Any], api_url: str
@@ -139,29 +355,19 @@ class IPToZipService:
             logger.log_result("解析API响应出错", str(e))
             return None
 
-    def _is_private_ip(self, ip_address: str) -> bool:
-        """检查是否为私有IP地址"""
-        try:
-            parts = ip_address.split(".")
-            if len(parts) != 4:
-                return True
-
-            first_octet = int(parts[0])
-            second_octet = int(parts[1])
-
-            # 私有IP地址范围
-            if first_octet == 10:
-                return True
-            elif first_octet == 172 and 16 <= second_octet <= 31:
-                return True
-            elif first_octet == 192 and second_octet == 168:
-                return True
-            elif first_octet == 127:  # 本地回环
-                return True
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_public_ip(ip_address: Optional[str]) -> bool:
+        """
+        检查是否为可定位的公网IP地址（支持IPv4和IPv6）
 
+        空值、unknown等无法解析的字符串以及私有、回环、链路本地等
+        保留地址均返回False。
+        """
+        try:
+            return ip_address_of(ip_address).is_global
+        except ValueError:
             return False
-        except (ValueError, IndexError):
-            return True
 
     async def get_location_info(
         self, ip_address: str
@@ -175,10 +381,7 @@ class IPToZipService:
         Returns:
             包含地理位置信息的字典
         """
-        if not ip_address or ip_address == "unknown":
-            return None
-
-        if self._is_private_ip(ip_address):
+        if not self._is_public_ip(ip_address):
             # 开发环境：如果是本地回环地址，返回默认的地理位置信息
             if ip_address == "127.0.0.1":
                 logger.log_result("开发环境检测", "使用默认地理位置: 多伦多")
@@ -195,16 +398,33 @@ class IPToZipService:
                 }
             return None
 
+        return await self._fetch_location(ip_address)
+
+    async def _fetch_location(
+        self, ip_address: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        请求ip-api.com获取完整地理位置信息
+
+        ZIP码查询和地理位置查询共用这一次请求，结果按IP缓存。
+        """
+        cached_location = self._cache_get(self._location_cache, ip_address)
+        if cached_location is not None:
+            return cached_location
+
         client = await self._get_client()
-        api_url = self.api_urls[0]  # 使用ip-api.com，它提供最完整的信息
-        url = api_url.format(ip=ip_address)
+        # 使用ip-api.com，它提供最完整的信息
+        url = self._build_url(0, ip_address)
+        host = self._api_templates[0][2]
+        location = None
+        start = time.perf_counter()
 
         try:
-            response = await client.get(url)
-            if response.status_code == 200:
-                data = response.json()
+            status_code, data = await self._get_json(client, url)
+            self.host_health[host] = True
+            if data is not None:
                 if data.get("status") == "success":
-                    return {
+                    location = {
                         "ip": data.get("query"),
                         "country": data.get("country"),
                         "country_code": data.get("countryCode"),
@@ -215,10 +435,27 @@ class IPToZipService:
                         "longitude": data.get("lon"),
                         "timezone": data.get("timezone"),
                     }
+                    self._cache_set(
+                        self._location_cache, ip_address, location
+                    )
+            elif status_code != 200:
+                logger.log_result("API请求失败", f"状态码: {status_code}")
+        except httpx.TransportError as e:
+            self.host_health[host] = False
+            logger.log_result("获取地理位置信息失败", f"{host}: {e}")
         except Exception as e:
             logger.log_result("获取地理位置信息失败", str(e))
 
-        return None
+        self._record_api_result(
+            0, (time.perf_counter() - start) * 1000, location is not None
+        )
+        return location
+
+    async def _try_location_api(self, ip_address: str) -> Optional[str]:
+        """通过完整地理位置信息获取ZIP码"""
+        location = await self._fetch_location(ip_address)
+        zip_code = location.get("zip") if location else None
+        return str(zip_code) if zip_code else None
 
 
 # 全局实例
@@ -1,11 +1,25 @@
 # Utils package
 # 工具层 - 提供各种工具函数和实用程序
 
-# 导入各子层的核心功能
-from .business import *
-from .core import *
-from .data import *
-from .validation import *
-from .web import *
+# 各子层按需导入：首次访问 app.utils.<名称> 时才加载对应子层，
+# 避免只用到日志、路径等小工具时也要加载 Selenium 等重量级依赖
+import importlib
+
+_SUBPACKAGES = ("business", "core", "data", "validation", "web")
 
 __all__ = []
+
+
+def __getattr__(name):
+    """PEP 562 延迟导入：依次在各子层中查找名称，找到后缓存到模块"""
+    if name in _SUBPACKAGES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    for subpackage in _SUBPACKAGES:
+        module = importlib.import_module(f"{__name__}.{subpackage}")
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,87 @@
 实现多种排序和筛选策略，确保返回高质量、多样化的车源
 """
 
+import heapq
 import re
-from typing import Dict, List, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from app.models.schemas import CarListing
 from app.utils.core.logger import logger
 
+# 价格/里程字符串中的非数字字符（货币符号、逗号、单位）
+_NON_NUMERIC_RE = re.compile(r"[^\d.]")
+
+
+@lru_cache(maxsize=4096)
+def _parse_number(text: str) -> Optional[float]:
+    """
+    去掉非数字字符后解析为浮点数，无法解析时返回None
+
+    同一车源的价格/里程会在过滤、评分、多样性筛选中被多次解析，
+    按原始字符串缓存解析结果。
+    """
+    try:
+        return float(_NON_NUMERIC_RE.sub("", text))
+    except ValueError:
+        return None
+
+
+# 多样性选择时，同价格区间或同年份区间每多选一辆车扣除的评分
+_DIVERSITY_PENALTY = 0.1
+
+
+# 年份/价格到档位的映射只有少数几种结果，缓存后评分时只需一次字典查找
+@lru_cache(maxsize=64)
+def _base_price_for_year(year: int) -> float:
+    """获取某年份的基础价格"""
+    if year >= 2022:
+        return 35000
+    elif year >= 2020:
+        return 28000
+    elif year >= 2018:
+        return 22000
+    elif year >= 2015:
+        return 18000
+    elif year >= 2012:
+        return 12000
+    else:
+        return 8000
+
+
+@lru_cache(maxsize=64)
+def _year_score(year: int) -> float:
+    """计算年份评分 (0-1)"""
+    current_year = 2024
+    age = current_year - year
+
+    if age <= 2:  # 2年内
+        return 1.0
+    elif age <= 5:  # 3-5年
+        return 0.9
+    elif age <= 8:  # 6-8年
+        return 0.8
+    elif age <= 12:  # 9-12年
+        return 0.7
+    else:  # 12年以上
+        return 0.5
+
+
+@lru_cache(maxsize=1024)
+def _price_range(price: float) -> str:
+    """获取价格区间"""
+    if price < 10000:
+        return "under_10k"
+    elif price < 20000:
+        return "10k_20k"
+    elif price < 30000:
+        return "20k_30k"
+    elif price < 50000:
+        return "30k_50k"
+    else:
+        return "over_50k"
+
 
 class CarSelectionUtils:
     """车源选择工具类"""
@@ -53,13 +128,12 @@ class CarSelectionUtils:
             valid_cars, platform_weights
         )
 
-        # 3. 多样性保证 - 确保不同价格区间和年份分布
+        # 3. 多样性保证 - 确保不同价格区间和年份分布，
+        # 返回结果已按评分排序，无需再次评分
         selected_cars = CarSelectionUtils._ensure_diversity(
             scored_cars, max_results
         )
-
-        # 4. 最终排序
-        final_cars = CarSelectionUtils._sort_cars(selected_cars)
+        final_cars = [car for car, score in selected_cars]
 
         logger.log_result(
             "车源选择完成", f"最终选择了 {len(final_cars)} 辆高质量车源"
@@ -113,84 +187,161 @@ class CarSelectionUtils:
     def _score_cars(
         cars: List[CarListing], platform_weights: Dict[str, float] = None
     ) -> List[Tuple[CarListing, float]]:
-        """计算车源综合评分"""
-        scored_cars = []
-
-        for car in cars:
-            score = 0.0
-
-            # 价格评分 (40% 权重)
-            price_score = CarSelectionUtils._calculate_price_score(car)
-            score += price_score * 0.4
+        """
+        计算车源综合评分
 
-            # 年份评分 (25% 权重)
-            year_score = CarSelectionUtils._calculate_year_score(car)
-            score += year_score * 0.25
+        价格 40%、年份 25%、里程 25%、数据完整性 10%、平台权重 10%。
+        所有子评分在一个内联函数中一次算出，每辆车的各字段只读取、
+        解析一次，不再逐项调用评分方法。
+        """
+        platform_score_map = CarSelectionUtils._platform_scores(
+            platform_weights
+        )
+        parse_price = CarSelectionUtils._parse_price
+        parse_mileage = CarSelectionUtils._parse_mileage
+
+        def score_car(car: CarListing) -> float:
+            title = car.title
+            price = car.price
+            year = car.year
+            mileage = car.mileage
+            location = car.location
+            platform = getattr(car, "platform", None)
+
+            price_value = parse_price(price)
+            mileage_value = parse_mileage(mileage)
+            age = 2024 - year
+
+            # 预期里程（每年15000公里），里程评分和里程影响因子共用
+            expected_mileage = age * 15000
+            mileage_ratio = (
+                mileage_value / expected_mileage
+                if mileage_value is not None and expected_mileage != 0
+                else None
+            )
 
-            # 里程评分 (25% 权重)
-            mileage_score = CarSelectionUtils._calculate_mileage_score(car)
-            score += mileage_score * 0.25
+            # 价格评分：价格越接近基于年份和里程的预期价格，评分越高
+            if price_value is None:
+                price_score = 0.0
+            else:
+                # 里程影响因子：低里程价格可以高一些，高里程应该低一些
+                if mileage_ratio is None:
+                    mileage_factor = 1.0
+                elif mileage_ratio <= 0.5:
+                    mileage_factor = 1.2
+                elif mileage_ratio <= 1.0:
+                    mileage_factor = 1.0
+                elif mileage_ratio <= 1.5:
+                    mileage_factor = 0.8
+                else:
+                    mileage_factor = 0.6
+
+                expected_price = _base_price_for_year(year) * mileage_factor
+                price_ratio = (
+                    price_value / expected_price if expected_price > 0 else 1.0
+                )
 
-            # 数据完整性评分 (10% 权重)
-            completeness_score = (
-                CarSelectionUtils._calculate_completeness_score(car)
-            )
-            score += completeness_score * 0.1
+                if 0.8 <= price_ratio <= 1.2:  # 合理价格区间
+                    price_score = 1.0
+                elif 0.6 <= price_ratio <= 1.4:  # 可接受价格区间
+                    price_score = 0.8
+                elif 0.4 <= price_ratio <= 1.6:  # 边缘价格区间
+                    price_score = 0.6
+                else:
+                    price_score = 0.3
 
-            # 平台权重评分 (如果有平台信息)
-            platform_score = CarSelectionUtils._calculate_platform_score(
-                car, platform_weights
+            # 里程评分
+            if mileage_value is None:
+                mileage_score = 0.0
+            elif mileage_ratio is None:  # 当年车，没有预期里程
+                mileage_score = 0.5
+            elif mileage_ratio <= 0.8:  # 低里程
+                mileage_score = 1.0
+            elif mileage_ratio <= 1.2:  # 正常里程
+                mileage_score = 0.9
+            elif mileage_ratio <= 1.5:  # 稍高里程
+                mileage_score = 0.7
+            else:  # 高里程
+                mileage_score = 0.4
+
+            # 数据完整性评分
+            completeness_score = 0.0
+            if title and len(title.strip()) > 10:
+                completeness_score += 0.3
+            if price and price.strip():
+                completeness_score += 0.3
+            if year and year > 0:
+                completeness_score += 0.2
+            if mileage and mileage.strip():
+                completeness_score += 0.1
+            if location and location.strip():
+                completeness_score += 0.1
+
+            # 平台权重评分，没有平台信息时为默认中等评分
+            if platform_score_map and platform:
+                platform_score = platform_score_map.get(platform.lower(), 0.5)
+            else:
+                platform_score = 0.5
+
+            return (
+                price_score * 0.4
+                + _year_score(year) * 0.25
+                + mileage_score * 0.25
+                + completeness_score * 0.1
+                + platform_score * 0.1
             )
-            score += platform_score * 0.1  # 平台权重占10%
-
-            scored_cars.append((car, score))
 
-        return scored_cars
+        return [(car, score_car(car)) for car in cars]
 
     @staticmethod
     def _ensure_diversity(
         scored_cars: List[Tuple[CarListing, float]], max_results: int
-    ) -> List[CarListing]:
-        """确保车源多样性 - 不同价格区间和年份分布"""
-        # 按评分排序
-        scored_cars.sort(key=lambda x: x[1], reverse=True)
-
-        selected_cars = []
-        price_ranges = {}  # 价格区间分布
-        year_ranges = {}  # 年份区间分布
+    ) -> List[Tuple[CarListing, float]]:
+        """
+        确保车源多样性 - 不同价格区间和年份分布
 
-        for car, score in scored_cars:
-            if len(selected_cars) >= max_results:
-                break
+        贪心选择：每一步选出 评分 - 惩罚系数 × (同价格区间已选数量
+        + 同年份区间已选数量) 最大的车源。同一 (价格区间, 年份区间)
+        单元内的惩罚相同，因此每步只需比较各单元剩余的最高分车源。
 
-            # 计算价格区间
+        Returns:
+            选中的 (车源, 评分) 列表，按评分从高到低排序
+        """
+        # (价格区间, 年份区间) -> 该单元候选车源的堆，按评分从高到低取出；
+        # 序号保证同分时保持原有顺序
+        cells: Dict[Tuple[str, str], list] = {}
+        for index, (car, score) in enumerate(scored_cars):
             price_value = CarSelectionUtils._parse_price(car.price)
-            price_range = CarSelectionUtils._get_price_range(price_value)
-
-            # 计算年份区间
-            year_range = CarSelectionUtils._get_year_range(car.year)
-
-            # 检查多样性限制
-            if (
-                price_ranges.get(price_range, 0) < 3
-                and year_ranges.get(year_range, 0) < 3
-            ):
-
-                selected_cars.append(car)
-                price_ranges[price_range] = (
-                    price_ranges.get(price_range, 0) + 1
-                )
-                year_ranges[year_range] = year_ranges.get(year_range, 0) + 1
-
-        # 如果多样性限制导致选择不足，补充高分车源
-        if len(selected_cars) < max_results:
-            for car, score in scored_cars:
-                if (
-                    car not in selected_cars
-                    and len(selected_cars) < max_results
-                ):
-                    selected_cars.append(car)
+            cell = (
+                _price_range(price_value),
+                CarSelectionUtils._get_year_range(car.year),
+            )
+            cells.setdefault(cell, []).append((-score, index, car))
+        for candidates in cells.values():
+            heapq.heapify(candidates)
 
+        selected_cars = []
+        price_counts = Counter()  # 价格区间分布
+        year_counts = Counter()  # 年份区间分布
+
+        def gain(cell: Tuple[str, str]) -> Tuple[float, int]:
+            """单元内最高分车源的边际收益，同收益时序号小的优先"""
+            neg_score, index, _ = cells[cell][0]
+            penalty = price_counts[cell[0]] + year_counts[cell[1]]
+            return -neg_score - _DIVERSITY_PENALTY * penalty, -index
+
+        while cells and len(selected_cars) < max_results:
+            cell = max(cells, key=gain)
+            neg_score, _, car = heapq.heappop(cells[cell])
+            if not cells[cell]:
+                del cells[cell]
+
+            selected_cars.append((car, -neg_score))
+            price_counts[cell[0]] += 1
+            year_counts[cell[1]] += 1
+
+        # 最终排序 - 直接复用已有评分
+        selected_cars.sort(key=lambda x: x[1], reverse=True)
         return selected_cars
 
     @staticmethod
@@ -207,108 +358,16 @@ class CarSelectionUtils:
     # ============================================================================
 
     @staticmethod
-    def _calculate_price_score(car: CarListing) -> float:
-        """计算价格评分 (0-1)"""
-        price_value = CarSelectionUtils._parse_price(car.price)
-        if price_value is None:
-            return 0.0
-
-        # 基于年份和里程的合理价格范围
-        base_price = CarSelectionUtils._get_base_price_for_year(car.year)
-        mileage_factor = CarSelectionUtils._get_mileage_factor(car)
-        expected_price = base_price * mileage_factor
-
-        # 价格越接近预期价格，评分越高
-        price_ratio = (
-            price_value / expected_price if expected_price > 0 else 1.0
-        )
-
-        if 0.8 <= price_ratio <= 1.2:  # 合理价格区间
-            return 1.0
-        elif 0.6 <= price_ratio <= 1.4:  # 可接受价格区间
-            return 0.8
-        elif 0.4 <= price_ratio <= 1.6:  # 边缘价格区间
-            return 0.6
-        else:
-            return 0.3
-
-    @staticmethod
-    def _calculate_year_score(car: CarListing) -> float:
-        """计算年份评分 (0-1)"""
-        current_year = 2024
-        age = current_year - car.year
-
-        if age <= 2:  # 2年内
-            return 1.0
-        elif age <= 5:  # 3-5年
-            return 0.9
-        elif age <= 8:  # 6-8年
-            return 0.8
-        elif age <= 12:  # 9-12年
-            return 0.7
-        else:  # 12年以上
-            return 0.5
-
-    @staticmethod
-    def _calculate_mileage_score(car: CarListing) -> float:
-        """计算里程评分 (0-1)"""
-        mileage_value = CarSelectionUtils._parse_mileage(car.mileage)
-        if mileage_value is None:
-            return 0.0
-
-        # 基于年份的合理里程
-        age = 2024 - car.year
-        expected_mileage = age * 15000  # 每年15000公里
-
-        if expected_mileage == 0:
-            return 0.5
-
-        mileage_ratio = mileage_value / expected_mileage
-
-        if mileage_ratio <= 0.8:  # 低里程
-            return 1.0
-        elif mileage_ratio <= 1.2:  # 正常里程
-            return 0.9
-        elif mileage_ratio <= 1.5:  # 稍高里程
-            return 0.7
-        else:  # 高里程
-            return 0.4
-
-    @staticmethod
-    def _calculate_completeness_score(car: CarListing) -> float:
-        """计算数据完整性评分 (0-1)"""
-        score = 0.0
-
-        if car.title and len(car.title.strip()) > 10:
-            score += 0.3
-        if car.price and car.price.strip():
-            score += 0.3
-        if car.year and car.year > 0:
-            score += 0.2
-        if car.mileage and car.mileage.strip():
-            score += 0.1
-        if car.location and car.location.strip():
-            score += 0.1
-
-        return score
-
-    @staticmethod
-    def _calculate_platform_score(
-        car: CarListing, platform_weights: Dict[str, float] = None
-    ) -> float:
-        """计算平台权重评分 (0-1)"""
-        if (
-            not platform_weights
-            or not hasattr(car, "platform")
-            or not car.platform
-        ):
-            return 0.5  # 默认中等评分
-
-        platform = car.platform.lower()
-        weight = platform_weights.get(platform, 0.5)
-
-        # 将权重转换为0-1评分
-        return min(max(weight, 0.0), 1.0)
+    def _platform_scores(
+        platform_weights: Dict[str, float] = None
+    ) -> Dict[str, float]:
+        """将平台权重转换为0-1评分，每次评分只转换一次"""
+        if not platform_weights:
+            return {}
+        return {
+            platform: min(max(weight, 0.0), 1.0)
+            for platform, weight in platform_weights.items()
+        }
 
     # ============================================================================
     # 辅助方法
@@ -321,11 +380,7 @@ class CarSelectionUtils:
             return None
 
         # 移除货币符号和逗号
-        price_clean = re.sub(r"[^\d.]", "", price_str)
-        try:
-            return float(price_clean)
-        except ValueError:
-            return None
+        return _parse_number(price_str)
 
     @staticmethod
     def _parse_mileage(mileage_str: str) -> float:
@@ -334,11 +389,7 @@ class CarSelectionUtils:
             return None
 
         # 移除单位和逗号
-        mileage_clean = re.sub(r"[^\d.]", "", mileage_str)
-        try:
-            return float(mileage_clean)
-        except ValueError:
-            return None
+        return _parse_number(mileage_str)
 
     @staticmethod
     def _is_reasonable_price(year: int, price: float) -> bool:
@@ -371,62 +422,6 @@ class CarSelectionUtils:
 
         return min_reasonable_mileage <= mileage <= max_reasonable_mileage
 
-    @staticmethod
-    def _get_base_price_for_year(year: int) -> float:
-        """获取某年份的基础价格"""
-        if year >= 2022:
-            return 35000
-        elif year >= 2020:
-            return 28000
-        elif year >= 2018:
-            return 22000
-        elif year >= 2015:
-            return 18000
-        elif year >= 2012:
-            return 12000
-        else:
-            return 8000
-
-    @staticmethod
-    def _get_mileage_factor(car: CarListing) -> float:
-        """获取里程影响因子"""
-        mileage_value = CarSelectionUtils._parse_mileage(car.mileage)
-        if mileage_value is None:
-            return 1.0
-
-        age = 2024 - car.year
-        if age == 0:
-            return 1.0
-
-        expected_mileage = age * 15000
-        if expected_mileage == 0:
-            return 1.0
-
-        ratio = mileage_value / expected_mileage
-
-        if ratio <= 0.5:
-            return 1.2  # 低里程，价格可以高一些
-        elif ratio <= 1.0:
-            return 1.0  # 正常里程
-        elif ratio <= 1.5:
-            return 0.8  # 高里程，价格应该低一些
-        else:
-            return 0.6  # 很高里程
-
-    @staticmethod
-    def _get_price_range(price: float) -> str:
-        """获取价格区间"""
-        if price < 10000:
-            return "under_10k"
-        elif price < 20000:
-            return "10k_20k"
-        elif price < 30000:
-            return "20k_30k"
-        elif price < 50000:
-            return "30k_50k"
-        else:
-            return "over_50k"
-
     @staticmethod
     def _get_year_range(year: int) -> str:
         """获取年份区间"""
@@ -5,11 +5,20 @@ Profile管理工具 - 管理Chrome浏览器配置文件
 采用函数式设计，无默认值原则。
 """
 
+import os
+import random
 import shutil
+import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
 
+from app.utils.core.path_util import get_chrome_profiles_dir, get_tmp_dir
+
+# 清理旧profile时并行删除目录的线程数
+_CLEANUP_WORKERS = 8
+
 
 def generate_daily_profile_name(prefix: str) -> str:
     """
@@ -25,9 +34,6 @@ def generate_daily_profile_name(prefix: str) -> str:
         >>> generate_daily_profile_name("test")
         "test_20240127_abc123"
     """
-    import random
-    import string
-
     # 获取当前日期
     date_str = datetime.now().strftime("%Y%m%d")
 
@@ -47,8 +53,6 @@ def ensure_profile_exists(profile_name: str) -> str:
     Returns:
         profile目录路径
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     profile_path = profiles_dir / profile_name
 
@@ -73,8 +77,6 @@ def delete_profile(profile_name: str) -> bool:
     Returns:
         是否删除成功
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     profile_path = profiles_dir / profile_name
 
@@ -98,29 +100,37 @@ def cleanup_old_profiles(days_old: int) -> int:
     Returns:
         清理的profile数量
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
 
     if not profiles_dir.exists():
         return 0
 
-    cutoff_time = datetime.now() - timedelta(days=days_old)
-    cleaned_count = 0
+    cutoff_time = (datetime.now() - timedelta(days=days_old)).timestamp()
+    expired_names = []
 
-    for profile_path in profiles_dir.iterdir():
-        if profile_path.is_dir():
-            # 检查profile的创建时间
+    # scandir 读取目录时已带回文件类型和stat信息，不必逐个再调用stat
+    with os.scandir(profiles_dir) as entries:
+        for entry in entries:
             try:
-                profile_time = datetime.fromtimestamp(profile_path.stat().st_mtime)
-                if profile_time < cutoff_time:
-                    if delete_profile(profile_path.name):
-                        cleaned_count += 1
-            except Exception:
-                # 如果无法获取时间或删除失败，跳过
+                # 检查profile的修改时间
+                if (
+                    entry.is_dir(follow_symlinks=False)
+                    and entry.stat(follow_symlinks=False).st_mtime
+                    < cutoff_time
+                ):
+                    expired_names.append(entry.name)
+            except OSError:
+                # 如果无法获取时间，跳过
                 continue
 
-    return cleaned_count
+    if not expired_names:
+        return 0
+
+    # 各profile的删除互不相关，并行执行
+    with ThreadPoolExecutor(
+        max_workers=min(_CLEANUP_WORKERS, len(expired_names))
+    ) as executor:
+        return sum(executor.map(delete_profile, expired_names))
 
 
 def list_profiles() -> List[str]:
@@ -130,17 +140,17 @@ def list_profiles() -> List[str]:
     Returns:
         profile名称列表
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
 
     if not profiles_dir.exists():
         return []
 
-    profiles = []
-    for profile_path in profiles_dir.iterdir():
-        if profile_path.is_dir():
-            profiles.append(profile_path.name)
+    with os.scandir(profiles_dir) as entries:
+        profiles = [
+            entry.name
+            for entry in entries
+            if entry.is_dir()
+        ]
 
     return sorted(profiles)
 
@@ -155,8 +165,6 @@ def get_profile_info(profile_name: str) -> dict:
     Returns:
         profile信息字典
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     profile_path = profiles_dir / profile_name
 
@@ -209,8 +217,6 @@ def copy_profile(source_profile: str, target_profile: str) -> bool:
     Returns:
         是否复制成功
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     source_path = profiles_dir / source_profile
     target_path = profiles_dir / target_profile
@@ -241,8 +247,6 @@ def backup_profile(profile_name: str, backup_dir: Optional[Path] = None) -> Opti
     Returns:
         备份文件路径，如果失败则返回None
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir, get_tmp_dir
-
     profiles_dir = get_chrome_profiles_dir()
     profile_path = profiles_dir / profile_name
 
@@ -284,8 +288,6 @@ def restore_profile(backup_path: Path, profile_name: str) -> bool:
     Returns:
         是否恢复成功
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     if not backup_path.exists():
         return False
 
@@ -322,8 +324,6 @@ def clean_profile_data(profile_name: str) -> bool:
     Returns:
         是否清理成功
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     profile_path = profiles_dir / profile_name
 
@@ -369,8 +369,6 @@ def is_profile_in_use(profile_name: str) -> bool:
     Returns:
         是否正在使用
     """
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     profile_path = profiles_dir / profile_name
 
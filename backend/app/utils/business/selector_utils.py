@@ -9,9 +9,51 @@ CarGurus 选择器工具类
 4. 支持选择器的版本管理
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from enum import Enum
 
+# =============================================================================
+# 静态选择器 - 模块加载时构建一次，get_*_selectors() 返回其副本
+# =============================================================================
+
+_MODEL_SELECTORS: Tuple[str, ...] = (
+    # 高成功率选择器（基于实际测试）
+    "//div[@id='MakeAndModel-accordion-content']//button[contains(@value, '/')]",
+    "//select[@name='makeModelTrimPaths']//option[contains(@value, '/')]",
+
+    # 备用选择器
+    "//div[contains(@class, '_accordionContent_')]//button[contains(@value, '/')]",
+    "//a[contains(@href, 'makeModelTrimPaths') and contains(@href, '/')]"
+)
+
+_MODEL_BUTTON_SELECTORS: Tuple[str, ...] = (
+    # 高成功率选择器
+    "//button[@id='MakeAndModel-accordion-trigger']",
+    "//button[contains(@class, '_accordionTrigger_')]",
+
+    # 备用选择器
+    "//button[@aria-controls='MakeAndModel-accordion-content']",
+    "//button[contains(text(), 'Make & model')]"
+)
+
+_SHOW_ALL_MODELS_BUTTON_SELECTORS: Tuple[str, ...] = (
+    # 高成功率选择器
+    "//button[contains(@class, '_toggleShowAllButton_')]",
+    "//button[contains(@class, 'lOGaE')]",
+
+    # 备用选择器
+    "//button[contains(text(), 'Show all models')]",
+    "//button[contains(text(), 'Show all')]"
+)
+
+_CAR_LISTING_SELECTORS: Tuple[str, ...] = (
+    "//a[@data-testid='car-blade-link']",
+    "//a[contains(@href, '/cars/')]",
+    "//div[contains(@class, 'listing')]//a",
+    "//div[contains(@data-testid, 'listing')]//a"
+)
+
 
 class SelectorType(Enum):
     """选择器类型枚举"""
@@ -39,41 +81,17 @@ class CarGurusSelectors:
     @staticmethod
     def get_model_selectors() -> List[str]:
         """获取车型选择器列表 - 精简版，按成功率排序"""
-        return [
-            # 高成功率选择器（基于实际测试）
-            "//div[@id='MakeAndModel-accordion-content']//button[contains(@value, '/')]",
-            "//select[@name='makeModelTrimPaths']//option[contains(@value, '/')]",
-            
-            # 备用选择器
-            "//div[contains(@class, '_accordionContent_')]//button[contains(@value, '/')]",
-            "//a[contains(@href, 'makeModelTrimPaths') and contains(@href, '/')]"
-        ]
+        return list(_MODEL_SELECTORS)
     
     @staticmethod
     def get_model_button_selectors() -> List[str]:
         """获取车型按钮选择器列表 - 精简版"""
-        return [
-            # 高成功率选择器
-            "//button[@id='MakeAndModel-accordion-trigger']",
-            "//button[contains(@class, '_accordionTrigger_')]",
-            
-            # 备用选择器
-            "//button[@aria-controls='MakeAndModel-accordion-content']",
-            "//button[contains(text(), 'Make & model')]"
-        ]
+        return list(_MODEL_BUTTON_SELECTORS)
     
     @staticmethod
     def get_show_all_models_button_selectors() -> List[str]:
         """获取"显示所有车型"按钮选择器列表 - 精简版"""
-        return [
-            # 高成功率选择器
-            "//button[contains(@class, '_toggleShowAllButton_')]",
-            "//button[contains(@class, 'lOGaE')]",
-            
-            # 备用选择器
-            "//button[contains(text(), 'Show all models')]",
-            "//button[contains(text(), 'Show all')]"
-        ]
+        return list(_SHOW_ALL_MODELS_BUTTON_SELECTORS)
     
     # =============================================================================
     # 车源选择器 - 用于搜索和提取车源信息
@@ -82,12 +100,7 @@ class CarGurusSelectors:
     @staticmethod
     def get_car_listing_selectors() -> List[str]:
         """获取车源列表选择器"""
-        return [
-            "//a[@data-testid='car-blade-link']",
-            "//a[contains(@href, '/cars/')]",
-            "//div[contains(@class, 'listing')]//a",
-            "//div[contains(@data-testid, 'listing')]//a"
-        ]
+        return list(_CAR_LISTING_SELECTORS)
     
     @staticmethod
     def get_car_detail_selectors() -> Dict[str, str]:
@@ -217,6 +230,12 @@ class CarGurusSelectors:
         cls._selector_cache[selector_type] = optimized_selectors
         return optimized_selectors
     
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_union_xpath(selectors: Tuple[str, ...]) -> str:
+        """获取选择器列表的并集XPath，相同的选择器组合只拼接一次"""
+        return " | ".join(selectors)
+
     @classmethod
     def update_selector_success(cls, selector: str, success: bool):
         """更新选择器成功率统计"""
@@ -227,6 +246,13 @@ class CarGurusSelectors:
         if success:
             cls._selector_success_rate[selector]['success'] += 1
     
+    @classmethod
+    def sort_by_success_rate(cls, selectors: List[str]) -> List[str]:
+        """按历史成功率从高到低排序选择器，成功率相同时保持原有顺序"""
+        return sorted(
+            selectors, key=lambda s: -cls._get_selector_success_rate(s)
+        )
+
     @classmethod
     def _get_selector_success_rate(cls, selector: str) -> float:
         """获取选择器成功率"""
@@ -5,14 +5,77 @@ Supabase 配置数据工具 - 管理爬虫相关的配置数据
 提供城市映射、品牌映射等配置数据的统一管理。
 """
 
-from functools import lru_cache
-from typing import Dict, List
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from app.utils.core.config import Config
 
+# 配置数据快照的有效期（秒），过期后下次访问时重新加载
+_SNAPSHOT_TTL = 600
+
+
+@dataclass
+class _ConfigSnapshot:
+    """配置表的内存快照，键均为小写名称"""
+
+    # 城市名 -> ZIP代码列表（主ZIP在前）
+    city_zips: Dict[str, List[str]] = field(default_factory=dict)
+    # 品牌名（英文或中文映射名） -> 品牌代码
+    make_codes: Dict[str, Optional[str]] = field(default_factory=dict)
+    # (品牌名, 型号名)（英文或中文映射名） -> 型号代码
+    model_codes: Dict[Tuple[str, str], Optional[str]] = field(
+        default_factory=dict
+    )
+
+
+# 查询都按 LOWER(列) 比较，普通索引用不上，需要对应的表达式索引
+_LOWER_NAME_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_cities_lower_name "
+    "ON cities (LOWER(name))",
+    "CREATE INDEX IF NOT EXISTS idx_car_makes_lower_make "
+    "ON car_makes (LOWER(make))",
+    "CREATE INDEX IF NOT EXISTS idx_car_models_lower_make_model "
+    "ON car_models (LOWER(make), LOWER(model))",
+    "CREATE INDEX IF NOT EXISTS idx_name_mappings_type_lower_chinese "
+    "ON name_mappings (type, LOWER(chinese_name))",
+    "CREATE INDEX IF NOT EXISTS idx_name_mappings_lower_english "
+    "ON name_mappings (LOWER(english_name))",
+)
+
+
+# database_url -> (快照, 上次加载时间)；同一数据库的所有实例共享快照，
+# 新建实例无需重新加载，也不会因缓存持有实例而无法释放引擎
+_snapshots: Dict[str, Tuple[Optional[_ConfigSnapshot], float]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _fresh_snapshot(
+    database_url: str,
+) -> Tuple[bool, Optional[_ConfigSnapshot]]:
+    """返回 (是否仍在有效期内, 快照)"""
+    entry = _snapshots.get(database_url)
+    if entry is None:
+        return False, None
+    snapshot, loaded_at = entry
+    return time.monotonic() - loaded_at < _SNAPSHOT_TTL, snapshot
+
+
+def _normalize_names(names: List[str]) -> List[str]:
+    """去掉空值并转为小写去重，作为批量查询的数组参数"""
+    return sorted(
+        {name.lower() for name in names if name and isinstance(name, str)}
+    )
+
+
+def _is_found(name: str, found) -> bool:
+    """判断名称（不区分大小写）是否在查询结果中"""
+    return bool(name and isinstance(name, str) and name.lower() in found)
+
 
 class SupabaseConfigUtils:
     """Supabase 配置工具类"""
@@ -37,12 +100,122 @@ class SupabaseConfigUtils:
         """关闭数据库连接"""
         self.engine.dispose()
 
-    @lru_cache(maxsize=128)
+    def create_indexes_if_not_exists(self):
+        """为按小写名称查询的列创建表达式索引（如果不存在）"""
+        with self.engine.begin() as conn:
+            for statement in _LOWER_NAME_INDEXES:
+                conn.execute(text(statement))
+
+    def refresh(self):
+        """丢弃内存中的配置快照，下次访问时重新从数据库加载"""
+        with _snapshots_lock:
+            _snapshots.pop(self.database_url, None)
+
+    def _get_snapshot(self) -> Optional[_ConfigSnapshot]:
+        """
+        获取配置快照，不存在或已过期时重新加载
+
+        配置表数据量小且很少变化，首次访问时整体加载到内存。
+        加载失败时继续使用旧快照（没有则返回None，由调用方回退到SQL查询），
+        并在一个有效期后再重试。
+        """
+        fresh, snapshot = _fresh_snapshot(self.database_url)
+        if fresh:
+            return snapshot
+
+        with _snapshots_lock:
+            fresh, snapshot = _fresh_snapshot(self.database_url)
+            if fresh:
+                return snapshot
+            try:
+                snapshot = self._load_snapshot()
+            except Exception as e:
+                print(f"Error loading config snapshot: {e}")
+            _snapshots[self.database_url] = (snapshot, time.monotonic())
+
+        return snapshot
+
+    def _load_snapshot(self) -> _ConfigSnapshot:
+        """用一个连接把城市、品牌、型号配置表整体读入内存"""
+        snapshot = _ConfigSnapshot()
+
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    """
+                SELECT LOWER(c.name), czc.zip_code 
+                FROM cities c
+                LEFT JOIN city_zip_codes czc ON c.id = czc.city_id
+                ORDER BY czc.is_primary DESC, czc.zip_code
+            """
+                )
+            )
+            for city, zip_code in result:
+                zips = snapshot.city_zips.setdefault(city, [])
+                if zip_code is not None:
+                    zips.append(zip_code)
+
+            # 英文名称优先，中文名称映射只补充英文名称中没有的键
+            result = conn.execute(
+                text(
+                    """
+                SELECT LOWER(make), make_code FROM car_makes
+            """
+                )
+            )
+            for make, make_code in result:
+                snapshot.make_codes.setdefault(make, make_code)
+
+            result = conn.execute(
+                text(
+                    """
+                SELECT LOWER(nm.chinese_name), cm.make_code 
+                FROM name_mappings nm
+                LEFT JOIN car_makes cm ON LOWER(cm.make) = LOWER(nm.english_name)
+                WHERE nm.type = 'make'
+            """
+                )
+            )
+            for make, make_code in result:
+                if snapshot.make_codes.get(make) is None:
+                    snapshot.make_codes[make] = make_code
+
+            result = conn.execute(
+                text(
+                    """
+                SELECT LOWER(make), LOWER(model), model_code FROM car_models
+            """
+                )
+            )
+            for make, model, model_code in result:
+                snapshot.model_codes.setdefault((make, model), model_code)
+
+            result = conn.execute(
+                text(
+                    """
+                SELECT LOWER(nm_make.chinese_name), LOWER(nm_model.chinese_name),
+                       cm.model_code
+                FROM name_mappings nm_make
+                JOIN name_mappings nm_model ON nm_make.type = 'make' AND nm_model.type = 'model'
+                JOIN car_models cm ON LOWER(cm.make) = LOWER(nm_make.english_name)
+                WHERE LOWER(cm.model) = LOWER(nm_model.english_name)
+            """
+                )
+            )
+            for make, model, model_code in result:
+                snapshot.model_codes.setdefault((make, model), model_code)
+
+        return snapshot
+
     def get_city_zip_codes(self, city_name: str) -> List[str]:
         """根据城市名称获取ZIP代码列表"""
         if not city_name or not isinstance(city_name, str):
             return []
 
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return list(snapshot.city_zips.get(city_name.lower(), ()))
+
         with self.engine.connect() as conn:
             try:
                 result = conn.execute(
@@ -63,52 +236,41 @@ class SupabaseConfigUtils:
                 print(f"Error getting city zip codes: {e}")
                 return []
 
-    @lru_cache(maxsize=128)
     def get_make_code(self, make_name: str) -> str:
         """根据品牌名称获取品牌代码"""
         if not make_name or not isinstance(make_name, str):
             return ""
 
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return snapshot.make_codes.get(make_name.lower()) or ""
+
         with self.engine.connect() as conn:
             try:
-                # 首先尝试直接查找
+                # 直接查找和中文到英文的映射合并为一条语句，直接查找优先
                 result = conn.execute(
                     text(
                         """
-                    SELECT make_code FROM car_makes 
+                    SELECT make_code, 1 AS priority FROM car_makes 
                     WHERE LOWER(make) = LOWER(:make_name)
-                """
-                    ),
-                    {"make_name": make_name},
-                )
-
-                row = result.fetchone()
-                if row:
-                    return row[0]
-
-                # 如果没找到，尝试中文到英文的映射
-                result = conn.execute(
-                    text(
-                        """
-                    SELECT cm.make_code 
+                    UNION ALL
+                    SELECT cm.make_code, 2 AS priority 
                     FROM name_mappings nm
                     JOIN car_makes cm ON LOWER(cm.make) = LOWER(nm.english_name)
                     WHERE nm.type = 'make' AND LOWER(nm.chinese_name) = LOWER(:make_name)
+                    ORDER BY priority
+                    LIMIT 1
                 """
                     ),
                     {"make_name": make_name},
                 )
 
                 row = result.fetchone()
-                if row:
-                    return row[0]
-
-                return ""
+                return row[0] if row else ""
             except Exception as e:
                 print(f"Error getting make code: {e}")
                 return ""
 
-    @lru_cache(maxsize=128)
     def get_model_code(self, make_name: str, model_name: str) -> str:
         """根据品牌名称和型号名称获取型号代码"""
         if (
@@ -119,45 +281,37 @@ class SupabaseConfigUtils:
         ):
             return ""
 
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            key = (make_name.lower(), model_name.lower())
+            return snapshot.model_codes.get(key) or ""
+
         with self.engine.connect() as conn:
             try:
-                # 首先尝试直接查找
+                # 直接查找和中文到英文的映射合并为一条语句，直接查找优先
                 result = conn.execute(
                     text(
                         """
-                    SELECT model_code FROM car_models 
+                    SELECT model_code, 1 AS priority FROM car_models 
                     WHERE LOWER(make) = LOWER(:make_name) 
                     AND LOWER(model) = LOWER(:model_name)
-                """
-                    ),
-                    {"make_name": make_name, "model_name": model_name},
-                )
-
-                row = result.fetchone()
-                if row:
-                    return row[0]
-
-                # 如果没找到，尝试中文到英文的映射
-                result = conn.execute(
-                    text(
-                        """
-                    SELECT cm.model_code 
+                    UNION ALL
+                    SELECT cm.model_code, 2 AS priority 
                     FROM name_mappings nm_make
                     JOIN name_mappings nm_model ON nm_make.type = 'make' AND nm_model.type = 'model'
                     JOIN car_models cm ON LOWER(cm.make) = LOWER(nm_make.english_name)
                     WHERE LOWER(nm_make.chinese_name) = LOWER(:make_name)
                     AND LOWER(nm_model.chinese_name) = LOWER(:model_name)
                     AND LOWER(cm.model) = LOWER(nm_model.english_name)
+                    ORDER BY priority
+                    LIMIT 1
                 """
                     ),
                     {"make_name": make_name, "model_name": model_name},
                 )
 
                 row = result.fetchone()
-                if row:
-                    return row[0]
-
-                return ""
+                return row[0] if row else ""
             except Exception as e:
                 print(f"Error getting model code: {e}")
                 return ""
@@ -223,57 +377,86 @@ class SupabaseConfigUtils:
         """验证城市名称是否有效"""
         if not city_name or not isinstance(city_name, str):
             return False
+        return self.validate_city_names([city_name]).get(city_name, False)
+
+    def validate_city_names(self, city_names: List[str]) -> Dict[str, bool]:
+        """批量验证城市名称，一次查询返回每个名称是否有效"""
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return {
+                name: _is_found(name, snapshot.city_zips)
+                for name in city_names
+            }
+
+        names = _normalize_names(city_names)
+        if not names:
+            return {name: False for name in city_names}
 
         with self.engine.connect() as conn:
             try:
+                # 每个名称找到第一条匹配即停止，不扫描全部匹配行
                 result = conn.execute(
                     text(
                         """
-                    SELECT COUNT(*) FROM cities 
-                    WHERE LOWER(name) = LOWER(:city_name)
+                    SELECT w.name FROM unnest(CAST(:names AS text[])) AS w(name)
+                    WHERE EXISTS (
+                        SELECT 1 FROM cities WHERE LOWER(name) = w.name
+                    )
                 """
                     ),
-                    {"city_name": city_name},
+                    {"names": names},
                 )
-                return result.fetchone()[0] > 0
+                found = {row[0] for row in result.fetchall()}
             except Exception as e:
-                print(f"Error validating city name: {e}")
-                return False
+                print(f"Error validating city names: {e}")
+                found = set()
+
+        return {name: _is_found(name, found) for name in city_names}
 
     def validate_make_name(self, make_name: str) -> bool:
         """验证品牌名称是否有效"""
         if not make_name or not isinstance(make_name, str):
             return False
+        return self.validate_make_names([make_name]).get(make_name, False)
+
+    def validate_make_names(self, make_names: List[str]) -> Dict[str, bool]:
+        """批量验证品牌名称（英文名或中文映射名），一次查询完成"""
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return {
+                name: _is_found(name, snapshot.make_codes)
+                for name in make_names
+            }
+
+        names = _normalize_names(make_names)
+        if not names:
+            return {name: False for name in make_names}
 
         with self.engine.connect() as conn:
             try:
-                # 检查英文名称
-                result = conn.execute(
-                    text(
-                        """
-                    SELECT COUNT(*) FROM car_makes 
-                    WHERE LOWER(make) = LOWER(:make_name)
-                """
-                    ),
-                    {"make_name": make_name},
-                )
-                if result.fetchone()[0] > 0:
-                    return True
-
-                # 检查中文名称映射
+                # 英文名称和中文名称映射在同一条语句中检查，
+                # 每个名称找到第一条匹配即停止
                 result = conn.execute(
                     text(
                         """
-                    SELECT COUNT(*) FROM name_mappings 
-                    WHERE type = 'make' AND LOWER(chinese_name) = LOWER(:make_name)
+                    SELECT w.name FROM unnest(CAST(:names AS text[])) AS w(name)
+                    WHERE EXISTS (
+                        SELECT 1 FROM car_makes WHERE LOWER(make) = w.name
+                    )
+                    OR EXISTS (
+                        SELECT 1 FROM name_mappings 
+                        WHERE type = 'make' AND LOWER(chinese_name) = w.name
+                    )
                 """
                     ),
-                    {"make_name": make_name},
+                    {"names": names},
                 )
-                return result.fetchone()[0] > 0
+                found = {row[0] for row in result.fetchall()}
             except Exception as e:
-                print(f"Error validating make name: {e}")
-                return False
+                print(f"Error validating make names: {e}")
+                found = set()
+
+        return {name: _is_found(name, found) for name in make_names}
 
     def validate_model_name(self, make_name: str, model_name: str) -> bool:
         """验证型号名称是否有效"""
@@ -284,41 +467,87 @@ class SupabaseConfigUtils:
             or not isinstance(model_name, str)
         ):
             return False
+        pair = (make_name, model_name)
+        return self.validate_model_names([pair]).get(pair, False)
+
+    def validate_model_names(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], bool]:
+        """
+        批量验证 (品牌, 型号) 名称组合，一次查询完成
+
+        Args:
+            pairs: (品牌名称, 型号名称) 列表，支持英文名或中文映射名
+
+        Returns:
+            每个组合是否有效
+        """
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            found = snapshot.model_codes
+        else:
+            found = self._query_model_pairs(pairs)
+
+        return {
+            (make, model): bool(
+                make
+                and model
+                and isinstance(make, str)
+                and isinstance(model, str)
+                and (make.lower(), model.lower()) in found
+            )
+            for make, model in pairs
+        }
+
+    def _query_model_pairs(self, pairs: List[Tuple[str, str]]) -> set:
+        """查询数据库中存在的 (品牌, 型号) 小写组合"""
+        valid_pairs = sorted(
+            {
+                (make.lower(), model.lower())
+                for make, model in pairs
+                if make
+                and model
+                and isinstance(make, str)
+                and isinstance(model, str)
+            }
+        )
+        if not valid_pairs:
+            return set()
 
         with self.engine.connect() as conn:
             try:
-                # 检查英文名称
+                # 两个数组按位置展开为 (品牌, 型号) 组合，
+                # 英文名称和中文名称映射在同一条语句中检查，
+                # 每个组合找到第一条匹配即停止
                 result = conn.execute(
                     text(
                         """
-                    SELECT COUNT(*) FROM car_models 
-                    WHERE LOWER(make) = LOWER(:make_name) 
-                    AND LOWER(model) = LOWER(:model_name)
-                """
-                    ),
-                    {"make_name": make_name, "model_name": model_name},
-                )
-                if result.fetchone()[0] > 0:
-                    return True
-
-                # 检查中文名称映射
-                result = conn.execute(
-                    text(
-                        """
-                    SELECT COUNT(*) FROM name_mappings nm_make
-                    JOIN name_mappings nm_model ON nm_make.type = 'make' AND nm_model.type = 'model'
-                    JOIN car_models cm ON LOWER(cm.make) = LOWER(nm_make.english_name)
-                    WHERE LOWER(nm_make.chinese_name) = LOWER(:make_name)
-                    AND LOWER(nm_model.chinese_name) = LOWER(:model_name)
-                    AND LOWER(cm.model) = LOWER(nm_model.english_name)
+                    SELECT w.make, w.model FROM unnest(
+                        CAST(:makes AS text[]), CAST(:models AS text[])
+                    ) AS w(make, model)
+                    WHERE EXISTS (
+                        SELECT 1 FROM car_models 
+                        WHERE LOWER(make) = w.make AND LOWER(model) = w.model
+                    )
+                    OR EXISTS (
+                        SELECT 1 FROM name_mappings nm_make
+                        JOIN name_mappings nm_model ON nm_make.type = 'make' AND nm_model.type = 'model'
+                        JOIN car_models cm ON LOWER(cm.make) = LOWER(nm_make.english_name)
+                        WHERE LOWER(nm_make.chinese_name) = w.make
+                        AND LOWER(nm_model.chinese_name) = w.model
+                        AND LOWER(cm.model) = LOWER(nm_model.english_name)
+                    )
                 """
                     ),
-                    {"make_name": make_name, "model_name": model_name},
+                    {
+                        "makes": [make for make, _ in valid_pairs],
+                        "models": [model for _, model in valid_pairs],
+                    },
                 )
-                return result.fetchone()[0] > 0
+                return {(row[0], row[1]) for row in result.fetchall()}
             except Exception as e:
-                print(f"Error validating model name: {e}")
-                return False
+                print(f"Error validating model names: {e}")
+                return set()
 
     def get_all_makes_with_models(self) -> List[str]:
         """获取所有有型号数据的品牌列表"""
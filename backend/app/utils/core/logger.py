@@ -1,6 +1,73 @@
+import atexit
+import functools
 import inspect
 import logging
+import os
+import queue
+import random
+import socket
 import threading
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, SysLogHandler
+
+import orjson
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """队列已满时丢弃日志记录，避免阻塞调用方"""
+
+    def prepare(self, record):
+        # 默认实现会在调用方线程里格式化消息；这里原样入队，
+        # 消息拼接、时间格式化都交给后台线程中的处理器完成。
+        # 队列只在进程内使用，记录无需可序列化
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _KVPayload:
+    """结构化日志字段，转换为字符串时才序列化为JSON"""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: dict):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return orjson.dumps(self.fields, default=str).decode("utf-8")
+
+
+# 非错误日志的采样率（0-1），默认全部保留；高负载时可通过环境变量调低
+_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+# 完全相同的日志在该时间窗口（秒）内只记录一次，避免热点路径刷屏
+_RATE_LIMIT_WINDOW = 0.1
+_RATE_LIMIT_MAX_KEYS = 1024
+
+
+def _create_syslog_handler():
+    """
+    按 LOG_SYSLOG_ADDRESS 环境变量（如 /dev/log）创建syslog数据报处理器
+
+    未配置、套接字不存在或连接失败时返回None，继续使用文件处理器。
+    日志写入磁盘由 rsyslog 负责，需要在 rsyslog 中把 local0 设施
+    路由到日志文件。
+    """
+    address = os.getenv("LOG_SYSLOG_ADDRESS")
+    if not address or not os.path.exists(address):
+        return None
+    try:
+        return SysLogHandler(
+            address=address,
+            facility=SysLogHandler.LOG_LOCAL0,
+            socktype=socket.SOCK_DGRAM,
+        )
+    except OSError:
+        return None
 
 
 class KeyPointLogger:
@@ -9,6 +76,9 @@ class KeyPointLogger:
     def __init__(self):
         self.sequence_counter = 0
         self.lock = threading.Lock()
+        # 日志内容 -> 上次记录的时间，用于丢弃短时间内的重复日志
+        self._last_emit = {}
+        self.listener = None
         self.logger = self._setup_logger()
 
     def _setup_logger(self):
@@ -25,26 +95,63 @@ class KeyPointLogger:
         # 清除现有处理器，避免重复
         logger.handlers.clear()
 
-        # 文件处理器
-        file_handler = logging.FileHandler(
-            str(log_file_path), encoding="utf-8"
-        )
+        # 文件处理器和控制台处理器在后台线程中写入，
+        # 调用方只把日志记录放入队列，不在事件循环中做磁盘/终端I/O
         formatter = logging.Formatter(
             "%(asctime)s | %(sequence)s | %(call_stack)s | %(message)s"
         )
+        # 配置了syslog时发送数据报给 rsyslog 落盘，否则直接写日志文件
+        file_handler = _create_syslog_handler()
+        if file_handler is None:
+            file_handler = logging.FileHandler(
+                str(log_file_path), encoding="utf-8"
+            )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
         # 控制台处理器
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+
+        log_queue = queue.Queue(maxsize=10000)
+        logger.addHandler(_DroppingQueueHandler(log_queue))
+        self.listener = QueueListener(
+            log_queue,
+            file_handler,
+            console_handler,
+            respect_handler_level=True,
+        )
+        self.listener.start()
+        # 进程退出时写完队列中剩余的日志
+        atexit.register(self.stop)
 
         # 禁用传播到根日志器，避免重复记录
         logger.propagate = False
 
         return logger
 
+    def stop(self):
+        """停止后台日志线程，写完队列中剩余的日志"""
+        if self.listener is not None:
+            listener, self.listener = self.listener, None
+            listener.stop()
+
+    def _should_emit(self, key) -> bool:
+        """按采样率和重复日志限流决定是否记录本条关键日志"""
+        if _SAMPLE_RATE < 1.0 and random.random() >= _SAMPLE_RATE:
+            return False
+        try:
+            last = self._last_emit.get(key)
+        except TypeError:
+            # 参数不可哈希时无法判断重复，直接记录
+            return True
+        now = time.monotonic()
+        if last is not None and now - last < _RATE_LIMIT_WINDOW:
+            return False
+        if len(self._last_emit) >= _RATE_LIMIT_MAX_KEYS:
+            self._last_emit.clear()
+        self._last_emit[key] = now
+        return True
+
     def _get_next_sequence(self):
         """获取下一个执行序号"""
         with self.lock:
@@ -66,20 +173,60 @@ class KeyPointLogger:
 
         return f"{package_path}.{function_name}:{line_number}"
 
-    def log_result(self, conclusion: str, reason: str = ""):
-        """只在关键部位记录日志"""
+    def log_result(self, conclusion: str, reason: str = "", *args):
+        """
+        只在关键部位记录日志
+
+        reason 可以是 %-style 格式串，args 为其参数；格式化推迟到后台
+        日志线程中进行，INFO级别未启用时直接返回，不构建任何字符串。
+        完全相同的日志在短时间内重复出现时只记录第一条。
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if not self._should_emit((conclusion, reason, args)):
+            return
+
         sequence = self._get_next_sequence()
         call_stack = self._get_call_stack()
 
-        if reason:
+        if args:
+            # 结论部分原样输出，避免其中的 % 被当作格式符
+            message = conclusion.replace("%", "%%") + " - " + reason
+        elif reason:
             message = f"{conclusion} - {reason}"
         else:
             message = conclusion
 
         self.logger.info(
-            message, extra={"sequence": sequence, "call_stack": call_stack}
+            message,
+            *args,
+            extra={"sequence": sequence, "call_stack": call_stack},
         )
 
+    def log_result_kv(self, conclusion: str, **fields):
+        """结构化记录关键结果，INFO级别未启用时直接返回，不做任何格式化"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if not self._should_emit((conclusion, tuple(fields.items()))):
+            return
+
+        sequence = self._get_next_sequence()
+        call_stack = self._get_call_stack()
+
+        if fields:
+            # JSON序列化推迟到后台日志线程格式化消息时进行
+            self.logger.info(
+                "%s - %s",
+                conclusion,
+                _KVPayload(fields),
+                extra={"sequence": sequence, "call_stack": call_stack},
+            )
+        else:
+            self.logger.info(
+                conclusion,
+                extra={"sequence": sequence, "call_stack": call_stack},
+            )
+
     def error(self, message: str):
         """记录错误日志"""
         sequence = self._get_next_sequence()
@@ -121,6 +268,64 @@ class KeyPointLogger:
 logger = KeyPointLogger()
 
 
+# 当前 traced 调用收集的结构化字段，在调用结束时随耗时日志一起输出
+_trace_fields: ContextVar = ContextVar("trace_fields", default=None)
+
+
+def annotate(**fields):
+    """
+    向当前 traced 调用追加结构化字段，不单独产生日志记录
+
+    不在 traced 调用中时忽略。
+    """
+    current = _trace_fields.get()
+    if current is not None:
+        current.update(fields)
+
+
+def traced(tag: str):
+    """
+    异步函数耗时追踪装饰器：函数结束时记录一条带耗时的关键日志
+
+    函数执行期间通过 annotate 记录的字段会合并到这一条日志中。
+
+    Args:
+        tag: 日志结论中使用的名称
+    """
+
+    def decorator(fn):
+        call_stack = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            status = "异常"
+            fields = {}
+            token = _trace_fields.set(fields)
+            try:
+                result = await fn(*args, **kwargs)
+                status = "完成"
+                return result
+            finally:
+                _trace_fields.reset(token)
+                if logger.logger.isEnabledFor(logging.INFO):
+                    logger.logger.info(
+                        "%s%s - 耗时 %.1fms - %s",
+                        tag,
+                        status,
+                        (time.perf_counter() - start) * 1000,
+                        _KVPayload(fields),
+                        extra={
+                            "sequence": logger._get_next_sequence(),
+                            "call_stack": call_stack,
+                        },
+                    )
+
+        return wrapper
+
+    return decorator
+
+
 # 兼容性函数
 def get_logger(name: str = "key_points"):
     """获取日志器实例（保持向后兼容）"""
@@ -8,10 +8,119 @@
 import re
 from typing import Dict, List, Optional
 
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
 from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+# =============================================================================
+# 车源字段选择器 - 使用CarGurus实际的选择器
+# =============================================================================
+
+TITLE_SELECTORS = (
+    ".//div[@data-testid='srp-tile-listing-title']//h4",
+    ".//h4[@data-cg-ft='srp-listing-blade-title']",
+    ".//h4[contains(@class, '_titleText_')]",
+    ".//div[contains(@class, 'title')]",
+    ".//h3[@class='title']",
+    ".//h3",
+    ".//h2",
+    ".//h1",
+    ".//span[contains(@class, 'title')]",
+    ".//a[contains(@class, 'title')]",
+)
+
+PRICE_SELECTORS = (
+    ".//h4[@data-testid='srp-tile-price']",
+    ".//h4[@data-cg-ft='srp-listing-blade-price']",
+    ".//h4[contains(@class, '_priceText_')]",
+    ".//span[contains(text(), '$')]",
+    ".//div[contains(text(), '$')]",
+    ".//span[@class='price']",
+    ".//span[contains(@class, 'price')]",
+    ".//div[contains(@class, 'price')]",
+)
+
+MILEAGE_SELECTORS = (
+    ".//p[@data-testid='srp-tile-mileage']",
+    ".//p[contains(@class, '_leftColumnContent_')]",
+    ".//span[contains(text(), 'km')]",
+    ".//div[contains(text(), 'km')]",
+    ".//span[contains(text(), 'mile')]",
+    ".//div[contains(text(), 'mile')]",
+    ".//span[@class='mileage']",
+    ".//span[contains(@class, 'mileage')]",
+    ".//div[contains(@class, 'mileage')]",
+)
+
+LOCATION_SELECTORS = (
+    ".//span[contains(@class, 'location')]",
+    ".//div[contains(@class, 'location')]",
+    ".//span[contains(@class, 'city')]",
+    ".//div[contains(@class, 'city')]",
+)
+
+URL_SELECTORS = (
+    ".//a[@data-testid='car-blade-link']",
+    ".//a[contains(@href, '/Cars/inventorylisting/viewDetailsFilterViewInventoryListing.action')]",
+    ".//a[contains(@href, '/Cars/inventorylisting/')]",
+    ".//a[contains(@href, '/Cars/')]",
+    ".//a[@href]",
+)
+
+# 预编译的 lxml XPath，模块加载时编译一次
+_TITLE_XPATHS = tuple(etree.XPath(s) for s in TITLE_SELECTORS)
+_PRICE_XPATHS = tuple(etree.XPath(s) for s in PRICE_SELECTORS)
+_MILEAGE_XPATHS = tuple(etree.XPath(s) for s in MILEAGE_SELECTORS)
+_LOCATION_XPATHS = tuple(etree.XPath(s) for s in LOCATION_SELECTORS)
+_URL_XPATHS = tuple(etree.XPath(s) for s in URL_SELECTORS)
+
+# 返回listing的HTML、文档URL和车源链接。链接与 extract_listing_data_from_node
+# 的查找顺序一致：依次尝试各选择器，先在listing内、再在其父级元素内查找，
+# 父级元素中的兄弟链接在浏览器内解析，不必传回整个父级的HTML
+_LISTING_HTML_JS = """
+const el = arguments[0];
+const scopes = [el, el.parentElement];
+let url = '';
+search:
+for (const selector of arguments[1]) {
+    for (const scope of scopes) {
+        if (!scope) {
+            continue;
+        }
+        const node = document.evaluate(
+            selector, scope, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (node && node.getAttribute('href')) {
+            url = node.href;
+            break search;
+        }
+    }
+}
+return [el.outerHTML, document.baseURI, url];
+"""
+
+# 以元素为上下文依次求值各XPath，返回首个非空文本，一次浏览器调用完成
+_FIRST_TEXT_JS = """
+const root = arguments[0];
+for (const selector of arguments[1]) {
+    let node;
+    try {
+        node = document.evaluate(
+            selector, root, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {
+        continue;
+    }
+    const text = node ? (node.innerText || '').trim() : '';
+    if (text) {
+        return text;
+    }
+}
+return '';
+"""
+
 
 def safe_text_multiple_selectors(
     element: WebElement, selectors: List[str]
@@ -19,6 +128,9 @@ def safe_text_multiple_selectors(
     """
     使用多个选择器安全提取文本
 
+    逐个选择器调用 find_elements / .text 时每个选择器都要两次
+    WebDriver往返；这里在浏览器内一次性依次尝试全部选择器。
+
     Args:
         element: WebElement对象
         selectors: 选择器列表
@@ -26,120 +138,99 @@ def safe_text_multiple_selectors(
     Returns:
         提取到的文本，如果没有找到则返回空字符串
     """
-    for selector in selectors:
-        try:
-            elements = element.find_elements(By.XPATH, selector)
-            if elements:
-                text = elements[0].text.strip()
-                if text:
-                    return text
-        except Exception:
-            continue
-    return ""
+    try:
+        text = element.parent.execute_script(
+            _FIRST_TEXT_JS, element, list(selectors)
+        )
+    except Exception:
+        return ""
+    return text or ""
 
 
 def extract_listing_data(listing: WebElement) -> Dict[str, str]:
     """
     提取单个listing的数据
 
+    逐个选择器调用 find_elements / .text / get_attribute，每次都是一次
+    WebDriver往返。这里只用一次 execute_script 取回listing的HTML和
+    车源链接（链接可能在父级元素中，在浏览器内查找），其余字段解析
+    交给 extract_listing_data_from_node 在本地完成。
+
     Args:
         listing: Selenium WebElement对象
 
     Returns:
         包含提取数据的字典
+    """
+    html, base_url, url = listing.parent.execute_script(
+        _LISTING_HTML_JS, listing, list(URL_SELECTORS)
+    )
+    root = lxml_html.fromstring(html, base_url=base_url)
+    root.make_links_absolute()
+    data = extract_listing_data_from_node(root)
+    data["url"] = url
+    return data
+
 
-    Raises:
-        NoSuchElementException: 当必需元素不存在时
+def safe_node_text_multiple_xpaths(
+    node: HtmlElement, xpaths: tuple
+) -> str:
     """
-    data = {}
+    使用多个预编译XPath从lxml节点安全提取文本
 
-    # 提取标题 - 使用CarGurus实际的选择器
-    title_selectors = [
-        ".//div[@data-testid='srp-tile-listing-title']//h4",
-        ".//h4[@data-cg-ft='srp-listing-blade-title']",
-        ".//h4[contains(@class, '_titleText_')]",
-        ".//div[contains(@class, 'title')]",
-        ".//h3[@class='title']",
-        ".//h3",
-        ".//h2",
-        ".//h1",
-        ".//span[contains(@class, 'title')]",
-        ".//a[contains(@class, 'title')]",
-    ]
-    data["title"] = safe_text_multiple_selectors(listing, title_selectors)
-
-    # 提取价格 - 使用CarGurus实际的选择器
-    price_selectors = [
-        ".//h4[@data-testid='srp-tile-price']",
-        ".//h4[@data-cg-ft='srp-listing-blade-price']",
-        ".//h4[contains(@class, '_priceText_')]",
-        ".//span[contains(text(), '$')]",
-        ".//div[contains(text(), '$')]",
-        ".//span[@class='price']",
-        ".//span[contains(@class, 'price')]",
-        ".//div[contains(@class, 'price')]",
-    ]
-    data["price"] = safe_text_multiple_selectors(listing, price_selectors)
-
-    # 提取里程 - 使用CarGurus实际的选择器
-    mileage_selectors = [
-        ".//p[@data-testid='srp-tile-mileage']",
-        ".//p[contains(@class, '_leftColumnContent_')]",
-        ".//span[contains(text(), 'km')]",
-        ".//div[contains(text(), 'km')]",
-        ".//span[contains(text(), 'mile')]",
-        ".//div[contains(text(), 'mile')]",
-        ".//span[@class='mileage']",
-        ".//span[contains(@class, 'mileage')]",
-        ".//div[contains(@class, 'mileage')]",
-    ]
-    data["mileage"] = safe_text_multiple_selectors(listing, mileage_selectors)
+    Args:
+        node: lxml HTML节点
+        xpaths: 预编译的 etree.XPath 元组
 
-    # 提取年份 - 从标题中提取
-    data["year"] = extract_year_from_title(data.get("title", ""))
+    Returns:
+        提取到的文本，如果没有找到则返回空字符串
+    """
+    for xpath in xpaths:
+        matches = xpath(node)
+        if matches:
+            text = clean_text(matches[0].text_content())
+            if text:
+                return text
+    return ""
 
-    # 提取位置 - 使用CarGurus实际的选择器
-    location_selectors = [
-        ".//span[contains(@class, 'location')]",
-        ".//div[contains(@class, 'location')]",
-        ".//span[contains(@class, 'city')]",
-        ".//div[contains(@class, 'city')]",
-    ]
-    data["location"] = safe_text_multiple_selectors(
-        listing, location_selectors
-    )
 
-    # 提取链接 - 查找包含车源卡片的链接
-    url_selectors = [
-        ".//a[@data-testid='car-blade-link']",
-        ".//a[contains(@href, '/Cars/inventorylisting/viewDetailsFilterViewInventoryListing.action')]",
-        ".//a[contains(@href, '/Cars/inventorylisting/')]",
-        ".//a[contains(@href, '/Cars/')]",
-        ".//a[@href]",
-    ]
+def extract_listing_data_from_node(node: HtmlElement) -> Dict[str, str]:
+    """
+    从lxml节点提取单个listing的数据
+
+    与 extract_listing_data 字段一致，但全部在本地解析，
+    不产生任何 WebDriver 往返调用。节点所在文档应已调用
+    make_links_absolute()，以便返回完整的车源链接。
 
-    # 尝试从当前元素或其父级元素中提取链接
+    Args:
+        node: lxml HTML节点
+
+    Returns:
+        包含提取数据的字典
+    """
+    data = {}
+
+    data["title"] = safe_node_text_multiple_xpaths(node, _TITLE_XPATHS)
+    data["price"] = safe_node_text_multiple_xpaths(node, _PRICE_XPATHS)
+    data["mileage"] = safe_node_text_multiple_xpaths(node, _MILEAGE_XPATHS)
+    data["year"] = extract_year_from_title(data.get("title", ""))
+    data["location"] = safe_node_text_multiple_xpaths(
+        node, _LOCATION_XPATHS
+    )
+
+    # 尝试从当前节点或其父级节点中提取链接
     data["url"] = ""
-    for selector in url_selectors:
-        try:
-            # 首先在当前元素中查找
-            elements = listing.find_elements(By.XPATH, selector)
-            if elements:
-                href = elements[0].get_attribute("href")
-                if href:
-                    data["url"] = href
-                    break
-
-            # 如果当前元素没有找到，尝试在父级元素中查找
-            parent = listing.find_element(By.XPATH, "./..")
-            elements = parent.find_elements(By.XPATH, selector)
-            if elements:
-                href = elements[0].get_attribute("href")
-                if href:
-                    data["url"] = href
-                    break
-        except Exception:
-            continue
+    parent = node.getparent()
+    for xpath in _URL_XPATHS:
+        for scope in (node, parent):
+            if scope is None:
+                continue
+            matches = xpath(scope)
+            if matches and matches[0].get("href"):
+                data["url"] = matches[0].get("href")
+                break
+        if data["url"]:
+            break
 
     return data
 
@@ -4,6 +4,7 @@
 使用asyncpg连接PostgreSQL数据库
 """
 
+import asyncio
 import os
 from typing import Any, Dict, List, Optional
 
@@ -27,7 +28,7 @@ class DatabaseUtils:
         """
         self.connection_string = connection_string or os.getenv("DATABASE_URL")
         self.is_connected = False
-        self.connection = None
+        self.pool = None
 
         if not self.connection_string:
             raise ValueError("DATABASE_URL环境变量未设置或连接字符串为空")
@@ -38,11 +39,15 @@ class DatabaseUtils:
         )
 
     async def connect(self):
-        """建立Supabase数据库连接"""
+        """建立Supabase数据库连接池"""
         try:
+            # 使用连接池，允许多个查询并发执行
             # 设置statement_cache_size为0来解决pgbouncer问题
-            self.connection = await asyncpg.connect(
-                self.connection_string, statement_cache_size=0
+            self.pool = await asyncpg.create_pool(
+                self.connection_string,
+                min_size=1,
+                max_size=5,
+                statement_cache_size=0,
             )
             self.is_connected = True
             logger.log_result("数据库连接成功", "Supabase PostgreSQL")
@@ -54,9 +59,9 @@ class DatabaseUtils:
     async def disconnect(self):
         """关闭数据库连接"""
         try:
-            if self.connection:
-                await self.connection.close()
-                self.connection = None
+            if self.pool:
+                await self.pool.close()
+                self.pool = None
             self.is_connected = False
             logger.log_result("数据库连接关闭", "Supabase PostgreSQL")
         except Exception as e:
@@ -82,9 +87,9 @@ class DatabaseUtils:
             logger.log_result("SQL执行", f"查询: {query[:100]}...")
 
             if params:
-                rows = await self.connection.fetch(query, *params.values())
+                rows = await self.pool.fetch(query, *params.values())
             else:
-                rows = await self.connection.fetch(query)
+                rows = await self.pool.fetch(query)
 
             return [dict(row) for row in rows]
 
@@ -386,14 +391,19 @@ class DatabaseUtils:
 
 # 全局数据库工具实例
 _db_util = None
+_db_util_lock = asyncio.Lock()
 
 
 async def get_db_util():
     """获取全局异步数据库工具实例"""
     global _db_util
     if _db_util is None:
-        _db_util = DatabaseUtils()
-        await _db_util.connect()
+        # 加锁避免并发调用时重复创建连接池
+        async with _db_util_lock:
+            if _db_util is None:
+                db_util = DatabaseUtils()
+                await db_util.connect()
+                _db_util = db_util
     return _db_util
 
 
@@ -14,6 +14,8 @@
 
 import csv
 import json
+import re
+import shutil
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 import logging
@@ -404,7 +406,6 @@ def copy_file(src_path: Union[str, Path],
         bool: 是否复制成功
     """
     try:
-        import shutil
         # 确保目标目录存在
         ensure_directory(Path(dst_path).parent)
         shutil.copy2(src_path, dst_path)
@@ -427,7 +428,6 @@ def move_file(src_path: Union[str, Path],
         bool: 是否移动成功
     """
     try:
-        import shutil
         # 确保目标目录存在
         ensure_directory(Path(dst_path).parent)
         shutil.move(src_path, dst_path)
@@ -470,7 +470,6 @@ def get_safe_filename(filename: str) -> str:
     Returns:
         str: 安全的文件名
     """
-    import re
     # 移除或替换非法字符
     safe_filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
     # 移除多余的空格和点号
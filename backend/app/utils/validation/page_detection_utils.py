@@ -8,10 +8,196 @@
 import json
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from app.utils.core.path_util import get_data_dir
 
+# 封禁页面的错误类名/ID特征，标签属性内匹配，不会跨越整个页面
+_BLOCK_ATTR_PATTERNS = (
+    (
+        re.compile(
+            r'<div[^>]*class="[^"]*(?:blocked|forbidden|error|not-found)[^"]*"',
+            re.IGNORECASE,
+        ),
+        "error_class",
+    ),
+    (
+        re.compile(
+            r'<div[^>]*id="[^"]*(?:blocked|forbidden|error|not-found)[^"]*"',
+            re.IGNORECASE,
+        ),
+        "error_id",
+    ),
+)
+
+# 封禁页面的标签内容特征：(标签名, 关键词, 原因)
+# 原先的 <tag>.*关键词.*</tag> 贪婪匹配在大页面上会反复回溯整页，
+# 这里改为按顺序查找，只需线性扫描
+_TAG_OPEN_RES = {
+    tag: re.compile(rf"<{tag}[^>]*>") for tag in ("title", "h1", "div")
+}
+_BLOCK_HEADING_PATTERNS = (
+    (
+        "title",
+        ("blocked", "forbidden", "access denied", "403", "404"),
+        "title_blocked",
+    ),
+    (
+        "h1",
+        ("blocked", "forbidden", "access denied", "403", "404"),
+        "h1_blocked",
+    ),
+)
+_BLOCK_CONTENT_PATTERNS = (
+    (
+        "div",
+        (
+            "access denied",
+            "access blocked",
+            "page not found",
+            "403 forbidden",
+            "404 not found",
+        ),
+        "error_content",
+    ),
+    (
+        "div",
+        (
+            "under maintenance",
+            "temporarily unavailable",
+            "service unavailable",
+        ),
+        "maintenance_page",
+    ),
+)
+
+_TITLE_RE = re.compile(
+    r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL
+)
+_HTML_TAG_RE = re.compile(r"<html[^>]*>", re.IGNORECASE)
+_BODY_TAG_RE = re.compile(r"<body[^>]*>", re.IGNORECASE)
+
+_ERROR_TITLES = (
+    "access denied",
+    "access blocked",
+    "forbidden",
+    "not found",
+    "page not found",
+    "error 403",
+    "error 404",
+    "temporarily unavailable",
+    "under maintenance",
+    "coming soon",
+)
+
+_BLOCK_CONTENT_INDICATORS = (
+    "你被封禁了",
+    "访问被拒绝",
+    "请求过于频繁",
+    "请稍后再试",
+    "ip被封禁",
+    "账号被封禁",
+    "访问受限",
+    "需要验证身份",
+)
+
+_BLOCK_PAGE_VEHICLE_INDICATORS = (
+    "vehicle",
+    "car",
+    "listing",
+    "price",
+    "mileage",
+    "year",
+    "make",
+    "model",
+)
+
+# 车辆不可用的指示器及其排除规则（CSS、占位图、UI控件中的匹配不算）
+_UNAVAILABLE_INDICATORS = (
+    "sold",
+    "no longer available",
+    "not available",
+    "removed",
+    "deleted",
+    "expired",
+    "withdrawn",
+    "discontinued",
+    "out of stock",
+    "no longer for sale",
+    "listing removed",
+    "vehicle sold",
+    "no longer listed",
+)
+_UNAVAILABLE_EXCLUDE_RES = {
+    indicator: (
+        re.compile(r"@keyframes.*" + re.escape(indicator), re.IGNORECASE),
+        re.compile(r"\." + re.escape(indicator) + r"\s*\{", re.IGNORECASE),
+        re.compile(r"placeholder.*" + re.escape(indicator), re.IGNORECASE),
+        re.compile(
+            r'data-state="[^"]*' + re.escape(indicator), re.IGNORECASE
+        ),
+    )
+    for indicator in _UNAVAILABLE_INDICATORS
+}
+_RIGHTS_RESERVED_RE = re.compile(r"rights reserved", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4)
+def _lower_page(page_html: str) -> str:
+    """
+    页面HTML的小写副本
+
+    同一页面会依次经过多个检测函数，每个都需要小写副本；缓存最近的
+    几个页面，整页HTML只转换一次。
+    """
+    return page_html.lower()
+
+
+def _tag_contains(page_lower: str, tag: str, keywords) -> bool:
+    """
+    判断页面中是否在某个开始标签之后依次出现关键词和对应的结束标签
+
+    与 <tag>.*(?:关键词).*</tag>（DOTALL）的匹配结果相同：取第一个
+    开始标签，再取其后最早结束的关键词，之后还有结束标签即命中。
+
+    Args:
+        page_lower: 小写后的页面HTML
+        tag: 标签名
+        keywords: 小写关键词序列
+
+    Returns:
+        是否命中
+    """
+    match = _TAG_OPEN_RES[tag].search(page_lower)
+    if not match:
+        return False
+    start = match.end()
+    keyword_end = -1
+    for keyword in keywords:
+        index = page_lower.find(keyword, start)
+        if index != -1:
+            end = index + len(keyword)
+            if keyword_end == -1 or end < keyword_end:
+                keyword_end = end
+    if keyword_end == -1:
+        return False
+    return page_lower.find(f"</{tag}>", keyword_end) != -1
+
+
+def _match_block_structure(page_html: str, page_lower: str) -> Optional[str]:
+    """按原有顺序检查封禁页面的HTML结构特征，返回命中的原因"""
+    for tag, keywords, reason in _BLOCK_HEADING_PATTERNS:
+        if _tag_contains(page_lower, tag, keywords):
+            return reason
+    for pattern, reason in _BLOCK_ATTR_PATTERNS:
+        if pattern.search(page_html):
+            return reason
+    for tag, keywords, reason in _BLOCK_CONTENT_PATTERNS:
+        if _tag_contains(page_lower, tag, keywords):
+            return reason
+    return None
+
 
 def save_blocked_page(
     page_html: str,
@@ -78,69 +264,28 @@ def is_blocked_page(
             save_blocked_page(page_html, url, {"reason": "empty_page"})
         return True
 
-    page_lower = page_html.lower()
-    blocked_reason = None
+    page_lower = _lower_page(page_html)
 
-    # 检查特定的HTML结构 - 这些是真正的封禁页面特征
-    block_patterns = [
-        # 标题中的封禁信息
-        (
-            r"<title[^>]*>.*(?:blocked|forbidden|access denied|403|404).*</title>",
-            "title_blocked",
-        ),
-        # 主要标题中的封禁信息
-        (
-            r"<h1[^>]*>.*(?:blocked|forbidden|access denied|403|404).*</h1>",
-            "h1_blocked",
-        ),
-        # 错误页面类名
-        (
-            r'<div[^>]*class="[^"]*(?:blocked|forbidden|error|not-found)[^"]*"',
-            "error_class",
-        ),
-        (
-            r'<div[^>]*id="[^"]*(?:blocked|forbidden|error|not-found)[^"]*"',
-            "error_id",
-        ),
-        # 特定的封禁页面内容
-        (
-            r"<div[^>]*>.*(?:access denied|access blocked|page not found|"
-            r"403 forbidden|404 not found).*</div>",
-            "error_content",
-        ),
-        # 维护页面
-        (
-            r"<div[^>]*>.*(?:under maintenance|temporarily unavailable|"
-            r"service unavailable).*</div>",
-            "maintenance_page",
-        ),
-    ]
+    # 检查是否有明显的车辆数据 - 如果有，说明不是封禁页面。
+    # 这一结论不依赖后面的封禁检查，先做这几次廉价的子串查找，
+    # 正常车源页面（绝大多数情况）可以跳过全部封禁特征扫描
+    vehicle_count = sum(
+        1
+        for indicator in _BLOCK_PAGE_VEHICLE_INDICATORS
+        if indicator in page_lower
+    )
+    if vehicle_count >= 3:
+        return False
 
-    for pattern, reason in block_patterns:
-        if re.search(pattern, page_html, re.IGNORECASE | re.DOTALL):
-            blocked_reason = reason
-            break
+    # 检查特定的HTML结构 - 这些是真正的封禁页面特征
+    blocked_reason = _match_block_structure(page_html, page_lower)
 
     # 检查页面标题是否包含明显的错误信息
     if not blocked_reason:
-        title_match = re.search(
-            r"<title[^>]*>(.*?)</title>", page_html, re.IGNORECASE | re.DOTALL
-        )
+        title_match = _TITLE_RE.search(page_html)
         if title_match:
             title = title_match.group(1).lower()
-            error_titles = [
-                "access denied",
-                "access blocked",
-                "forbidden",
-                "not found",
-                "page not found",
-                "error 403",
-                "error 404",
-                "temporarily unavailable",
-                "under maintenance",
-                "coming soon",
-            ]
-            for error_title in error_titles:
+            for error_title in _ERROR_TITLES:
                 if error_title in title:
                     blocked_reason = (
                         f'title_error_{error_title.replace(" ", "_")}'
@@ -149,18 +294,7 @@ def is_blocked_page(
 
     # 检查页面内容中是否包含封禁相关的关键词
     if not blocked_reason:
-        block_content_indicators = [
-            "你被封禁了",
-            "访问被拒绝",
-            "请求过于频繁",
-            "请稍后再试",
-            "ip被封禁",
-            "账号被封禁",
-            "访问受限",
-            "需要验证身份",
-        ]
-
-        for indicator in block_content_indicators:
+        for indicator in _BLOCK_CONTENT_INDICATORS:
             if indicator in page_html:
                 blocked_reason = f"content_blocked_{indicator[:10]}"
                 break
@@ -168,29 +302,12 @@ def is_blocked_page(
     # 检查页面内容长度 - 如果页面太短，可能是错误页面
     if not blocked_reason and len(page_html.strip()) < 1000:
         # 检查是否包含基本的HTML结构
-        if not re.search(r"<html[^>]*>", page_html, re.IGNORECASE):
+        if not _HTML_TAG_RE.search(page_html):
             blocked_reason = "short_page_no_html"
         # 检查是否包含基本的页面内容
-        elif not re.search(r"<body[^>]*>", page_html, re.IGNORECASE):
+        elif not _BODY_TAG_RE.search(page_html):
             blocked_reason = "short_page_no_body"
 
-    # 检查是否有明显的车辆数据 - 如果有，说明不是封禁页面
-    vehicle_indicators = [
-        "vehicle",
-        "car",
-        "listing",
-        "price",
-        "mileage",
-        "year",
-        "make",
-        "model",
-    ]
-    vehicle_count = sum(
-        1 for indicator in vehicle_indicators if indicator in page_lower
-    )
-    if vehicle_count >= 3:
-        return False
-
     # 如果检测到封禁，保存页面
     if blocked_reason and save_blocked:
         additional_info = {
@@ -216,56 +333,17 @@ def is_vehicle_available(page_html: str) -> bool:
     if not page_html:
         return False
 
-    page_lower = page_html.lower()
-
-    # 车辆不可用的指示器 - 更精确的检测
-    unavailable_indicators = [
-        "sold",
-        "no longer available",
-        "not available",
-        "removed",
-        "deleted",
-        "expired",
-        "withdrawn",
-        "discontinued",
-        "out of stock",
-        "no longer for sale",
-        "listing removed",
-        "vehicle sold",
-        "no longer listed",
-    ]
+    page_lower = _lower_page(page_html)
 
-    # 检查是否包含不可用指示器（排除CSS和无关内容）
-    for indicator in unavailable_indicators:
-        if indicator in page_lower:
-            # 排除CSS样式中的匹配
-            if not re.search(
-                r"@keyframes.*" + re.escape(indicator),
-                page_html,
-                re.IGNORECASE,
+    # 检查是否包含不可用指示器（排除CSS和无关内容）；
+    # 含版权信息的页面中任何指示器都不算数，可以整段跳过
+    if not _RIGHTS_RESERVED_RE.search(page_html):
+        for indicator in _UNAVAILABLE_INDICATORS:
+            if indicator in page_lower and not any(
+                exclude.search(page_html)
+                for exclude in _UNAVAILABLE_EXCLUDE_RES[indicator]
             ):
-                if not re.search(
-                    r"\." + re.escape(indicator) + r"\s*\{",
-                    page_html,
-                    re.IGNORECASE,
-                ):
-                    # 排除图片占位符中的匹配
-                    if not re.search(
-                        r"placeholder.*" + re.escape(indicator),
-                        page_html,
-                        re.IGNORECASE,
-                    ):
-                        # 排除UI控件中的匹配
-                        if not re.search(
-                            r'data-state="[^"]*' + re.escape(indicator),
-                            page_html,
-                            re.IGNORECASE,
-                        ):
-                            # 排除版权信息中的匹配
-                            if not re.search(
-                                r"rights reserved", page_html, re.IGNORECASE
-                            ):
-                                return False
+                return False
 
     # 检查特定的HTML结构 - 真正的不可用元素
     unavailable_patterns = [
@@ -316,7 +394,7 @@ def detect_page_type(page_html: str) -> str:
     if not page_html:
         return "unknown"
 
-    page_lower = page_html.lower()
+    page_lower = _lower_page(page_html)
 
     # 检测页面类型
     if "search" in page_lower and "results" in page_lower:
@@ -364,7 +442,7 @@ def is_loading_page(page_html: str) -> bool:
     if not page_html:
         return True
 
-    page_lower = page_html.lower()
+    page_lower = _lower_page(page_html)
 
     # 检查页面标题是否包含加载信息
     title_match = re.search(
@@ -486,7 +564,7 @@ def has_vehicle_data(page_html: str) -> bool:
         "warranty",
     ]
 
-    page_lower = page_html.lower()
+    page_lower = _lower_page(page_html)
 
     # 检查是否包含车辆数据指示器
     indicator_count = 0
@@ -560,7 +638,7 @@ def is_search_page(page_html: str) -> bool:
         "refine search",
     ]
 
-    page_lower = page_html.lower()
+    page_lower = _lower_page(page_html)
 
     # 检查是否包含搜索指示器
     indicator_count = 0
@@ -598,7 +676,7 @@ def has_pagination(page_html: str) -> bool:
         "page navigation",
     ]
 
-    page_lower = page_html.lower()
+    page_lower = _lower_page(page_html)
 
     # 检查是否包含分页指示器
     for indicator in pagination_indicators:
@@ -655,7 +733,7 @@ def is_no_results_page(page_html: str) -> bool:
     if not page_html:
         return False
 
-    page_lower = page_html.lower()
+    page_lower = _lower_page(page_html)
 
     # 无结果页面的指示器
     no_results_indicators = [
@@ -5,13 +5,17 @@ URL检查工具 - 检查URL存活状态和有效性
 采用函数式设计，无默认值原则。
 """
 
+import asyncio
 import requests
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from urllib.parse import urlparse
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 
+# 异步存活检查的单次请求超时（秒）
+_ASYNC_CHECK_TIMEOUT = httpx.Timeout(3.0)
 
 
 def check_url_alive_sync(url: str, max_retries: int) -> bool:
@@ -71,6 +75,53 @@ def batch_check_urls(urls: List[str], max_concurrent: int) -> Dict[str, bool]:
     return results
 
 
+async def check_urls_alive(
+    urls: Iterable[str], max_concurrency: int, max_retries: int
+) -> Dict[str, bool]:
+    """
+    并发检查多个URL是否存活（异步版本）
+
+    所有URL共用一个HTTP客户端，先发HEAD请求，服务器不支持HEAD时
+    改用GET；同时进行的请求数不超过 max_concurrency。
+
+    Args:
+        urls: 要检查的URL
+        max_concurrency: 最大并发请求数
+        max_retries: 每个URL的最大重试次数
+
+    Returns:
+        URL存活状态字典
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def check(client: httpx.AsyncClient, url: str) -> bool:
+        if not is_valid_url(url):
+            return False
+        for attempt in range(max_retries):
+            try:
+                async with semaphore:
+                    response = await client.head(url)
+                    if response.status_code == 405:
+                        response = await client.get(url)
+                return response.status_code < 400
+            except httpx.HTTPError:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+        return False
+
+    async with httpx.AsyncClient(
+        timeout=_ASYNC_CHECK_TIMEOUT, follow_redirects=True
+    ) as client:
+        results = await asyncio.gather(
+            *(check(client, url) for url in unique_urls)
+        )
+    return dict(zip(unique_urls, results))
+
+
 def is_valid_url(url: str) -> bool:
     """
     验证URL格式是否有效
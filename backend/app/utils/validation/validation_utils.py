@@ -5,8 +5,21 @@
 采用函数式设计，无默认值原则。
 """
 
+import re
 from typing import Dict, Any
 
+# 下拉框/按钮中的占位选项，不是真实车型或品牌
+_INVALID_MODEL_NAMES = frozenset(
+    ["Any Model", "Select Model", "All Models", "Reset"]
+)
+_INVALID_BRAND_NAMES = frozenset(
+    ["Any Make", "Select Make", "All Makes", "Reset"]
+)
+
+# 预编译的清理正则，避免每次验证重新解析
+_PRICE_NOISE_RE = re.compile(r"[$,]")
+_MILEAGE_NOISE_RE = re.compile(r",| miles| mi")
+
 
 def is_valid_model(model_name: str, model_value: str) -> bool:
     """
@@ -22,8 +35,7 @@ def is_valid_model(model_name: str, model_value: str) -> bool:
     if not model_name or not model_value:
         return False
     
-    invalid_names = ["Any Model", "Select Model", "All Models", "Reset"]
-    return model_name not in invalid_names
+    return model_name not in _INVALID_MODEL_NAMES
 
 
 def is_valid_brand(brand_name: str) -> bool:
@@ -39,8 +51,7 @@ def is_valid_brand(brand_name: str) -> bool:
     if not brand_name:
         return False
     
-    invalid_names = ["Any Make", "Select Make", "All Makes", "Reset"]
-    return brand_name not in invalid_names
+    return brand_name not in _INVALID_BRAND_NAMES
 
 
 def is_valid_year(year: str) -> bool:
@@ -77,7 +88,7 @@ def is_valid_price(price: str) -> bool:
         return False
     
     # 移除货币符号和逗号
-    clean_price = price.replace('$', '').replace(',', '').strip()
+    clean_price = _PRICE_NOISE_RE.sub('', price).strip()
     
     try:
         price_float = float(clean_price)
@@ -100,7 +111,7 @@ def is_valid_mileage(mileage: str) -> bool:
         return False
     
     # 移除逗号和单位
-    clean_mileage = mileage.replace(',', '').replace(' miles', '').replace(' mi', '').strip()
+    clean_mileage = _MILEAGE_NOISE_RE.sub('', mileage).strip()
     
     try:
         mileage_int = int(clean_mileage)
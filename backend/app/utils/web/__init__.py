@@ -1,14 +1,33 @@
 # Web utilities package
 # 网络工具层 - 网络相关操作、浏览器自动化、爬虫工具
 
-from .behavior_simulator_utils import *
-from .browser_utils import BrowserUtils, browser_utils
-from .button_click_utils import *
-from .dead_link_utils import *
-from .driver_utils import *
-from .url_builder_utils import *
+import importlib
+
+from .browser_utils import BrowserUtils, DriverPool, browser_utils
+
+# 其余子模块按需导入（原先的星号导入）：driver_utils 会加载
+# undetected_chromedriver，只有真正用到相关名称时才导入
+_LAZY_MODULES = (
+    "behavior_simulator_utils",
+    "button_click_utils",
+    "dead_link_utils",
+    "driver_utils",
+    "url_builder_utils",
+)
 
 __all__ = [
     "BrowserUtils",
+    "DriverPool",
     "browser_utils",
 ]
+
+
+def __getattr__(name):
+    """PEP 562 延迟导入：依次在子模块中查找名称，找到后缓存到包"""
+    for module_name in _LAZY_MODULES:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
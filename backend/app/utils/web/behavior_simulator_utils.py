@@ -14,6 +14,25 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 
 
+# 随机User-Agent候选列表
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:120.0) Gecko/20100101 Firefox/120.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+)
+
+# 滚动页面并返回视口宽高
+_SCROLL_AND_MEASURE_JS = """
+window.scrollBy(0, arguments[0]);
+return [window.innerWidth, window.innerHeight];
+"""
+
+
 def simulate_human_behavior(driver: WebDriver) -> None:
     """
     模拟人类浏览行为
@@ -21,14 +40,25 @@ def simulate_human_behavior(driver: WebDriver) -> None:
     Args:
         driver: Selenium WebDriver对象
     """
-    # 随机滚动
-    random_scroll(driver, 100, 500)
-
-    # 随机延迟
-    random_delay(0.5, 2.0)
-
-    # 安全的鼠标移动
-    safe_mouse_move(driver)
+    # 随机滚动，同一次脚本调用取回视口大小用于鼠标移动
+    scroll_amount = random.randint(100, 500) * random.choice([1, -1])
+    width, height = driver.execute_script(
+        _SCROLL_AND_MEASURE_JS, scroll_amount
+    )
+
+    # 滚动后的停顿、随机延迟和鼠标移动排成一个动作链，由浏览器端执行，
+    # 只需一次 perform 往返
+    target_x = width // 2 + random.randint(-100, 100)
+    target_y = height // 2 + random.randint(-100, 100)
+    actions = ActionChains(driver)
+    actions.pause(random.uniform(0.1, 0.3))
+    actions.pause(random.uniform(0.5, 2.0))
+    actions.move_by_offset(target_x, target_y)
+    try:
+        actions.perform()
+    except Exception:
+        # 如果鼠标移动失败，忽略错误
+        pass
 
 
 def random_scroll(driver: WebDriver, min_amount: int, max_amount: int) -> None:
@@ -117,19 +147,21 @@ def simulate_typing(driver: WebDriver, element, text: str) -> None:
         element: 输入元素
         text: 要输入的文本
     """
-    # 点击元素获得焦点
-    element.click()
-    random_delay(0.1, 0.3)
-
     # 清空现有内容
     element.clear()
     random_delay(0.1, 0.2)
 
-    # 逐字符输入
+    # 逐字符输入，字符间的随机停顿模拟打字速度；整段输入排成一个
+    # 动作链，停顿由浏览器端执行，只需一次 perform 往返。
+    # clear() 会使元素失去焦点，动作链先点击元素重新获得焦点，
+    # 否则按键会发送到当前活动元素而不是输入框
+    actions = ActionChains(driver)
+    actions.click(element)
+    actions.pause(random.uniform(0.1, 0.3))
     for char in text:
-        element.send_keys(char)
-        # 随机延迟模拟打字速度
-        time.sleep(random.uniform(0.05, 0.15))
+        actions.send_keys(char)
+        actions.pause(random.uniform(0.05, 0.15))
+    actions.perform()
 
 
 def random_user_agent() -> str:
@@ -139,18 +171,7 @@ def random_user_agent() -> str:
     Returns:
         随机的User-Agent字符串
     """
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:120.0) Gecko/20100101 Firefox/120.0",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
-    ]
-
-    return random.choice(user_agents)
+    return random.choice(_USER_AGENTS)
 
 
 def simulate_page_reading(driver: WebDriver, min_time: float = 2.0, max_time: float = 8.0) -> None:
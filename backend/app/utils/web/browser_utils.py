@@ -12,9 +12,14 @@ Chrome浏览器自动化工具类 - 重构版本
 - 提供便捷函数接口保持向后兼容
 """
 
+import asyncio
 import random
+import threading
+import time
 from contextlib import asynccontextmanager
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
 
 from app.utils.business.profile_utils import (
     cleanup_old_profiles as _cleanup_old_profiles,
@@ -23,95 +28,202 @@ from app.utils.core.logger import logger
 from app.utils.validation.page_detection_utils import (
     is_blocked_page as _is_blocked_page,
 )
-from app.utils.validation.url_checker_utils import check_url_alive_sync
+from app.utils.validation.url_checker_utils import (
+    check_url_alive_sync,
+    check_urls_alive as _check_urls_alive,
+)
+from app.utils.web.dead_link_utils import (
+    add_dead_link as _add_dead_link,
+    find_dead_links as _find_dead_links,
+    is_dead_link as _is_dead_link,
+    read_dead_links as _read_dead_links,
+    write_dead_links as _write_dead_links,
+)
 
-# 导入现有的utils模块
-from app.utils.web.driver_utils import (
-    create_standard_driver,
-    create_undetected_driver,
+# User-Agent列表 - 更新为Chrome 140版本
+_USER_AGENTS: Tuple[str, ...] = (
+    (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 "
+        "Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 "
+        "Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
+    ),
+    (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
+    ),
 )
 
+# get_driver 复用的空闲驱动超过该时间（秒）未使用则关闭
+_IDLE_DRIVER_TTL = 300
+# 单个驱动最多使用的次数，超过后关闭重建，避免长期运行的Chrome内存膨胀
+_MAX_USES_PER_DRIVER = 50
+
 
 class BrowserUtils:
     """Chrome浏览器自动化工具类 - 重构版本"""
 
     def __init__(self):
         """初始化浏览器工具类"""
-        # User-Agent列表 - 更新为Chrome 140版本
-        self.user_agents = [
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 "
-                "Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 "
-                "Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
-            ),
-        ]
+        self.user_agents = _USER_AGENTS
+        # (配置文件, 是否反检测) -> 驱动池，get_driver 归还后保持驱动常驻
+        self._pools: Dict[Tuple[str, bool], "DriverPool"] = {}
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
+        # 供同步调用方执行协程的后台事件循环，首次使用时在守护线程中启动
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_loop_lock = threading.Lock()
 
     def get_random_user_agent(self) -> str:
         """获取随机User-Agent"""
-        return random.choice(self.user_agents)
+        return random.choice(_USER_AGENTS)
 
-    @asynccontextmanager
-    async def get_driver(
-        self, profile_name: str, use_undetected: bool = False
-    ):
+    def create_driver(self, profile_name: str, use_undetected: bool = False):
         """
-        获取Chrome驱动 - 上下文管理器
+        创建Chrome驱动，由调用方负责通过 close_driver 关闭
 
         Args:
             profile_name: 配置文件名称
             use_undetected: 是否使用反检测驱动
 
-        Yields:
+        Returns:
             WebDriver: Chrome驱动实例
         """
-        driver = None
+        # 延迟导入：undetected_chromedriver 较重，只在真正创建驱动时加载
+        from app.utils.web.driver_utils import (
+            create_standard_driver,
+            create_undetected_driver,
+        )
+
         try:
             if use_undetected:
                 driver = create_undetected_driver(profile_name)
             else:
                 driver = create_standard_driver(profile_name)
-
-            logger.log_result(
-                f"创建Chrome驱动成功: profile={profile_name}, "
-                f"undetected={use_undetected}"
-            )
-            yield driver
-
         except Exception as e:
             logger.log_result(f"创建Chrome驱动失败: {e}")
             raise
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                    logger.log_result("Chrome驱动已关闭")
-                except Exception as e:
-                    logger.log_result(f"关闭Chrome驱动时出错: {e}")
+
+        logger.log_result(
+            f"创建Chrome驱动成功: profile={profile_name}, "
+            f"undetected={use_undetected}"
+        )
+        return driver
+
+    def close_driver(self, driver) -> None:
+        """
+        关闭Chrome驱动
+
+        Args:
+            driver: Chrome驱动实例
+        """
+        try:
+            driver.quit()
+            logger.log_result("Chrome驱动已关闭")
+        except Exception as e:
+            logger.log_result(f"关闭Chrome驱动时出错: {e}")
+
+    @asynccontextmanager
+    async def get_driver(
+        self, profile_name: str, use_undetected: bool = False
+    ):
+        """
+        获取Chrome驱动 - 上下文管理器
+
+        同一配置文件的驱动在退出时不关闭，而是清除Cookie后留在池中
+        供下次复用，避免每次都冷启动Chrome；空闲超过一定时间后自动关闭。
+
+        Args:
+            profile_name: 配置文件名称
+            use_undetected: 是否使用反检测驱动
+
+        Yields:
+            WebDriver: Chrome驱动实例
+        """
+        key = (profile_name, use_undetected)
+        pool = self._pools.get(key)
+        if pool is None:
+            # 同一配置文件目录不能被多个Chrome同时使用，每个池只有一个驱动
+            pool = DriverPool(profile_name, 1, use_undetected)
+            self._pools[key] = pool
+        self._ensure_reaper()
+
+        async with pool.acquire() as driver:
+            yield driver
+
+    def _ensure_reaper(self) -> None:
+        """启动后台任务，定期关闭空闲过久的驱动"""
+        task = self._reaper_task
+        if task is None or task.done():
+            self._reaper_task = asyncio.create_task(self._reap_idle_drivers())
+
+    async def _reap_idle_drivers(self) -> None:
+        while True:
+            await asyncio.sleep(_IDLE_DRIVER_TTL / 2)
+            for pool in list(self._pools.values()):
+                await pool.trim_idle(_IDLE_DRIVER_TTL)
+
+    async def close_all_drivers(self) -> None:
+        """关闭 get_driver 复用的所有驱动"""
+        task, self._reaper_task = self._reaper_task, None
+        if task is not None:
+            task.cancel()
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            await pool.close()
+
+    def run_blocking(self, coro):
+        """
+        在后台事件循环中执行协程并等待结果，供同步调用方使用
+
+        所有调用共用一个常驻的后台循环，不必每次新建事件循环和线程；
+        后台循环独立于调用方所在的循环，在事件循环内调用也不会冲突
+        （但会阻塞调用方线程）。
+
+        Args:
+            coro: 要执行的协程
+
+        Returns:
+            协程的返回值
+        """
+        with self._bg_loop_lock:
+            loop = self._bg_loop
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="browser-utils-loop",
+                    daemon=True,
+                ).start()
+                self._bg_loop = loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def stop_background_loop(self) -> None:
+        """停止 run_blocking 使用的后台事件循环"""
+        with self._bg_loop_lock:
+            loop, self._bg_loop = self._bg_loop, None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
 
     def cleanup_old_profiles(self, days_old: int = 7) -> None:
         """
@@ -123,11 +235,193 @@ class BrowserUtils:
         _cleanup_old_profiles(days_old)
         logger.log_result(f"清理了{days_old}天前的Chrome配置文件")
 
+    def schedule_profile_cleanup(self, days_old: int = 7) -> asyncio.Task:
+        """
+        在后台线程中清理旧的Chrome配置文件，不阻塞事件循环
+
+        已有清理任务在运行时直接返回该任务，重复触发只清理一次。
+
+        Args:
+            days_old: 清理多少天前的配置文件
+
+        Returns:
+            后台清理任务
+        """
+        task = self._cleanup_task
+        if task is None or task.done():
+            task = asyncio.create_task(
+                asyncio.to_thread(self.cleanup_old_profiles, days_old)
+            )
+            self._cleanup_task = task
+        return task
+
 
 # 创建全局实例
 browser_utils = BrowserUtils()
 
 
+class DriverPool:
+    """
+    Chrome驱动池
+
+    预先创建并复用固定数量的驱动，避免每次爬取都启动新的Chrome进程。
+    每个槽位使用独立的配置文件；驱动归还时清除Cookie并回到空白页，
+    会话失效或使用次数达到上限的驱动会被关闭，下次取用该槽位时重新创建。
+    """
+
+    def __init__(
+        self,
+        profile_prefix: str,
+        size: int,
+        use_undetected: bool = False,
+        max_uses: int = _MAX_USES_PER_DRIVER,
+    ):
+        """
+        初始化驱动池
+
+        Args:
+            profile_prefix: 配置文件名前缀，各槽位追加序号
+            size: 驱动数量上限
+            use_undetected: 是否使用反检测驱动
+            max_uses: 单个驱动的最大使用次数
+        """
+        self.profile_prefix = profile_prefix
+        self.size = size
+        self.use_undetected = use_undetected
+        self.max_uses = max_uses
+        # 槽位序号 -> 当前驱动已被取用的次数
+        self._use_counts: Dict[int, int] = {}
+        # 队列元素为 (槽位序号, 驱动)，驱动为None表示尚未创建或已被丢弃
+        self._slots: asyncio.Queue = asyncio.Queue(maxsize=size)
+        for index in range(size):
+            self._slots.put_nowait((index, None))
+        # 槽位序号 -> 驱动最近一次归还的时间
+        self._last_used: Dict[int, float] = {}
+
+    def _create(self, index: int):
+        # 单驱动的池直接使用前缀作为配置文件名
+        profile_name = (
+            self.profile_prefix
+            if self.size == 1
+            else f"{self.profile_prefix}_pool{index}"
+        )
+        return browser_utils.create_driver(profile_name, self.use_undetected)
+
+    async def start(self) -> None:
+        """并行预热所有槽位的驱动"""
+        slots: List[Tuple[int, Optional[object]]] = []
+        while not self._slots.empty():
+            slots.append(self._slots.get_nowait())
+
+        async def warm(index: int, driver):
+            if driver is None:
+                try:
+                    driver = await asyncio.to_thread(self._create, index)
+                    self._use_counts[index] = 0
+                except Exception:
+                    driver = None
+            self._last_used[index] = time.monotonic()
+            return index, driver
+
+        for slot in await asyncio.gather(
+            *(warm(index, driver) for index, driver in slots)
+        ):
+            self._slots.put_nowait(slot)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        取用一个驱动 - 上下文管理器，退出时自动归还
+
+        Yields:
+            WebDriver: Chrome驱动实例
+        """
+        index, driver = await self._slots.get()
+        try:
+            if driver is None:
+                driver = await asyncio.to_thread(self._create, index)
+                self._use_counts[index] = 0
+            self._use_counts[index] = self._use_counts.get(index, 0) + 1
+            yield driver
+        except WebDriverException:
+            # 会话已失效，丢弃驱动，下次取用时重建
+            stale, driver = driver, None
+            if stale is not None:
+                await asyncio.to_thread(browser_utils.close_driver, stale)
+            raise
+        finally:
+            # 清理和关闭都会同步等待浏览器响应，放到线程中避免阻塞事件循环；
+            # 等待期间被取消也要归还槽位，否则池会永久少一个驱动
+            returned = driver
+            try:
+                if driver is not None and (
+                    self._use_counts.get(index, 0) >= self.max_uses
+                    or not await asyncio.to_thread(self._scrub, driver)
+                ):
+                    returned = None
+                    await asyncio.to_thread(browser_utils.close_driver, driver)
+            finally:
+                self._last_used[index] = time.monotonic()
+                self._slots.put_nowait((index, returned))
+
+    async def trim_idle(self, ttl: float) -> int:
+        """
+        关闭空闲超过 ttl 秒的驱动，槽位保留，下次取用时重建
+
+        Returns:
+            关闭的驱动数量
+        """
+        deadline = time.monotonic() - ttl
+        slots = []
+        while not self._slots.empty():
+            slots.append(self._slots.get_nowait())
+        stale = []
+        for index, driver in slots:
+            if (
+                driver is not None
+                and self._last_used.get(index, 0.0) < deadline
+            ):
+                stale.append(driver)
+                driver = None
+            self._slots.put_nowait((index, driver))
+        # 槽位先归还再关闭驱动，关闭期间不影响其他调用方取用
+        await self._close_drivers(stale)
+        return len(stale)
+
+    @staticmethod
+    def _scrub(driver) -> bool:
+        """清除驱动状态，驱动不可用时返回False"""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            logger.log_result(f"清理Chrome驱动状态失败: {e}")
+            return False
+
+    @staticmethod
+    async def _close_drivers(drivers: List[object]) -> None:
+        """在线程中并行关闭驱动，quit() 会同步等待浏览器进程退出"""
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(browser_utils.close_driver, driver)
+                for driver in drivers
+            )
+        )
+
+    async def close(self) -> None:
+        """关闭池中所有空闲驱动"""
+        slots = []
+        while not self._slots.empty():
+            slots.append(self._slots.get_nowait())
+        drivers = []
+        for index, driver in slots:
+            if driver is not None:
+                drivers.append(driver)
+            self._slots.put_nowait((index, None))
+        await self._close_drivers(drivers)
+
+
 # =============================================================================
 # 便捷函数 - 保持向后兼容
 # =============================================================================
@@ -147,6 +441,54 @@ def check_url_alive(url: str, max_retries: int = 3) -> bool:
     return check_url_alive_sync(url, max_retries)
 
 
+async def check_urls_alive(
+    urls: List[str], max_concurrency: int = 20, max_retries: int = 3
+) -> Dict[str, bool]:
+    """
+    并发检查多个URL是否可访问，批量检查时应优先使用
+
+    已记录的死链一次性从死链缓存中筛出，直接判定为不可访问，
+    只对其余URL发起请求。
+
+    Args:
+        urls: 要检查的URL列表
+        max_concurrency: 最大并发请求数
+        max_retries: 最大重试次数
+
+    Returns:
+        URL存活状态字典
+    """
+    dead_links = _find_dead_links(urls)
+    results = dict.fromkeys(dead_links, False)
+    results.update(
+        await _check_urls_alive(
+            [url for url in urls if url not in dead_links],
+            max_concurrency,
+            max_retries,
+        )
+    )
+    return results
+
+
+def check_urls_alive_sync(
+    urls: List[str], max_concurrency: int = 20, max_retries: int = 3
+) -> Dict[str, bool]:
+    """
+    check_urls_alive 的同步版本，在共用的后台事件循环中执行
+
+    Args:
+        urls: 要检查的URL列表
+        max_concurrency: 最大并发请求数
+        max_retries: 最大重试次数
+
+    Returns:
+        URL存活状态字典
+    """
+    return browser_utils.run_blocking(
+        check_urls_alive(urls, max_concurrency, max_retries)
+    )
+
+
 def is_blocked_page(page_html: str) -> bool:
     """
     检测页面是否被阻止
@@ -172,6 +514,16 @@ def cleanup_old_profiles(days_old: int = 7) -> None:
     browser_utils.cleanup_old_profiles(days_old)
 
 
+async def cleanup_old_profiles_async(days_old: int = 7) -> None:
+    """
+    在后台线程中清理旧的Chrome配置文件，供异步代码调用
+
+    Args:
+        days_old: 清理多少天前的配置文件
+    """
+    await browser_utils.schedule_profile_cleanup(days_old)
+
+
 def get_random_user_agent() -> str:
     """
     获取随机User-Agent
@@ -194,10 +546,6 @@ def write_dead_links_list(dead_links: List[str]) -> None:
     Args:
         dead_links: 死链列表
     """
-    from app.utils.web.dead_link_utils import (
-        write_dead_links as _write_dead_links,
-    )
-
     _write_dead_links(dead_links)
 
 
@@ -208,10 +556,6 @@ def read_dead_links_set() -> set:
     Returns:
         死链集合
     """
-    from app.utils.web.dead_link_utils import (
-        read_dead_links as _read_dead_links,
-    )
-
     return _read_dead_links()
 
 
@@ -225,8 +569,6 @@ def is_dead_link(url: str) -> bool:
     Returns:
         是否为死链
     """
-    from app.utils.web.dead_link_utils import is_dead_link as _is_dead_link
-
     return _is_dead_link(url)
 
 
@@ -237,6 +579,4 @@ def add_dead_link(url: str) -> None:
     Args:
         url: 要添加的死链URL
     """
-    from app.utils.web.dead_link_utils import add_dead_link as _add_dead_link
-
     _add_dead_link(url)
@@ -9,12 +9,15 @@
 5. 异常处理和日志记录
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 from app.utils.business.selector_utils import CarGurusSelectors, SelectorType
 from app.utils.core.logger import get_logger
@@ -25,6 +28,37 @@ from app.utils.web.behavior_simulator_utils import (
 
 logger = get_logger(__name__)
 
+# 一次浏览器调用完成所有选择器的查找、文本筛选和可见性判断，
+# 返回每个有可见匹配元素的选择器的 [选择器下标, 元素]
+_FIND_VISIBLE_BUTTONS_JS = """
+const selectors = arguments[0];
+const text = arguments[1] ? arguments[1].toLowerCase() : null;
+const hits = [];
+selectors.forEach((selector, index) => {
+    let result;
+    try {
+        result = document.evaluate(
+            selector, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    } catch (e) {
+        return;
+    }
+    for (let i = 0; i < result.snapshotLength; i++) {
+        const el = result.snapshotItem(i);
+        if (text && !(el.innerText || '').toLowerCase().includes(text)) {
+            continue;
+        }
+        const visible = el.getClientRects().length > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+        if (visible && !el.disabled) {
+            hits.push([index, el]);
+            break;
+        }
+    }
+});
+return hits;
+"""
+
 
 class ButtonClickStrategy:
     """按钮点击策略枚举"""
@@ -80,45 +114,24 @@ class ButtonClickUtils:
         """
         timeout = timeout or self.default_timeout
 
+        # 等待任一选择器出现在DOM中，页面加载快时无需固定等待
+        self._wait_for_any_selector(selectors, timeout)
+
         for attempt in range(self.max_retries):
             try:
-                # 尝试每个选择器（按优先级排序）
+                # 一次调用找出各选择器的首个可见元素（按优先级排序）
+                hits = self._find_visible_buttons(selectors, button_text)
+                matched = {index for index, _ in hits}
                 for i, selector in enumerate(selectors):
-                    try:
-                        # 查找元素
-                        elements = self.driver.find_elements(
-                            By.XPATH, selector
+                    if i not in matched:
+                        # 记录选择器失败
+                        CarGurusSelectors.update_selector_success(
+                            selector, False
                         )
 
-                        if not elements:
-                            # 记录选择器失败
-                            CarGurusSelectors.update_selector_success(
-                                selector, False
-                            )
-                            continue
-
-                        # 如果指定了按钮文本，进一步筛选
-                        if button_text:
-                            elements = [
-                                elem
-                                for elem in elements
-                                if button_text.lower() in elem.text.lower()
-                            ]
-
-                        if not elements:
-                            CarGurusSelectors.update_selector_success(
-                                selector, False
-                            )
-                            continue
-
-                        # 选择第一个可见元素
-                        element = self._get_first_visible_element(elements)
-                        if not element:
-                            CarGurusSelectors.update_selector_success(
-                                selector, False
-                            )
-                            continue
-
+                for i, element in hits:
+                    selector = selectors[i]
+                    try:
                         # 执行点击
                         result = self._execute_click(element, strategy)
                         if result.success:
@@ -144,16 +157,16 @@ class ButtonClickUtils:
                         )
                         continue
 
-                # 如果所有选择器都失败，等待后重试
+                # 如果所有选择器都失败，短暂随机等待后重试
                 if attempt < self.max_retries - 1:
-                    random_delay(1, 2)
+                    random_delay(0.1, 0.3)
 
             except Exception as e:
                 logger.log_result(
                     f"点击按钮第 {attempt + 1} 次尝试失败: {str(e)}"
                 )
                 if attempt < self.max_retries - 1:
-                    random_delay(1, 2)
+                    random_delay(0.1, 0.3)
 
         return ButtonClickResult(
             success=False,
@@ -251,25 +264,55 @@ class ButtonClickUtils:
         )
         return self.click_button_by_selectors(selectors, strategy=strategy)
 
-    def _get_first_visible_element(
-        self, elements: List[WebElement]
-    ) -> Optional[WebElement]:
+    def _wait_for_any_selector(
+        self, selectors: List[str], timeout: int
+    ) -> bool:
         """
-        获取第一个可见元素
+        等待任一选择器匹配的元素出现
 
         Args:
-            elements: 元素列表
+            selectors: 选择器列表
+            timeout: 超时时间
 
         Returns:
-            第一个可见元素，如果没有则返回None
+            是否在超时前出现
         """
-        for element in elements:
-            try:
-                if element.is_displayed() and element.is_enabled():
-                    return element
-            except Exception:
-                continue
-        return None
+        if not selectors:
+            return False
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(
+                    (
+                        By.XPATH,
+                        CarGurusSelectors.get_union_xpath(tuple(selectors)),
+                    )
+                )
+            )
+            return True
+        except TimeoutException:
+            logger.log_result(f"等待按钮出现超时: {timeout}秒")
+            return False
+
+    def _find_visible_buttons(
+        self, selectors: List[str], button_text: Optional[str] = None
+    ) -> List[Tuple[int, WebElement]]:
+        """
+        查找每个选择器匹配的首个可见按钮
+
+        逐个调用 find_elements 再检查文本和可见性，每一步都是一次
+        WebDriver往返；这里用一段脚本在浏览器内一次性完成。
+
+        Args:
+            selectors: 选择器列表
+            button_text: 按钮文本（可选）
+
+        Returns:
+            (选择器下标, 元素) 列表，按选择器顺序排列
+        """
+        hits = self.driver.execute_script(
+            _FIND_VISIBLE_BUTTONS_JS, list(selectors), button_text
+        )
+        return [(int(index), element) for index, element in hits or []]
 
     def _execute_click(
         self, element: WebElement, strategy: str
@@ -403,10 +446,13 @@ class ButtonClickUtils:
             """,
                 element,
             )
-            random_delay(1.0, 2.0)
+            # 等待平滑滚动结束、元素可点击，只保留少量随机延迟
+            WebDriverWait(self.driver, self.default_timeout).until(
+                EC.element_to_be_clickable(element)
+            )
 
             # 使用模拟点击
-            simulate_click_with_delay(self.driver, element, 0.5, 1.0)
+            simulate_click_with_delay(self.driver, element, 0.1, 0.3)
 
             return ButtonClickResult(
                 success=True,
@@ -478,30 +524,15 @@ class ButtonClickUtils:
         # 只使用前几个选择器
         limited_selectors = selectors[:max_selectors]
 
-        for i, selector in enumerate(limited_selectors):
-            try:
-                # 查找元素
-                elements = self.driver.find_elements(By.XPATH, selector)
-
-                if not elements:
-                    continue
-
-                # 如果指定了按钮文本，进一步筛选
-                if button_text:
-                    elements = [
-                        elem
-                        for elem in elements
-                        if button_text.lower() in elem.text.lower()
-                    ]
-
-                if not elements:
-                    continue
-
-                # 选择第一个可见元素
-                element = self._get_first_visible_element(elements)
-                if not element:
-                    continue
+        try:
+            hits = self._find_visible_buttons(limited_selectors, button_text)
+        except Exception as e:
+            logger.log_result(f"快速查找按钮失败: {str(e)}")
+            hits = []
 
+        for i, element in hits:
+            selector = limited_selectors[i]
+            try:
                 # 执行点击
                 result = self._execute_click(
                     element, ButtonClickStrategy.DIRECT
@@ -6,56 +6,197 @@
 """
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import List, Set, Dict, Any
+from typing import Iterable, List, Optional, Set, Dict, Any
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+
+import orjson
+
 from app.utils.core.path_util import get_data_dir
 
+# 死链记录文件：每行一个JSON字符串，新增死链只追加写入，不重写整个文件
+_DEAD_LINKS_FILENAME = "dead_links.jsonl"
+# 旧版整体重写的JSON文件，首次加载时迁移到追加式文件
+_LEGACY_DEAD_LINKS_FILENAME = "dead_links.json"
 
-def write_dead_links(dead_links: List[str]) -> None:
+# 进程内的死链集合，按文件修改时间（st_mtime_ns）校验：
+# 文件未变化时直接复用，其他进程改写文件后下一次读取时重新加载
+_dead_links_cache: Optional[Set[str]] = None
+_dead_links_mtime: Optional[int] = None
+_dead_links_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def canonical_url(url: str) -> str:
     """
-    写入死链列表
+    死链集合使用的规范化URL
+
+    去掉 utm_* 跟踪参数和片段、其余查询参数排序、协议和域名转小写、
+    去掉路径末尾的斜杠，只有这些差别的URL视为同一个链接。
 
     Args:
-        dead_links: 死链列表
+        url: 原始URL
+
+    Returns:
+        规范化后的URL；无法解析时原样返回
     """
-    data_dir = get_data_dir()
-    dead_links_file = data_dir / "dead_links.json"
+    try:
+        parts = urlsplit(url)
+        query = sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.startswith("utm_")
+        )
+    except ValueError:
+        return url
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        "",
+    ))
+
+
+def _dead_links_path() -> Path:
+    """获取死链记录文件路径"""
+    return get_data_dir() / _DEAD_LINKS_FILENAME
+
+
+def _dead_links_file_mtime() -> Optional[int]:
+    """获取死链文件的修改时间（纳秒），文件不存在时返回None"""
+    try:
+        return _dead_links_path().stat().st_mtime_ns
+    except OSError:
+        return None
 
-    # 确保数据目录存在
-    data_dir.mkdir(parents=True, exist_ok=True)
 
-    # 构建保存数据
-    save_data = {
-        "timestamp": datetime.now().isoformat(),
-        "count": len(dead_links),
-        "dead_links": dead_links
-    }
+def _encode_dead_links(dead_links: Iterable[str]) -> bytes:
+    """把死链编码为JSON行"""
+    return b"".join(orjson.dumps(url) + b"\n" for url in dead_links)
 
-    # 写入文件
-    with open(dead_links_file, 'w', encoding='utf-8') as f:
-        json.dump(save_data, f, ensure_ascii=False, indent=2)
 
+def _rewrite_dead_links_file(dead_links: Iterable[str]) -> None:
+    """用给定的死链整体重写死链文件（先写临时文件再替换）"""
+    dead_links_file = _dead_links_path()
+    dead_links_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = dead_links_file.with_suffix(".jsonl.tmp")
+    tmp_file.write_bytes(_encode_dead_links(dead_links))
+    os.replace(tmp_file, dead_links_file)
 
-def read_dead_links() -> Set[str]:
+
+def _load_legacy_dead_links_file() -> Set[str]:
+    """读取旧版JSON死链文件"""
+    legacy_file = get_data_dir() / _LEGACY_DEAD_LINKS_FILENAME
+    try:
+        data = orjson.loads(legacy_file.read_bytes())
+        return set(data.get("dead_links", []))
+    except (orjson.JSONDecodeError, KeyError, FileNotFoundError):
+        return set()
+
+
+def _load_dead_links_file() -> Set[str]:
+    """从死链文件读取死链集合，旧版JSON文件存在时顺带迁移"""
+    dead_links_file = _dead_links_path()
+
+    if not dead_links_file.exists():
+        dead_links = {
+            canonical_url(url) for url in _load_legacy_dead_links_file()
+        }
+        if dead_links:
+            _rewrite_dead_links_file(dead_links)
+        return dead_links
+
+    dead_links = set()
+    with open(dead_links_file, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                dead_links.add(canonical_url(orjson.loads(line)))
+            except orjson.JSONDecodeError:
+                # 写入中断留下的半行，跳过
+                continue
+    return dead_links
+
+
+def _cached_dead_links() -> Set[str]:
     """
-    读取死链列表
+    获取进程内缓存的死链集合，只在文件修改时间变化时重新读取文件
+
+    返回的集合由缓存持有，调用方只能读取，不能修改
+    """
+    global _dead_links_cache, _dead_links_mtime
+    mtime = _dead_links_file_mtime()
+    with _dead_links_lock:
+        if _dead_links_cache is None or mtime != _dead_links_mtime:
+            _dead_links_cache = _load_dead_links_file()
+            _dead_links_mtime = mtime
+        return _dead_links_cache
+
+
+def _append_dead_links(urls: Iterable[str]) -> None:
+    """把尚未记录的死链追加到文件末尾，并同步更新进程内缓存"""
+    global _dead_links_mtime
+    _cached_dead_links()
+    with _dead_links_lock:
+        dead_links = _dead_links_cache
+        new_links = [
+            url
+            for url in dict.fromkeys(canonical_url(url) for url in urls if url)
+            if url not in dead_links
+        ]
+        if not new_links:
+            return
+
+        dead_links_file = _dead_links_path()
+        dead_links_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(dead_links_file, 'ab') as f:
+            f.write(_encode_dead_links(new_links))
+
+        dead_links.update(new_links)
+        _dead_links_mtime = _dead_links_file_mtime()
+
+
+def preload_dead_links() -> int:
+    """
+    预先加载死链集合到进程内缓存，避免第一次检查时才读取文件
 
     Returns:
-        死链集合
+        死链数量
     """
-    data_dir = get_data_dir()
-    dead_links_file = data_dir / "dead_links.json"
+    return len(_cached_dead_links())
 
-    if not dead_links_file.exists():
-        return set()
 
-    try:
-        with open(dead_links_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return set(data.get("dead_links", []))
-    except (json.JSONDecodeError, KeyError, FileNotFoundError):
-        return set()
+def write_dead_links(dead_links: List[str]) -> None:
+    """
+    写入死链列表（整体重写文件，新增死链请使用 add_dead_link）
+
+    Args:
+        dead_links: 死链列表
+    """
+    global _dead_links_cache, _dead_links_mtime
+    canonical_links = dict.fromkeys(canonical_url(url) for url in dead_links)
+    with _dead_links_lock:
+        _rewrite_dead_links_file(canonical_links)
+        # 记下本次写入后的修改时间，后续读取无需重新解析文件
+        _dead_links_cache = set(canonical_links)
+        _dead_links_mtime = _dead_links_file_mtime()
+
+
+def read_dead_links() -> Set[str]:
+    """
+    读取死链列表
+
+    Returns:
+        死链集合（规范化URL，副本，可自由修改）
+    """
+    return set(_cached_dead_links())
 
 
 def add_dead_link(url: str) -> None:
@@ -65,17 +206,11 @@ def add_dead_link(url: str) -> None:
     Args:
         url: 要添加的死链
     """
-    if not url:
+    if not url or canonical_url(url) in _cached_dead_links():
         return
 
-    # 读取现有死链
-    dead_links = read_dead_links()
-
-    # 添加新死链
-    dead_links.add(url)
-
-    # 写回文件
-    write_dead_links(list(dead_links))
+    # 只追加新死链，不重写整个文件
+    _append_dead_links([url])
 
 
 def remove_dead_link(url: str) -> None:
@@ -92,7 +227,7 @@ def remove_dead_link(url: str) -> None:
     dead_links = read_dead_links()
 
     # 移除死链
-    dead_links.discard(url)
+    dead_links.discard(canonical_url(url))
 
     # 写回文件
     write_dead_links(list(dead_links))
@@ -111,8 +246,21 @@ def is_dead_link(url: str) -> bool:
     if not url:
         return True
 
-    dead_links = read_dead_links()
-    return url in dead_links
+    return canonical_url(url) in _cached_dead_links()
+
+
+def find_dead_links(urls: Iterable[str]) -> Set[str]:
+    """
+    批量检查死链，直接在进程内缓存的死链集合中查找
+
+    Args:
+        urls: 要检查的URL
+
+    Returns:
+        其中属于死链的URL集合
+    """
+    dead_links = _cached_dead_links()
+    return {url for url in urls if canonical_url(url) in dead_links}
 
 
 def add_dead_links_batch(urls: List[str]) -> None:
@@ -125,16 +273,8 @@ def add_dead_links_batch(urls: List[str]) -> None:
     if not urls:
         return
 
-    # 读取现有死链
-    dead_links = read_dead_links()
-
-    # 添加新死链
-    for url in urls:
-        if url:
-            dead_links.add(url)
-
-    # 写回文件
-    write_dead_links(list(dead_links))
+    # 只追加新死链，不重写整个文件
+    _append_dead_links(urls)
 
 
 def remove_dead_links_batch(urls: List[str]) -> None:
@@ -153,7 +293,7 @@ def remove_dead_links_batch(urls: List[str]) -> None:
     # 移除死链
     for url in urls:
         if url:
-            dead_links.discard(url)
+            dead_links.discard(canonical_url(url))
 
     # 写回文件
     write_dead_links(list(dead_links))
@@ -166,8 +306,7 @@ def get_dead_links_count() -> int:
     Returns:
         死链数量
     """
-    dead_links = read_dead_links()
-    return len(dead_links)
+    return len(_cached_dead_links())
 
 
 def get_dead_links_list() -> List[str]:
@@ -201,8 +340,11 @@ def filter_dead_links_from_list(urls: List[str]) -> List[str]:
     if not urls:
         return []
 
-    dead_links = read_dead_links()
-    return [url for url in urls if url and url not in dead_links]
+    dead_links = _cached_dead_links()
+    return [
+        url for url in urls
+        if url and canonical_url(url) not in dead_links
+    ]
 
 
 def get_dead_links_by_domain(domain: str) -> List[str]:
@@ -223,7 +365,6 @@ def get_dead_links_by_domain(domain: str) -> List[str]:
 
     for url in dead_links:
         try:
-            from urllib.parse import urlparse
             parsed_url = urlparse(url)
             if parsed_url.netloc == domain:
                 domain_dead_links.append(url)
@@ -246,15 +387,13 @@ def get_dead_links_statistics() -> Dict[str, Any]:
     domain_count = {}
     for url in dead_links:
         try:
-            from urllib.parse import urlparse
             domain = urlparse(url).netloc
             domain_count[domain] = domain_count.get(domain, 0) + 1
         except Exception:
             continue
 
     # 获取文件信息
-    data_dir = get_data_dir()
-    dead_links_file = data_dir / "dead_links.json"
+    dead_links_file = _dead_links_path()
 
     file_size = 0
     last_modified = None
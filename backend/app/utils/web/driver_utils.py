@@ -7,17 +7,59 @@
 
 import re
 import subprocess
+import time
+from functools import lru_cache
 from typing import Optional
 
 import undetected_chromedriver as uc
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
-
+from app.utils.core.path_util import get_chrome_profiles_dir
+
+# 标准驱动的固定启动参数
+_STANDARD_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+)
+
+# 反检测驱动的固定启动参数，只有用户代理和配置文件目录随驱动变化
+_UC_CHROME_ARGS = _STANDARD_CHROME_ARGS + (
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    # 反检测配置
+    "--disable-infobars",
+    "--disable-notifications",
+    "--disable-popup-blocking",
+    "--disable-translate",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    # 窗口大小
+    "--window-size=1920,1080",
+)
+
+# 内容设置偏好，创建驱动时只读取，不会被修改
+_CHROME_PREFS = {
+    "profile.default_content_setting_values": {
+        "notifications": 2,
+        "geolocation": 2,
+        "media_stream": 2,
+    },
+    "profile.managed_default_content_settings": {"images": 1},
+}
+
+
+@lru_cache(maxsize=1)
 def get_chrome_version() -> str:
     """
     获取当前安装的Chrome版本
 
+    查询注册表需要启动子进程，结果在进程内缓存，创建驱动时不再重复查询。
+
     Returns:
         Chrome版本号，如 "140.0.7339.208"
     """
@@ -140,9 +182,8 @@ def create_standard_driver(profile_name: Optional[str]) -> webdriver.Chrome:
     options = Options()
 
     # 基础配置
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
+    for argument in _STANDARD_CHROME_ARGS:
+        options.add_argument(argument)
     # 设置实验性选项 - Chrome 140+兼容
     try:
         options.add_experimental_option(
@@ -183,125 +224,89 @@ def create_chrome_options(profile_name: str) -> uc.ChromeOptions:
     """
     options = uc.ChromeOptions()
 
-    # 基础配置 - Chrome 140兼容
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-web-security")
-    options.add_argument("--allow-running-insecure-content")
-
-    # 反检测配置
-    options.add_argument("--disable-infobars")
-    options.add_argument("--disable-notifications")
-    options.add_argument("--disable-popup-blocking")
-    options.add_argument("--disable-translate")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
+    # 固定参数 - Chrome 140兼容
+    for argument in _UC_CHROME_ARGS:
+        options.add_argument(argument)
 
     # 设置用户代理 - 动态匹配当前Chrome版本
     user_agent = get_matching_user_agent()
     options.add_argument(f"--user-agent={user_agent}")
 
-    # 设置窗口大小
-    options.add_argument("--window-size=1920,1080")
-
     # 设置配置文件
     profile_path = get_profile_path(profile_name)
     options.add_argument(f"--user-data-dir={profile_path}")
 
     # 简化的实验性选项 - Chrome 140兼容
-    prefs = {
-        "profile.default_content_setting_values": {
-            "notifications": 2,
-            "geolocation": 2,
-            "media_stream": 2,
-        },
-        "profile.managed_default_content_settings": {"images": 1},
-    }
-    options.add_experimental_option("prefs", prefs)
+    options.add_experimental_option("prefs", _CHROME_PREFS)
 
     return options
 
 
-def inject_stealth_scripts(driver: webdriver.Chrome) -> None:
-    """
-    注入反检测脚本 - 增强版本
-
-    Args:
-        driver: Chrome WebDriver对象
-    """
-    # 获取当前Chrome版本
-    chrome_version = get_chrome_version()
-    major_version = chrome_version.split(".")[0]
-    # 隐藏webdriver属性 - 使用更安全的方式
-    try:
-        driver.execute_script(
-            """
-            if (navigator.webdriver !== undefined) {
-                delete navigator.webdriver;
-            }
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-                configurable: true
-            });
-        """
-        )
-    except Exception:
-        # 如果重定义失败，尝试删除属性
-        try:
-            driver.execute_script("delete navigator.webdriver;")
-        except Exception:
-            pass  # 忽略错误，继续执行
-
-    # 修改navigator属性
-    driver.execute_script(
-        """
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en']
+# 注入到当前页面的反检测脚本（原先分7次 execute_script 执行），
+# 合并为一段脚本，创建驱动时只需一次往返。原先在Python中捕获异常的
+# 部分改为脚本内 try/catch，其余部分出错时同样中止并抛出异常
+_STEALTH_BASE_JS = """
+    // 隐藏webdriver属性 - 使用更安全的方式
+    try {
+        if (navigator.webdriver !== undefined) {
+            delete navigator.webdriver;
+        }
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined,
+            configurable: true
         });
-    """
-    )
+    } catch (e) {
+        // 如果重定义失败，尝试删除属性
+        try {
+            delete navigator.webdriver;
+        } catch (e2) {
+            // 忽略错误，继续执行
+        }
+    }
 
-    driver.execute_script(
-        """
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5]
-        });
-    """
-    )
+    // 修改navigator属性
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // 修改chrome属性 - 安全版本
+    try {
+        if (window.chrome === undefined) {
+            window.chrome = {
+                runtime: {}
+            };
+        }
+    } catch (e) {
+        // 如果chrome属性已存在，忽略错误
+    }
 
-    # 修改chrome属性 - 安全版本
-    try:
-        driver.execute_script(
-            """
-            if (window.chrome === undefined) {
-                window.chrome = {
-                    runtime: {}
-                };
-            }
-        """
-        )
-    except Exception:
-        # 如果chrome属性已存在，忽略错误
-        pass
+    // 修改permissions属性
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
 
-    # 修改permissions属性
-    driver.execute_script(
-        """
-        const originalQuery = window.navigator.permissions.query;
-        window.navigator.permissions.query = (parameters) => (
-            parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-        );
+
+@lru_cache(maxsize=None)
+def _build_stealth_script(major_version: str) -> str:
     """
-    )
+    生成完整的反检测脚本，按Chrome主版本号缓存
 
+    Args:
+        major_version: Chrome主版本号
+
+    Returns:
+        反检测脚本
+    """
     # 增强反检测脚本
-    stealth_script = f"""
+    return _STEALTH_BASE_JS + f"""
         // 隐藏自动化相关属性
         Object.defineProperty(navigator, 'webdriver', {{
             get: () => undefined,
@@ -381,7 +386,18 @@ def inject_stealth_scripts(driver: webdriver.Chrome) -> None:
         }};
     """
 
-    driver.execute_script(stealth_script)
+
+def inject_stealth_scripts(driver: webdriver.Chrome) -> None:
+    """
+    注入反检测脚本 - 增强版本
+
+    Args:
+        driver: Chrome WebDriver对象
+    """
+    # 获取当前Chrome版本
+    chrome_version = get_chrome_version()
+    major_version = chrome_version.split(".")[0]
+    driver.execute_script(_build_stealth_script(major_version))
 
 
 def get_profile_path(profile_name: str) -> str:
@@ -394,10 +410,6 @@ def get_profile_path(profile_name: str) -> str:
     Returns:
         配置文件路径
     """
-    import time
-
-    from app.utils.core.path_util import get_chrome_profiles_dir
-
     profiles_dir = get_chrome_profiles_dir()
     # 添加时间戳确保唯一性
     unique_profile_name = f"{profile_name}_{int(time.time())}"
@@ -13,6 +13,8 @@ URL构建工具 - 统一构建各种汽车网站的URL
 
 import re
 import uuid
+from functools import lru_cache
+from hashlib import blake2b
 from typing import Optional
 from urllib.parse import quote, urlencode
 
@@ -36,6 +38,40 @@ def build_cargurus_search_url(
     工具层应该是纯函数，不依赖任何外部服务。
     配置数据由调用方（服务层）提供。
     """
+    search_url = _build_cargurus_search_url_base(
+        make,
+        model,
+        zip_code,
+        distance,
+        year_min,
+        year_max,
+        price_min,
+        price_max,
+        mileage_max,
+        make_code,
+        model_code,
+    )
+
+    # 动态生成searchId，避免反爬虫检测（每次调用都生成新的，不参与缓存）
+    search_id = str(uuid.uuid4())
+    return f"{search_url}&{urlencode([('searchId', search_id)])}"
+
+
+@lru_cache(maxsize=1024)
+def _build_cargurus_search_url_base(
+    make: str,
+    model: str,
+    zip_code: str,
+    distance: int,
+    year_min: Optional[int],
+    year_max: Optional[int],
+    price_min: Optional[int],
+    price_max: Optional[int],
+    mileage_max: Optional[int],
+    make_code: Optional[str],
+    model_code: Optional[str],
+) -> str:
+    """构建不含searchId的CarGurus搜索URL，按参数缓存"""
     base_url = (
         "https://www.cargurus.ca/Cars/inventorylisting/"
         "viewDetailsFilterViewInventoryListing.action"
@@ -89,10 +125,6 @@ def build_cargurus_search_url(
     if mileage_max is not None:
         param_list.append(("maxMileage", int(mileage_max)))
 
-    # 动态生成searchId，避免反爬虫检测
-    search_id = str(uuid.uuid4())
-    param_list.append(("searchId", search_id))
-
     return f"{base_url}?{urlencode(param_list)}"
 
 
@@ -167,6 +199,17 @@ def build_cargurus_listing_url(listing_id: str) -> str:
     return f"https://www.cargurus.ca/Cars/link/{listing_id}"
 
 
+def generate_listing_id(url: str, prefix: str) -> str:
+    """
+    根据车源URL生成稳定的车源ID
+
+    使用blake2b摘要而不是内置hash()，后者受PYTHONHASHSEED影响，
+    不同进程生成的ID不一致，无法用于跨进程去重。
+    """
+    digest = blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{prefix}_{digest}"
+
+
 def extract_listing_id_from_url(url: str) -> Optional[str]:
     """从URL中提取车源ID"""
     # CarGurus URL模式
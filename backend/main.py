@@ -1,9 +1,14 @@
+import asyncio
 import os
 
 import uvicorn
 from app.api.routes import router
 from app.api.websocket import router as websocket_router
+from app.services.core.search_service import get_search_service
+from app.services.external.location.ip_to_zip_service import ip_to_zip_service
 from app.utils.core.config import Config
+from app.utils.web.browser_utils import browser_utils
+from app.utils.web.dead_link_utils import preload_dead_links
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -38,6 +43,26 @@ app.include_router(router, prefix="/api")
 app.include_router(websocket_router, prefix="/api")
 
 
+@app.on_event("startup")
+async def startup():
+    """应用启动时加载死链集合，并在后台预热IP定位API连接、清理旧的Chrome配置文件"""
+    browser_utils.schedule_profile_cleanup()
+    # 预热请求第三方主机，网络慢时不应拖慢启动，放到后台执行
+    ip_to_zip_service.schedule_warmup()
+    await asyncio.to_thread(preload_dead_links)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """应用关闭时释放共享的HTTP连接池、搜索服务和复用的Chrome驱动"""
+    await ip_to_zip_service.close()
+    # 搜索服务尚未创建时无需关闭，避免为关闭而初始化
+    if get_search_service.cache_info().currsize:
+        await get_search_service().aclose()
+    await browser_utils.close_all_drivers()
+    browser_utils.stop_background_loop()
+
+
 @app.get("/")
 async def root():
     return {"message": "Rehui Car Adviser API is running"}